@@ -13,7 +13,7 @@ from uuid import uuid4
 from app.agents.orchestrator import build_agent_orchestrator
 from app.core.db_limits import DB_DEFAULT_RESULT_ROWS
 from app.core.settings import AppSettings
-from app.db.duckdb_service import DuckDBService
+from app.db.duckdb_service import KOMMUNE_NORM_COLUMN, DuckDBService
 from app.mcp_server import DuckDBMCPClient
 from app.utils.dataframe import extract_kartverket_kommune_name
 
@@ -79,6 +79,7 @@ class AgentsService:
             allow_write=self.settings.duckdb_allow_write,
         )
         self.mcp_client = DuckDBMCPClient()
+        self._kommune_expr_cache: str | None = None
 
     async def startup(self) -> None:
         """Initialize long-lived service resources."""
@@ -198,6 +199,33 @@ class AgentsService:
     def _normalized_kommune_expr(column_ref: str) -> str:
         return f"lower(trim(replace(replace({column_ref}, ' Kommune', ''), ' kommune', '')))"
 
+    def _kommune_column_expr(self) -> str:
+        """Return the kommune filter expression, preferring the materialized column.
+
+        When the loader has materialized `kommune_norm`, equality filters on it
+        are index/zone-map prunable; otherwise fall back to per-row
+        normalization of the raw `kommune` column.
+        """
+        if self._kommune_expr_cache is None:
+            expr = self._normalized_kommune_expr("kommune")
+            try:
+                result = self.duckdb.query(
+                    sql="""
+                    SELECT COUNT(*)
+                    FROM information_schema.columns
+                    WHERE table_schema = 'main' AND table_name = 'properties' AND column_name = ?
+                    """,
+                    params=[KOMMUNE_NORM_COLUMN],
+                    limit=1,
+                )
+                rows = result.get("rows") or []
+                if rows and rows[0][0]:
+                    expr = KOMMUNE_NORM_COLUMN
+            except Exception:  # pragma: no cover - depends on local DB state
+                pass
+            self._kommune_expr_cache = expr
+        return self._kommune_expr_cache
+
     @staticmethod
     def _rows_to_objects(result: dict[str, Any]) -> list[dict[str, Any]]:
         """Convert DuckDB result payload rows to list-of-dicts."""
@@ -208,7 +236,7 @@ class AgentsService:
 
         out: list[dict[str, Any]] = []
         for row in rows:
-            if not isinstance(row, list):
+            if not isinstance(row, (list, tuple)):
                 continue
             out.append({str(columns[idx]): row[idx] for idx in range(min(len(columns), len(row)))})
         return out
@@ -317,7 +345,7 @@ class AgentsService:
         if limit < 1 or limit > 500:
             raise ValueError("limit must be in range [1, 500].")
 
-        kommune_expr = self._normalized_kommune_expr("kommune")
+        kommune_expr = self._kommune_column_expr()
         param_expr = self._normalized_kommune_expr("?")
         sql = f"""
         WITH grouped AS (
@@ -350,7 +378,7 @@ class AgentsService:
         if not normalized:
             raise ValueError("kommune_name is required.")
 
-        kommune_expr = self._normalized_kommune_expr("kommune")
+        kommune_expr = self._kommune_column_expr()
         param_expr = self._normalized_kommune_expr("?")
         sql = f"""
         SELECT
@@ -391,7 +419,7 @@ class AgentsService:
         return round(cls._to_float(value), digits)
 
     def _build_underwriting_insights(self, kommune_label: str) -> dict[str, Any]:
-        kommune_expr = self._normalized_kommune_expr("kommune")
+        kommune_expr = self._kommune_column_expr()
         param_expr = self._normalized_kommune_expr("?")
         params = [kommune_label]
 
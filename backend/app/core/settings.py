@@ -43,6 +43,17 @@ def _env_bool(name: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    """Parse an integer environment variable."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw.strip())
+    except ValueError:
+        return default
+
+
 def _default_duckdb_path() -> str:
     """Return default DuckDB path inside the agents project."""
     project_root = Path(__file__).resolve().parents[3]
@@ -60,6 +71,7 @@ class AppSettings:
     duckdb_path: str = _default_duckdb_path()
     duckdb_read_only: bool = False
     duckdb_allow_write: bool = False
+    duckdb_cache_ttl_seconds: int = 300
     llm_model: str = "claude-sonnet-4-5"
     llm_provider: str = "vertex_anthropic"
     vertex_project_id: str = ""
@@ -77,6 +89,7 @@ class AppSettings:
         duckdb_path = os.getenv("DUCKDB_PATH", cls.duckdb_path)
         duckdb_read_only = _env_bool("DUCKDB_READ_ONLY", cls.duckdb_read_only)
         duckdb_allow_write = _env_bool("DUCKDB_ALLOW_WRITE", cls.duckdb_allow_write)
+        duckdb_cache_ttl_seconds = _env_int("DUCKDB_CACHE_TTL_SECONDS", cls.duckdb_cache_ttl_seconds)
         llm_model = os.getenv("LLM_MODEL", os.getenv("GOOGLE_ADK_MODEL", cls.llm_model))
         llm_provider = os.getenv("LLM_PROVIDER", cls.llm_provider)
         vertex_project_id = os.getenv("VERTEX_PROJECT_ID", os.getenv("GOOGLE_CLOUD_PROJECT", cls.vertex_project_id))
@@ -89,6 +102,7 @@ class AppSettings:
             duckdb_path=duckdb_path,
             duckdb_read_only=duckdb_read_only,
             duckdb_allow_write=duckdb_allow_write,
+            duckdb_cache_ttl_seconds=duckdb_cache_ttl_seconds,
             llm_model=llm_model,
             llm_provider=llm_provider,
             vertex_project_id=vertex_project_id,
@@ -7,17 +7,79 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from pathlib import Path
+import queue
 import re
+import threading
 from typing import Any, Iterator
 
 from app.core.db_limits import DB_DEFAULT_RESULT_ROWS, validate_db_row_limit
 
+# Canonical normalization applied to `kommune` values for filtering/matching.
+NORMALIZED_KOMMUNE_TEMPLATE = (
+    "lower(trim(replace(replace({column}, ' Kommune', ''), ' kommune', '')))"
+)
+# Materialized column holding the normalized kommune value on `main.properties`.
+KOMMUNE_NORM_COLUMN = "kommune_norm"
+
+# Pre-aggregated roll-up of `main.properties` keyed by the dimensions the
+# dashboard tools group on; dashboard aggregates read this instead of
+# full-scanning the base table.
+PROPERTIES_ROLLUP_TABLE = "properties_rollup"
+
+# Narrow projection over `main.properties` carrying only the columns the
+# underwriting section queries read, with the normalized kommune value
+# exposed as a regular column.
+UNDERWRITING_VIEW = "vw_underwriting_base"
+
+_UNDERWRITING_VIEW_CREATE_TEMPLATE = """
+CREATE OR REPLACE VIEW main.vw_underwriting_base AS
+SELECT
+  {kommune_norm} AS kommune_norm,
+  kommune,
+  "Adresse",
+  "Adressenavn",
+  "Forenklet Bygningskategori",
+  "Bygningsstatus",
+  "TEK-standard",
+  "BruksarealTotalt",
+  "HarSefrakminne",
+  "HarKulturminne",
+  "Skjermingsverdig",
+  "Antall Underenheter",
+  "AntallEiere",
+  "Underenheter",
+  "Lat",
+  "Lon",
+  "VannforsyningsKodeId",
+  "AvlopsKodeId",
+  "OppvarmingsKodeIds",
+  "EnergikildeKodeIds"
+FROM main.properties
+"""
+
+_PROPERTIES_ROLLUP_CREATE_TEMPLATE = """
+CREATE TABLE main.properties_rollup AS
+SELECT
+  {kommune_norm} AS kommune_norm,
+  kommune,
+  "Forenklet Bygningskategori" AS occupancy_category,
+  COALESCE("TEK-standard", 'MISSING') AS tek_standard,
+  COALESCE("Bygningsstatus", 'MISSING') AS bygningsstatus,
+  COUNT(*) AS property_count,
+  SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+FROM main.properties
+GROUP BY 1, 2, 3, 4, 5
+"""
+
 
 class DuckDBService:
     """Service wrapper around a DuckDB database file."""
 
     READ_PREFIXES = {"select", "with", "show", "describe", "pragma", "explain"}
 
+    # Pooled cursors sized to match the MCP server's subquery executor.
+    CURSOR_POOL_SIZE = 4
+
     def __init__(self, db_path: str, read_only: bool = False, allow_write: bool = False):
         """Initialize DuckDB service.
 
@@ -29,6 +91,10 @@ class DuckDBService:
         self.db_path = Path(db_path).expanduser()
         self.read_only = read_only
         self.allow_write = allow_write
+        self._prepared: dict[str, str] = {}
+        self._shared_conn: Any = None
+        self._cursor_pool: queue.Queue[Any] | None = None
+        self._pool_lock = threading.Lock()
         if not self.read_only:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -51,6 +117,50 @@ class DuckDBService:
         finally:
             conn.close()
 
+    def _shared_connection(self) -> Any:
+        """Return a long-lived connection used for prepared-statement execution."""
+        if self._shared_conn is None:
+            duckdb = self._load_driver()
+            self._shared_conn = duckdb.connect(str(self.db_path), read_only=self.read_only)
+        return self._shared_conn
+
+    def _pool(self) -> queue.Queue[Any]:
+        """Return the cursor pool, creating it on first use."""
+        if self._cursor_pool is None:
+            with self._pool_lock:
+                if self._cursor_pool is None:
+                    conn = self._shared_connection()
+                    pool: queue.Queue[Any] = queue.Queue(maxsize=self.CURSOR_POOL_SIZE)
+                    for _ in range(self.CURSOR_POOL_SIZE):
+                        pool.put(conn.cursor())
+                    self._cursor_pool = pool
+        return self._cursor_pool
+
+    @contextmanager
+    def borrow(self) -> Iterator[Any]:
+        """Borrow a pooled cursor; blocks while all cursors are in use.
+
+        Cursors duplicate the shared connection against the same database
+        instance, so concurrent borrowers run isolated queries without a
+        fresh `duckdb.connect` (or cursor allocation) per call.
+        """
+        pool = self._pool()
+        cursor = pool.get()
+        try:
+            yield cursor
+        finally:
+            pool.put(cursor)
+
+    def close(self) -> None:
+        """Close pooled cursors and the shared connection if opened."""
+        if self._cursor_pool is not None:
+            while not self._cursor_pool.empty():
+                self._cursor_pool.get_nowait().close()
+            self._cursor_pool = None
+        if self._shared_conn is not None:
+            self._shared_conn.close()
+            self._shared_conn = None
+
     @classmethod
     def _is_write_statement(cls, sql: str) -> bool:
         """Return True when SQL appears to be write/DDL."""
@@ -101,29 +211,285 @@ class DuckDBService:
         if not statement:
             raise ValueError("sql is required.")
         validate_db_row_limit(limit)
+        if self._is_write_statement(statement):
+            if not self.allow_write:
+                raise PermissionError("Write SQL is disabled. Set DUCKDB_ALLOW_WRITE=true to enable.")
+            # Write/DDL statements run on the shared connection itself rather
+            # than a pooled cursor.
+            cursor = self._shared_connection().execute(statement, params or [])
+            result = self._result_from_cursor(cursor, limit)
+            self.refresh_rollups()
+            return result
+
+        with self.borrow() as cursor:
+            executed = cursor.execute(statement, params or [])
+            return self._result_from_cursor(executed, limit)
+
+    def ensure_normalized_kommune_column(
+        self,
+        table_schema: str = "main",
+        table_name: str = "properties",
+    ) -> bool:
+        """Materialize `kommune_norm` and an index on the properties table.
+
+        Kommune-scoped queries filter on a normalization expression over
+        `kommune`; materializing it once lets DuckDB prune scans via zone maps
+        and the ART index instead of recomputing the expression per row.
+
+        Returns:
+            True when the normalized column is available for querying, False
+            when the table is missing or the database cannot be altered.
+        """
+        conn = self._shared_connection()
+        row = conn.execute(
+            """
+            SELECT
+              MAX(CASE WHEN column_name = ? THEN 1 ELSE 0 END) AS has_norm,
+              COUNT(*) AS column_count
+            FROM information_schema.columns
+            WHERE table_schema = ? AND table_name = ?
+            """,
+            [KOMMUNE_NORM_COLUMN, table_schema, table_name],
+        ).fetchone()
+        if not row or not row[1]:
+            return False
+        if row[0]:
+            return True
+        if self.read_only or not self.allow_write:
+            return False
+
+        expression = NORMALIZED_KOMMUNE_TEMPLATE.format(column="kommune")
+        relation = f'"{table_schema}"."{table_name}"'
+        conn.execute(f"ALTER TABLE {relation} ADD COLUMN {KOMMUNE_NORM_COLUMN} VARCHAR")
+        conn.execute(f"UPDATE {relation} SET {KOMMUNE_NORM_COLUMN} = {expression}")
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{KOMMUNE_NORM_COLUMN} "
+            f"ON {relation} ({KOMMUNE_NORM_COLUMN})"
+        )
+        return True
+
+    def _table_exists(self, conn: Any, table_schema: str, table_name: str) -> bool:
+        """Return True when the given table exists."""
+        row = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.tables
+            WHERE table_schema = ? AND table_name = ?
+            """,
+            [table_schema, table_name],
+        ).fetchone()
+        return bool(row and row[0])
+
+    def _create_properties_rollup(self, conn: Any) -> None:
+        """Create the rollup table and its kommune index."""
+        has_norm = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.columns
+            WHERE table_schema = 'main' AND table_name = 'properties' AND column_name = ?
+            """,
+            [KOMMUNE_NORM_COLUMN],
+        ).fetchone()[0]
+        kommune_norm = (
+            KOMMUNE_NORM_COLUMN
+            if has_norm
+            else NORMALIZED_KOMMUNE_TEMPLATE.format(column="kommune")
+        )
+        conn.execute(_PROPERTIES_ROLLUP_CREATE_TEMPLATE.format(kommune_norm=kommune_norm))
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_rollup_kommune "
+            f"ON main.{PROPERTIES_ROLLUP_TABLE} (kommune_norm)"
+        )
+
+    def ensure_properties_rollup(self) -> bool:
+        """Create `main.properties_rollup` when missing and the DB is writable.
+
+        Returns:
+            True when the rollup table is available for querying.
+        """
+        conn = self._shared_connection()
+        if self._table_exists(conn, "main", PROPERTIES_ROLLUP_TABLE):
+            return True
+        if self.read_only or not self.allow_write:
+            return False
+        if not self._table_exists(conn, "main", "properties"):
+            return False
+        duckdb = self._load_driver()
+        try:
+            self._create_properties_rollup(conn)
+        except duckdb.Error:
+            # Nonstandard/legacy schema lacking the aggregated columns;
+            # callers fall back to base-table SQL.
+            return False
+        return True
+
+    def ensure_underwriting_view(self) -> bool:
+        """Create `main.vw_underwriting_base` when the DB is writable.
+
+        The view projects only the columns the underwriting section queries
+        touch and always exposes `kommune_norm`, so section SQL can filter on
+        the plain column name whether or not the materialized column exists.
+
+        Returns:
+            True when the view is available for querying.
+        """
+        conn = self._shared_connection()
+        if self.read_only or not self.allow_write:
+            return self._table_exists(conn, "main", UNDERWRITING_VIEW)
+        if not self._table_exists(conn, "main", "properties"):
+            return False
+        has_norm = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.columns
+            WHERE table_schema = 'main' AND table_name = 'properties' AND column_name = ?
+            """,
+            [KOMMUNE_NORM_COLUMN],
+        ).fetchone()[0]
+        kommune_norm = (
+            KOMMUNE_NORM_COLUMN
+            if has_norm
+            else NORMALIZED_KOMMUNE_TEMPLATE.format(column="kommune")
+        )
+        duckdb = self._load_driver()
+        try:
+            conn.execute(_UNDERWRITING_VIEW_CREATE_TEMPLATE.format(kommune_norm=kommune_norm))
+        except duckdb.Error:
+            # A properties table without the projected columns binds the view
+            # SQL unsuccessfully; report unavailable instead of raising so the
+            # section queries keep running against the base table.
+            return False
+        return True
+
+    def refresh_rollups(self) -> None:
+        """Rebuild the rollup table after base-table writes; no-op when absent."""
+        if self.read_only:
+            return
+        conn = self._shared_connection()
+        has_norm = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.columns
+            WHERE table_schema = 'main' AND table_name = 'properties' AND column_name = ?
+            """,
+            [KOMMUNE_NORM_COLUMN],
+        ).fetchone()[0]
+        if has_norm:
+            # Rows inserted through the write path arrive with a NULL
+            # `kommune_norm`; backfill them so kommune-filtered queries and
+            # the rollup keep seeing them.
+            expression = NORMALIZED_KOMMUNE_TEMPLATE.format(column="kommune")
+            conn.execute(
+                f"UPDATE main.properties SET {KOMMUNE_NORM_COLUMN} = {expression} "
+                f"WHERE {KOMMUNE_NORM_COLUMN} IS NULL"
+            )
+        if not self._table_exists(conn, "main", PROPERTIES_ROLLUP_TABLE):
+            return
+        duckdb = self._load_driver()
+        conn.execute(f"DROP TABLE main.{PROPERTIES_ROLLUP_TABLE}")
+        try:
+            self._create_properties_rollup(conn)
+        except duckdb.Error:
+            # A write may have dropped columns the rollup aggregates; leave
+            # the rollup absent and let aggregate readers fall back.
+            pass
+
+    def prepare(self, name: str, sql: str) -> None:
+        """Register a constant SQL template under a reusable handle name.
+
+        Prepared templates run on a shared long-lived connection so repeated
+        executions skip per-call connection setup. The statement text itself
+        is re-parsed per execution; these are named templates, not
+        server-side prepared handles.
+
+        Args:
+            name: Handle name used by `execute_prepared`.
+            sql: Constant SQL statement text.
+        """
+        statement = str(sql or "").strip()
+        if not name:
+            raise ValueError("name is required.")
+        if not statement:
+            raise ValueError("sql is required.")
         if not self.allow_write and self._is_write_statement(statement):
             raise PermissionError("Write SQL is disabled. Set DUCKDB_ALLOW_WRITE=true to enable.")
+        self._prepared[name] = statement
 
-        with self._connect() as conn:
-            cursor = conn.execute(statement, params or [])
-            if cursor.description is None:
-                return {
-                    "columns": [],
-                    "rows": [],
-                    "row_count": 0,
-                    "truncated": False,
-                    "db_path": str(self.db_path),
-                    "message": "Statement executed successfully.",
-                }
-
-            columns = [str(item[0]) for item in cursor.description]
-            fetched = cursor.fetchmany(limit + 1)
-            truncated = len(fetched) > limit
-            rows = fetched[:limit]
+    def execute_prepared(
+        self,
+        name: str,
+        params: list[Any] | None = None,
+        limit: int = DB_DEFAULT_RESULT_ROWS,
+    ) -> dict[str, Any]:
+        """Execute a previously registered SQL template by handle name.
+
+        Args:
+            name: Handle registered via `prepare`.
+            params: Optional positional parameters.
+            limit: Maximum result rows returned.
+        """
+        statement = self._prepared.get(name)
+        if statement is None:
+            raise KeyError(f"Unknown prepared statement: {name}")
+        validate_db_row_limit(limit)
+
+        with self.borrow() as cursor:
+            executed = cursor.execute(statement, params or [])
+            return self._result_from_cursor(executed, limit)
+
+    def execute_prepared_one(
+        self,
+        name: str,
+        params: list[Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Execute a registered template and return its first row as a dict.
+
+        Single-row aggregate statements skip the list-payload envelope and
+        the fetchmany over-read used by `execute_prepared`.
+
+        Args:
+            name: Handle registered via `prepare`.
+            params: Optional positional parameters.
+
+        Returns:
+            Column-keyed dict for the first result row, or None when the
+            statement produced no rows.
+        """
+        statement = self._prepared.get(name)
+        if statement is None:
+            raise KeyError(f"Unknown prepared statement: {name}")
+
+        with self.borrow() as cursor:
+            executed = cursor.execute(statement, params or [])
+            if executed.description is None:
+                return None
+            row = executed.fetchone()
+            if row is None:
+                return None
+            return {str(item[0]): value for item, value in zip(executed.description, row)}
+
+    def _result_from_cursor(self, cursor: Any, limit: int) -> dict[str, Any]:
+        """Build the structured query result payload from an executed cursor."""
+        if cursor.description is None:
+            return {
+                "columns": [],
+                "rows": [],
+                "row_count": 0,
+                "truncated": False,
+                "db_path": str(self.db_path),
+                "message": "Statement executed successfully.",
+            }
+
+        columns = [str(item[0]) for item in cursor.description]
+        fetched = cursor.fetchmany(limit + 1)
+        truncated = len(fetched) > limit
+        # Rows stay as the driver's tuples; they serialize identically to
+        # lists and skip one per-row copy.
+        rows = fetched[:limit]
 
         return {
             "columns": columns,
-            "rows": [list(row) for row in rows],
+            "rows": rows,
             "row_count": len(rows),
             "truncated": truncated,
             "db_path": str(self.db_path),
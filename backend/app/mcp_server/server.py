@@ -7,12 +7,28 @@ This server exposes:
 from __future__ import annotations
 
 import argparse
+import functools
+import inspect
 import json
+import os
+import re
+import string
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any, Callable
 
 from app.core.db_limits import DB_DEFAULT_RESULT_ROWS
 from app.core.settings import AppSettings
-from app.db.duckdb_service import DuckDBService
+from app.db.duckdb_service import (
+    KOMMUNE_NORM_COLUMN,
+    NORMALIZED_KOMMUNE_TEMPLATE,
+    UNDERWRITING_VIEW,
+    DuckDBService,
+)
 from app.mcp_server.contracts import DUCKDB_CALL_TARGETS, MCP_RESOURCES, MCP_TOOLS
 
 try:
@@ -20,9 +36,93 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - optional runtime dependency
     FastMCP = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional runtime dependency
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _safe_json(value: Any) -> str:
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode()
+else:
+    def _safe_json(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# Precompiled once at import; kommune normalization runs on every tool call.
+_WS_RE = re.compile(r"\s+")
+_KOMMUNE_SUFFIX_RE = re.compile(r"\s+kommune\s*$", re.IGNORECASE)
+
+
+def _compile_prompt_template(template: str) -> Callable[[dict[str, Any]], str]:
+    """Parse a `{name}`-style template once and return a reusable renderer.
+
+    Unknown placeholders render as themselves instead of raising KeyError.
+    """
+    segments = list(string.Formatter().parse(template))
+
+    def render(args: dict[str, Any]) -> str:
+        parts: list[str] = []
+        for literal, field, spec, _conversion in segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            if field in args:
+                value = args[field]
+                parts.append(format(value, spec) if spec else str(value))
+            else:
+                parts.append("{" + field + "}")
+        return "".join(parts)
+
+    return render
+
+
+def _ttl_cache(
+    max_age: float,
+    maxsize: int = 256,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize a function by its call arguments with TTL and LRU eviction.
+
+    A non-positive `max_age` disables caching and returns the function
+    unchanged; decorated functions expose `cache_clear()` for explicit
+    invalidation after writes.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if max_age <= 0:
+            return fn
+
+        lock = threading.Lock()
+        entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = args + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(key)
+                    return entry[1]
+            value = fn(*args, **kwargs)
+            with lock:
+                entries[key] = (now + max_age, value)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
 
-def _safe_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, default=str)
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
 
 
 def _normalize_args(args: Any) -> dict[str, Any]:
@@ -34,14 +134,664 @@ def _normalize_args(args: Any) -> dict[str, Any]:
         payload = args.strip()
         if not payload:
             return {}
+        # Plain strings cannot be JSON containers; skip the decode attempt.
+        if payload[0] not in "{[":
+            return {"value": args}
         try:
-            loaded = json.loads(payload)
-        except json.JSONDecodeError:
+            loaded = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        except ValueError:
             return {"value": args}
         return loaded if isinstance(loaded, dict) else {"value": loaded}
     return {"value": args}
 
 
+def _normalized_kommune_expr(column_ref: str) -> str:
+    return NORMALIZED_KOMMUNE_TEMPLATE.format(column=column_ref)
+
+
+_KOMMUNE_EXPR = _normalized_kommune_expr("kommune")
+_PARAM_EXPR = _normalized_kommune_expr("?")
+
+PORTFOLIO_TOTALS_SQL = """
+SELECT
+  COUNT(*) AS total_properties,
+  SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+FROM main.properties
+"""
+
+SELECTED_TOTALS_SQL = f"""
+SELECT
+  COUNT(*) AS total_properties,
+  SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+"""
+
+EXPOSURE_BY_KOMMUNE_SQL = f"""
+WITH grouped AS (
+  SELECT
+    kommune,
+    ({_KOMMUNE_EXPR} = {_PARAM_EXPR}) AS is_selected,
+    COUNT(*) AS property_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  GROUP BY 1, 2
+),
+totals AS (
+  SELECT
+    COUNT(*) AS portfolio_property_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS portfolio_total_bruksareal
+  FROM main.properties
+)
+SELECT
+  kommune,
+  property_count,
+  total_bruksareal,
+  ROUND(100.0 * property_count / NULLIF(portfolio_property_count, 0), 2) AS property_share_percent,
+  ROUND(100.0 * total_bruksareal / NULLIF(portfolio_total_bruksareal, 0), 2) AS area_share_percent,
+  is_selected
+FROM grouped, totals
+ORDER BY total_bruksareal DESC, property_count DESC, kommune
+"""
+
+CONCENTRATION_SQL = f"""
+WITH ranked AS (
+  SELECT
+    COALESCE("BruksarealTotalt", 0) AS area,
+    ROW_NUMBER() OVER (ORDER BY COALESCE("BruksarealTotalt", 0) DESC) AS rn
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+),
+totals AS (SELECT SUM(area) AS total_area FROM ranked)
+SELECT
+  ROUND(SUM(CASE WHEN rn <= 5 THEN area ELSE 0 END), 1) AS top5_area,
+  ROUND(100.0 * SUM(CASE WHEN rn <= 5 THEN area ELSE 0 END) / NULLIF(MAX(total_area), 0), 2) AS top5_share_percent,
+  ROUND(SUM(CASE WHEN rn <= 10 THEN area ELSE 0 END), 1) AS top10_area,
+  ROUND(100.0 * SUM(CASE WHEN rn <= 10 THEN area ELSE 0 END) / NULLIF(MAX(total_area), 0), 2) AS top10_share_percent
+FROM ranked, totals
+"""
+
+TOP_PROPERTIES_SQL = f"""
+WITH ranked AS (
+  SELECT
+    kommune,
+    COALESCE("Adresse", "Adressenavn", '-') AS address_label,
+    "Forenklet Bygningskategori" AS occupancy_category,
+    COALESCE("Bygningsstatus", 'MISSING') AS bygningsstatus,
+    COALESCE("TEK-standard", 'MISSING') AS tek_standard,
+    COALESCE("BruksarealTotalt", 0) AS total_bruksareal,
+    ROW_NUMBER() OVER (ORDER BY COALESCE("BruksarealTotalt", 0) DESC, COALESCE("Adresse", "Adressenavn", '-')) AS rn,
+    SUM(COALESCE("BruksarealTotalt", 0)) OVER () AS portfolio_area
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+)
+SELECT
+  rn AS rank,
+  kommune,
+  address_label,
+  occupancy_category,
+  bygningsstatus,
+  tek_standard,
+  total_bruksareal,
+  ROUND(100.0 * total_bruksareal / NULLIF(portfolio_area, 0), 2) AS area_share_percent
+FROM ranked
+WHERE rn <= ?
+ORDER BY rn
+"""
+
+OCCUPANCY_BY_CATEGORY_SQL = f"""
+WITH grouped AS (
+  SELECT
+    "Forenklet Bygningskategori" AS occupancy_category,
+    COUNT(*) AS building_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+    AND "Forenklet Bygningskategori" IS NOT NULL
+    AND TRIM("Forenklet Bygningskategori") <> ''
+  GROUP BY 1
+)
+SELECT
+  occupancy_category,
+  building_count,
+  total_bruksareal,
+  ROUND(100.0 * building_count / NULLIF(SUM(building_count) OVER (), 0), 2) AS count_share_percent,
+  ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
+FROM grouped
+ORDER BY total_bruksareal DESC, occupancy_category
+LIMIT ?
+"""
+
+OCCUPANCY_TOP_BY_COUNT_SQL = f"""
+WITH grouped AS (
+  SELECT
+    "Forenklet Bygningskategori" AS occupancy_category,
+    COUNT(*) AS building_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+    AND "Forenklet Bygningskategori" IS NOT NULL
+    AND TRIM("Forenklet Bygningskategori") <> ''
+  GROUP BY 1
+),
+shares AS (
+  SELECT
+    occupancy_category,
+    building_count,
+    total_bruksareal,
+    ROUND(100.0 * building_count / NULLIF(SUM(building_count) OVER (), 0), 2) AS count_share_percent,
+    ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
+  FROM grouped
+)
+SELECT *
+FROM shares
+QUALIFY ROW_NUMBER() OVER (ORDER BY building_count DESC, total_bruksareal DESC) <= ?
+ORDER BY building_count DESC, total_bruksareal DESC
+"""
+
+# One GROUPING SETS scan yields both the TEK distribution and the derived
+# age-band distribution; each output row has exactly one dimension non-NULL.
+AGE_STANDARD_PROXY_SQL = f"""
+WITH grouped AS (
+  SELECT
+    COALESCE("TEK-standard", 'MISSING') AS tek_standard,
+    CASE
+      WHEN "TEK-standard" IN ('TEK17', 'TEK10') THEN '2010+'
+      WHEN "TEK-standard" IN ('TEK07', 'TEK97') THEN '1997-2009'
+      WHEN "TEK-standard" LIKE 'BF%' THEN 'Pre-1997'
+      ELSE 'Unknown'
+    END AS age_band,
+    COUNT(*) AS property_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  GROUP BY GROUPING SETS ((1), (2))
+)
+SELECT
+  tek_standard,
+  age_band,
+  property_count,
+  total_bruksareal,
+  ROUND(
+    100.0 * property_count
+    / NULLIF(SUM(property_count) OVER (PARTITION BY tek_standard IS NULL), 0),
+    2
+  ) AS property_share_percent,
+  ROUND(
+    100.0 * total_bruksareal
+    / NULLIF(SUM(total_bruksareal) OVER (PARTITION BY tek_standard IS NULL), 0),
+    2
+  ) AS area_share_percent
+FROM grouped
+ORDER BY
+  tek_standard IS NULL,
+  CASE age_band
+    WHEN 'Pre-1997' THEN 1
+    WHEN '1997-2009' THEN 2
+    WHEN '2010+' THEN 3
+    ELSE 4
+  END,
+  total_bruksareal DESC,
+  tek_standard
+"""
+
+STATUS_DISTRIBUTION_SQL = f"""
+WITH grouped AS (
+  SELECT
+    COALESCE("Bygningsstatus", 'MISSING') AS bygningsstatus,
+    COUNT(*) AS property_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  GROUP BY 1
+)
+SELECT
+  bygningsstatus,
+  property_count,
+  total_bruksareal,
+  ROUND(100.0 * property_count / NULLIF(SUM(property_count) OVER (), 0), 2) AS property_share_percent,
+  ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent,
+  (LOWER(bygningsstatus) SIMILAR TO '.*(riving|brenning|kondemn|ikke godkjent).*') AS is_problematic
+FROM grouped
+ORDER BY total_bruksareal DESC, bygningsstatus
+"""
+
+PROBLEMATIC_PROPERTIES_SQL = f"""
+SELECT
+  kommune,
+  COALESCE("Adresse", "Adressenavn", '-') AS address_label,
+  "Forenklet Bygningskategori" AS occupancy_category,
+  "Bygningsstatus" AS bygningsstatus,
+  "TEK-standard" AS tek_standard,
+  COALESCE("BruksarealTotalt", 0) AS total_bruksareal
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  AND (
+    LOWER(COALESCE("Bygningsstatus", '')) LIKE '%riving%'
+    OR LOWER(COALESCE("Bygningsstatus", '')) LIKE '%brenning%'
+    OR LOWER(COALESCE("Bygningsstatus", '')) LIKE '%kondemn%'
+    OR LOWER(COALESCE("Bygningsstatus", '')) LIKE '%ikke godkjent%'
+  )
+ORDER BY total_bruksareal DESC, address_label
+LIMIT ?
+"""
+
+LARGE_RISK_SCHEDULE_SQL = f"""
+SELECT
+  kommune,
+  COALESCE("Adresse", "Adressenavn", '-') AS address_label,
+  "Forenklet Bygningskategori" AS occupancy_category,
+  "Bygningsstatus" AS bygningsstatus,
+  "TEK-standard" AS tek_standard,
+  COALESCE("BruksarealTotalt", 0) AS total_bruksareal
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+ORDER BY total_bruksareal DESC, occupancy_category, address_label
+LIMIT ?
+"""
+
+HERITAGE_ROWS_SQL = f"""
+SELECT
+  kommune,
+  COALESCE("Adresse", "Adressenavn", '-') AS address_label,
+  "Forenklet Bygningskategori" AS occupancy_category,
+  COALESCE("BruksarealTotalt", 0) AS total_bruksareal,
+  COALESCE("HarSefrakminne", 0) AS har_sefrakminne,
+  COALESCE("HarKulturminne", 0) AS har_kulturminne,
+  COALESCE("Skjermingsverdig", 0) AS skjermingsverdig
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  AND (
+    COALESCE("HarSefrakminne", 0) = 1
+    OR COALESCE("HarKulturminne", 0) = 1
+    OR COALESCE("Skjermingsverdig", 0) = 1
+  )
+ORDER BY total_bruksareal DESC, address_label
+LIMIT ?
+"""
+
+HERITAGE_SUMMARY_SQL = f"""
+SELECT
+  SUM(CASE WHEN COALESCE("HarSefrakminne", 0) = 1 THEN 1 ELSE 0 END) AS sefrak_count,
+  SUM(CASE WHEN COALESCE("HarKulturminne", 0) = 1 THEN 1 ELSE 0 END) AS kulturminne_count,
+  SUM(CASE WHEN COALESCE("Skjermingsverdig", 0) = 1 THEN 1 ELSE 0 END) AS skjermingsverdig_count,
+  SUM(
+    CASE
+      WHEN COALESCE("HarSefrakminne", 0) = 1
+        OR COALESCE("HarKulturminne", 0) = 1
+        OR COALESCE("Skjermingsverdig", 0) = 1
+      THEN 1 ELSE 0
+    END
+  ) AS any_flag_count
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+"""
+
+TENANT_SUMMARY_SQL = f"""
+WITH counts AS (
+  SELECT
+    COUNT(*) AS total_properties,
+    SUM(CASE WHEN COALESCE("Antall Underenheter", 0) > 0 THEN 1 ELSE 0 END) AS with_tenants_count,
+    SUM(CASE WHEN COALESCE("Antall Underenheter", 0) > 0 THEN COALESCE("BruksarealTotalt", 0) ELSE 0 END) AS with_tenants_area,
+    MAX(COALESCE("Antall Underenheter", 0)) AS max_underenheter,
+    SUM(CASE WHEN COALESCE("AntallEiere", 0) > 1 THEN 1 ELSE 0 END) AS multi_owner_count
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+)
+SELECT
+  total_properties,
+  with_tenants_count,
+  ROUND(100.0 * with_tenants_count / GREATEST(total_properties, 1), 2) AS with_tenants_share_percent,
+  ROUND(with_tenants_area, 1) AS with_tenants_area,
+  max_underenheter,
+  multi_owner_count
+FROM counts
+"""
+
+TENANT_TOP_ROWS_SQL = f"""
+SELECT
+  kommune,
+  COALESCE("Adresse", "Adressenavn", '-') AS address_label,
+  "Forenklet Bygningskategori" AS occupancy_category,
+  COALESCE("Antall Underenheter", 0) AS antall_underenheter,
+  COALESCE("BruksarealTotalt", 0) AS total_bruksareal,
+  COALESCE("AntallEiere", 0) AS antall_eiere,
+  COALESCE("Underenheter", '') AS underenheter
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  AND COALESCE("Antall Underenheter", 0) > 0
+ORDER BY antall_underenheter DESC, total_bruksareal DESC, address_label
+LIMIT ?
+"""
+
+DATA_QUALITY_SQL = f"""
+WITH counts AS (
+  SELECT
+    COUNT(*) AS total_properties,
+    SUM(CASE WHEN COALESCE("BruksarealTotalt", 0) > 0 THEN 1 ELSE 0 END) AS area_valid_count,
+    SUM(CASE WHEN "Adresse" IS NOT NULL AND TRIM("Adresse") <> '' THEN 1 ELSE 0 END) AS address_present_count,
+    SUM(CASE WHEN "Lat" IS NOT NULL AND "Lon" IS NOT NULL THEN 1 ELSE 0 END) AS geo_present_count,
+    SUM(CASE WHEN "VannforsyningsKodeId" IS NOT NULL AND "AvlopsKodeId" IS NOT NULL THEN 1 ELSE 0 END) AS utilities_present_count,
+    SUM(CASE WHEN "OppvarmingsKodeIds" IS NOT NULL OR "EnergikildeKodeIds" IS NOT NULL THEN 1 ELSE 0 END) AS heating_energy_present_count,
+    SUM(CASE WHEN "Bygningsstatus" IS NOT NULL AND TRIM("Bygningsstatus") <> '' THEN 1 ELSE 0 END) AS status_present_count,
+    SUM(CASE WHEN "TEK-standard" IS NOT NULL AND TRIM("TEK-standard") <> '' THEN 1 ELSE 0 END) AS tek_present_count
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+),
+percents AS (
+  SELECT
+    *,
+    ROUND(100.0 * area_valid_count / GREATEST(total_properties, 1), 2) AS area_valid_percent,
+    ROUND(100.0 * address_present_count / GREATEST(total_properties, 1), 2) AS address_present_percent,
+    ROUND(100.0 * geo_present_count / GREATEST(total_properties, 1), 2) AS geo_present_percent,
+    ROUND(100.0 * utilities_present_count / GREATEST(total_properties, 1), 2) AS utilities_present_percent,
+    ROUND(100.0 * heating_energy_present_count / GREATEST(total_properties, 1), 2) AS heating_energy_present_percent,
+    ROUND(100.0 * status_present_count / GREATEST(total_properties, 1), 2) AS status_present_percent,
+    ROUND(100.0 * tek_present_count / GREATEST(total_properties, 1), 2) AS tek_present_percent
+  FROM counts
+)
+SELECT
+  *,
+  ROUND(
+    (
+      area_valid_percent
+      + address_present_percent
+      + geo_present_percent
+      + utilities_present_percent
+      + heating_energy_present_percent
+    ) / 5,
+    2
+  ) AS score_percent
+FROM percents
+"""
+
+# (field, label) pairs matching the `*_count` / `*_percent` columns emitted by
+# `DATA_QUALITY_SQL`; the first five feed the overall score.
+_DATA_QUALITY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("area_valid", "Valid Area (>0)"),
+    ("address_present", "Address"),
+    ("geo_present", "Lat/Lon"),
+    ("utilities_present", "Water + Sewage"),
+    ("heating_energy_present", "Heating/Energy"),
+    ("status_present", "Building Status"),
+    ("tek_present", "TEK Standard"),
+)
+
+OCCUPANCY_DISTRIBUTION_SQL = f"""
+WITH grouped AS (
+  SELECT
+    "Forenklet Bygningskategori" AS occupancy_category,
+    COUNT(*) AS building_count,
+    SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
+  FROM main.properties
+  WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+    AND "Forenklet Bygningskategori" IS NOT NULL
+    AND trim("Forenklet Bygningskategori") <> ''
+  GROUP BY 1
+)
+SELECT
+  occupancy_category,
+  building_count,
+  total_bruksareal,
+  ROUND(
+    100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0),
+    2
+  ) AS share_percent
+FROM grouped
+ORDER BY total_bruksareal DESC, occupancy_category
+LIMIT ?
+"""
+
+LARGEST_OCCUPANCY_AREA_SQL = f"""
+SELECT
+  "Forenklet Bygningskategori" AS occupancy_category,
+  SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal,
+  COUNT(*) AS building_count
+FROM main.properties
+WHERE {_KOMMUNE_EXPR} = {_PARAM_EXPR}
+  AND "Forenklet Bygningskategori" IS NOT NULL
+  AND trim("Forenklet Bygningskategori") <> ''
+GROUP BY 1
+ORDER BY total_bruksareal DESC, building_count DESC, occupancy_category
+LIMIT 1
+"""
+
+ROLLUP_PORTFOLIO_TOTALS_SQL = """
+SELECT
+  SUM(property_count) AS total_properties,
+  SUM(total_bruksareal) AS total_bruksareal
+FROM main.properties_rollup
+"""
+
+ROLLUP_SELECTED_TOTALS_SQL = f"""
+SELECT
+  SUM(property_count) AS total_properties,
+  SUM(total_bruksareal) AS total_bruksareal
+FROM main.properties_rollup
+WHERE kommune_norm = {_PARAM_EXPR}
+"""
+
+ROLLUP_EXPOSURE_BY_KOMMUNE_SQL = f"""
+WITH grouped AS (
+  SELECT
+    kommune,
+    (kommune_norm = {_PARAM_EXPR}) AS is_selected,
+    SUM(property_count) AS property_count,
+    SUM(total_bruksareal) AS total_bruksareal
+  FROM main.properties_rollup
+  WHERE kommune_norm = {_PARAM_EXPR}
+  GROUP BY 1, 2
+),
+totals AS (
+  SELECT
+    SUM(property_count) AS portfolio_property_count,
+    SUM(total_bruksareal) AS portfolio_total_bruksareal
+  FROM main.properties_rollup
+)
+SELECT
+  kommune,
+  property_count,
+  total_bruksareal,
+  ROUND(100.0 * property_count / NULLIF(portfolio_property_count, 0), 2) AS property_share_percent,
+  ROUND(100.0 * total_bruksareal / NULLIF(portfolio_total_bruksareal, 0), 2) AS area_share_percent,
+  is_selected
+FROM grouped, totals
+ORDER BY total_bruksareal DESC, property_count DESC, kommune
+"""
+
+ROLLUP_OCCUPANCY_BY_CATEGORY_SQL = f"""
+WITH grouped AS (
+  SELECT
+    occupancy_category,
+    SUM(property_count) AS building_count,
+    SUM(total_bruksareal) AS total_bruksareal
+  FROM main.properties_rollup
+  WHERE kommune_norm = {_PARAM_EXPR}
+    AND occupancy_category IS NOT NULL
+    AND TRIM(occupancy_category) <> ''
+  GROUP BY 1
+)
+SELECT
+  occupancy_category,
+  building_count,
+  total_bruksareal,
+  ROUND(100.0 * building_count / NULLIF(SUM(building_count) OVER (), 0), 2) AS count_share_percent,
+  ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
+FROM grouped
+ORDER BY total_bruksareal DESC, occupancy_category
+LIMIT ?
+"""
+
+ROLLUP_OCCUPANCY_TOP_BY_COUNT_SQL = f"""
+WITH grouped AS (
+  SELECT
+    occupancy_category,
+    SUM(property_count) AS building_count,
+    SUM(total_bruksareal) AS total_bruksareal
+  FROM main.properties_rollup
+  WHERE kommune_norm = {_PARAM_EXPR}
+    AND occupancy_category IS NOT NULL
+    AND TRIM(occupancy_category) <> ''
+  GROUP BY 1
+),
+shares AS (
+  SELECT
+    occupancy_category,
+    building_count,
+    total_bruksareal,
+    ROUND(100.0 * building_count / NULLIF(SUM(building_count) OVER (), 0), 2) AS count_share_percent,
+    ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
+  FROM grouped
+)
+SELECT *
+FROM shares
+QUALIFY ROW_NUMBER() OVER (ORDER BY building_count DESC, total_bruksareal DESC) <= ?
+ORDER BY building_count DESC, total_bruksareal DESC
+"""
+
+ROLLUP_AGE_STANDARD_PROXY_SQL = f"""
+WITH grouped AS (
+  SELECT
+    tek_standard,
+    CASE
+      WHEN tek_standard IN ('TEK17', 'TEK10') THEN '2010+'
+      WHEN tek_standard IN ('TEK07', 'TEK97') THEN '1997-2009'
+      WHEN tek_standard LIKE 'BF%' THEN 'Pre-1997'
+      ELSE 'Unknown'
+    END AS age_band,
+    SUM(property_count) AS property_count,
+    SUM(total_bruksareal) AS total_bruksareal
+  FROM main.properties_rollup
+  WHERE kommune_norm = {_PARAM_EXPR}
+  GROUP BY GROUPING SETS ((1), (2))
+)
+SELECT
+  tek_standard,
+  age_band,
+  property_count,
+  total_bruksareal,
+  ROUND(
+    100.0 * property_count
+    / NULLIF(SUM(property_count) OVER (PARTITION BY tek_standard IS NULL), 0),
+    2
+  ) AS property_share_percent,
+  ROUND(
+    100.0 * total_bruksareal
+    / NULLIF(SUM(total_bruksareal) OVER (PARTITION BY tek_standard IS NULL), 0),
+    2
+  ) AS area_share_percent
+FROM grouped
+ORDER BY
+  tek_standard IS NULL,
+  CASE age_band
+    WHEN 'Pre-1997' THEN 1
+    WHEN '1997-2009' THEN 2
+    WHEN '2010+' THEN 3
+    ELSE 4
+  END,
+  total_bruksareal DESC,
+  tek_standard
+"""
+
+ROLLUP_STATUS_DISTRIBUTION_SQL = f"""
+WITH grouped AS (
+  SELECT
+    bygningsstatus,
+    SUM(property_count) AS property_count,
+    SUM(total_bruksareal) AS total_bruksareal
+  FROM main.properties_rollup
+  WHERE kommune_norm = {_PARAM_EXPR}
+  GROUP BY 1
+)
+SELECT
+  bygningsstatus,
+  property_count,
+  total_bruksareal,
+  ROUND(100.0 * property_count / NULLIF(SUM(property_count) OVER (), 0), 2) AS property_share_percent,
+  ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent,
+  (LOWER(bygningsstatus) SIMILAR TO '.*(riving|brenning|kondemn|ikke godkjent).*') AS is_problematic
+FROM grouped
+ORDER BY total_bruksareal DESC, bygningsstatus
+"""
+
+ROLLUP_OCCUPANCY_DISTRIBUTION_SQL = f"""
+WITH grouped AS (
+  SELECT
+    occupancy_category,
+    SUM(property_count) AS building_count,
+    SUM(total_bruksareal) AS total_bruksareal
+  FROM main.properties_rollup
+  WHERE kommune_norm = {_PARAM_EXPR}
+    AND occupancy_category IS NOT NULL
+    AND trim(occupancy_category) <> ''
+  GROUP BY 1
+)
+SELECT
+  occupancy_category,
+  building_count,
+  total_bruksareal,
+  ROUND(
+    100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0),
+    2
+  ) AS share_percent
+FROM grouped
+ORDER BY total_bruksareal DESC, occupancy_category
+LIMIT ?
+"""
+
+ROLLUP_LARGEST_OCCUPANCY_AREA_SQL = f"""
+SELECT
+  occupancy_category,
+  SUM(total_bruksareal) AS total_bruksareal,
+  SUM(property_count) AS building_count
+FROM main.properties_rollup
+WHERE kommune_norm = {_PARAM_EXPR}
+  AND occupancy_category IS NOT NULL
+  AND trim(occupancy_category) <> ''
+GROUP BY 1
+ORDER BY total_bruksareal DESC, building_count DESC, occupancy_category
+LIMIT 1
+"""
+
+# Aggregate-only statements re-pointed at the pre-aggregated rollup table when
+# it is available; per-property lists still read the base table.
+ROLLUP_PREPARED_STATEMENTS: dict[str, str] = {
+    "portfolio_totals": ROLLUP_PORTFOLIO_TOTALS_SQL,
+    "selected_totals": ROLLUP_SELECTED_TOTALS_SQL,
+    "exposure_by_kommune": ROLLUP_EXPOSURE_BY_KOMMUNE_SQL,
+    "occupancy_by_category": ROLLUP_OCCUPANCY_BY_CATEGORY_SQL,
+    "occupancy_top_by_count": ROLLUP_OCCUPANCY_TOP_BY_COUNT_SQL,
+    "age_standard_proxy": ROLLUP_AGE_STANDARD_PROXY_SQL,
+    "status_distribution": ROLLUP_STATUS_DISTRIBUTION_SQL,
+    "occupancy_distribution": ROLLUP_OCCUPANCY_DISTRIBUTION_SQL,
+    "largest_occupancy_area": ROLLUP_LARGEST_OCCUPANCY_AREA_SQL,
+}
+
+# Constant dashboard SQL registered once as prepared statements at server
+# startup so hot tools execute by handle instead of re-submitting SQL text.
+PREPARED_STATEMENTS: dict[str, str] = {
+    "portfolio_totals": PORTFOLIO_TOTALS_SQL,
+    "selected_totals": SELECTED_TOTALS_SQL,
+    "exposure_by_kommune": EXPOSURE_BY_KOMMUNE_SQL,
+    "concentration": CONCENTRATION_SQL,
+    "top_properties": TOP_PROPERTIES_SQL,
+    "occupancy_by_category": OCCUPANCY_BY_CATEGORY_SQL,
+    "occupancy_top_by_count": OCCUPANCY_TOP_BY_COUNT_SQL,
+    "age_standard_proxy": AGE_STANDARD_PROXY_SQL,
+    "status_distribution": STATUS_DISTRIBUTION_SQL,
+    "problematic_properties": PROBLEMATIC_PROPERTIES_SQL,
+    "large_risk_schedule": LARGE_RISK_SCHEDULE_SQL,
+    "heritage_rows": HERITAGE_ROWS_SQL,
+    "heritage_summary": HERITAGE_SUMMARY_SQL,
+    "tenant_summary": TENANT_SUMMARY_SQL,
+    "tenant_top_rows": TENANT_TOP_ROWS_SQL,
+    "data_quality": DATA_QUALITY_SQL,
+    "occupancy_distribution": OCCUPANCY_DISTRIBUTION_SQL,
+    "largest_occupancy_area": LARGEST_OCCUPANCY_AREA_SQL,
+}
+
+
 def _split_table_name(name: str) -> tuple[str, str]:
     value = str(name or "").strip()
     if not value:
@@ -67,6 +817,38 @@ def create_duckdb_mcp_server(
         read_only=resolved.duckdb_read_only,
         allow_write=resolved.duckdb_allow_write,
     )
+    # Prefer the materialized kommune_norm column so kommune filters become
+    # index/zone-map pruned scans instead of per-row expression evaluation.
+    kommune_norm_ready = duckdb_service.ensure_normalized_kommune_column()
+    rollup_ready = duckdb_service.ensure_properties_rollup()
+    # The narrow view keeps section scans on just the projected columns and
+    # always exposes kommune_norm, so filters use the plain column either way.
+    view_ready = duckdb_service.ensure_underwriting_view()
+    for statement_name, statement_sql in PREPARED_STATEMENTS.items():
+        if rollup_ready and statement_name in ROLLUP_PREPARED_STATEMENTS:
+            statement_sql = ROLLUP_PREPARED_STATEMENTS[statement_name]
+        elif view_ready:
+            statement_sql = statement_sql.replace(
+                "main.properties", f"main.{UNDERWRITING_VIEW}"
+            ).replace(_KOMMUNE_EXPR, KOMMUNE_NORM_COLUMN)
+        elif kommune_norm_ready:
+            statement_sql = statement_sql.replace(_KOMMUNE_EXPR, KOMMUNE_NORM_COLUMN)
+        duckdb_service.prepare(statement_name, statement_sql)
+
+    # Independent dashboard subqueries run concurrently; each prepared
+    # execution gets its own cursor, so workers never share an executor.
+    query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="duckdb-subquery")
+    # Top-level dashboard sections fan out on their own executor; sections
+    # may block on query_executor futures, so sharing one pool could leave
+    # section tasks waiting on subqueries that have no free worker.
+    section_executor = ThreadPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 4), thread_name_prefix="duckdb-section"
+    )
+
+    # Repeat dashboard calls for the same kommune are served from memory
+    # until the TTL lapses or a write invalidates the caches.
+    build_cache = _ttl_cache(max_age=float(resolved.duckdb_cache_ttl_seconds))
+
     mcp = FastMCP(name="duckdb-mcp-server")
 
     runtime_state: dict[str, Any] = {
@@ -75,38 +857,84 @@ def create_duckdb_mcp_server(
         "host": "127.0.0.1",
         "port": 8200,
     }
+    # Frozen snapshot rebuilt only on mutation so hot status/health reads
+    # skip the per-call dict copy.
+    runtime_snapshot: dict[str, Any] = dict(runtime_state)
+
+    def _update_runtime(**changes: Any) -> dict[str, Any]:
+        nonlocal runtime_snapshot
+        runtime_state.update(changes)
+        runtime_snapshot = dict(runtime_state)
+        return runtime_snapshot
     published_resources: dict[str, dict[str, Any]] = {}
     published_queries: dict[str, dict[str, Any]] = {}
     published_tools: dict[str, dict[str, Any]] = {}
-    prompt_templates: dict[str, dict[str, str]] = {
+    prompt_templates: dict[str, dict[str, Any]] = {
         "sql_analysis": {
             "template": "Analyze this SQL result for municipality insights:\n{result}",
             "description": "Summarize and interpret SQL query results.",
         }
     }
+    for template_entry in prompt_templates.values():
+        template_entry["compiled"] = _compile_prompt_template(str(template_entry["template"]))
 
     tool_dispatch: dict[str, Callable[..., Any]] = {}
 
+    # Catalogs are rebuilt only after a publish mutates runtime state; cached
+    # lists are served between publishes.
+    catalog_cache: dict[str, list[dict[str, Any]] | None] = {
+        "tools": None,
+        "targets": None,
+        "resources": None,
+        "prompts": None,
+        "prompt_templates": None,
+    }
+
+    def _invalidate_catalogs() -> None:
+        catalog_cache["tools"] = None
+        catalog_cache["targets"] = None
+        catalog_cache["resources"] = None
+
     def _tool_catalog() -> list[dict[str, Any]]:
+        cached = catalog_cache["tools"]
+        if cached is not None:
+            return cached
         catalog = [dict(item) for item in MCP_TOOLS]
+        seen = {entry["name"] for entry in catalog}
         for target in DUCKDB_CALL_TARGETS:
-            if not any(entry["name"] == target["name"] for entry in catalog):
+            if target["name"] not in seen:
+                seen.add(target["name"])
                 catalog.append(dict(target))
         for name, data in published_tools.items():
-            if not any(entry["name"] == name for entry in catalog):
+            if name not in seen:
+                seen.add(name)
                 catalog.append({"name": name, "description": str(data.get("description", ""))})
+        catalog_cache["tools"] = catalog
         return catalog
 
     def _call_target_catalog() -> list[dict[str, Any]]:
+        cached = catalog_cache["targets"]
+        if cached is not None:
+            return cached
         catalog = [dict(item) for item in DUCKDB_CALL_TARGETS]
+        seen = {entry["name"] for entry in catalog}
         for name, data in published_tools.items():
-            if data.get("target_tool") and not any(entry["name"] == name for entry in catalog):
+            if data.get("target_tool") and name not in seen:
+                seen.add(name)
                 catalog.append({"name": name, "description": str(data.get("description", ""))})
+        catalog_cache["targets"] = catalog
         return catalog
 
     def _resource_catalog() -> list[dict[str, Any]]:
+        cached = catalog_cache["resources"]
+        if cached is not None:
+            return cached
         catalog = [dict(item) for item in MCP_RESOURCES]
+        seen = {entry["uri"] for entry in catalog}
         for uri, data in published_resources.items():
+            if uri in seen:
+                continue
+            seen.add(uri)
             catalog.append(
                 {
                     "uri": uri,
@@ -115,6 +943,9 @@ def create_duckdb_mcp_server(
                 }
             )
         for uri, data in published_queries.items():
+            if uri in seen:
+                continue
+            seen.add(uri)
             catalog.append(
                 {
                     "uri": uri,
@@ -122,17 +953,20 @@ def create_duckdb_mcp_server(
                     "description": str(data.get("description", "Published SQL-backed MCP resource.")),
                 }
             )
+        catalog_cache["resources"] = catalog
         return catalog
 
+    static_resource_handlers: dict[str, Callable[[], Any]] = {
+        "duckdb://health": duckdb_service.health,
+        "duckdb://tables": duckdb_service.list_tables,
+        "duckdb://tools": _tool_catalog,
+        "duckdb://tool-targets": _call_target_catalog,
+    }
+
     def _resolve_resource(uri: str) -> Any:
-        if uri == "duckdb://health":
-            return duckdb_service.health()
-        if uri == "duckdb://tables":
-            return duckdb_service.list_tables()
-        if uri == "duckdb://tools":
-            return _tool_catalog()
-        if uri == "duckdb://tool-targets":
-            return _call_target_catalog()
+        static_handler = static_resource_handlers.get(uri)
+        if static_handler is not None:
+            return static_handler()
 
         if uri.startswith("duckdb://table/"):
             path = uri[len("duckdb://table/") :].strip("/")
@@ -187,48 +1021,21 @@ def create_duckdb_mcp_server(
 
     def duckdb_query(sql: str, params: list[Any] | None = None, limit: int = DB_DEFAULT_RESULT_ROWS) -> dict[str, Any]:
         """Execute a bounded SQL query against DuckDB."""
-        return duckdb_service.query(sql=sql, params=params, limit=limit)
-
-    def _normalized_kommune_expr(column_ref: str) -> str:
-        return (
-            f"lower(trim(replace(replace({column_ref}, ' Kommune', ''), ' kommune', '')))"
-        )
+        result = duckdb_service.query(sql=sql, params=params, limit=limit)
+        # Writes can change anything the dashboard caches aggregate over.
+        if DuckDBService._is_write_statement(str(sql or "")):
+            _invalidate_build_caches()
+        return result
 
     def duckdb_kommune_occupancy_distribution(kommune_name: str, limit: int = 30) -> dict[str, Any]:
         """Return occupancy distribution for one kommune using area share by category."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         if limit < 1 or limit > 500:
             raise ValueError("limit must be in range [1, 500].")
 
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
-        sql = f"""
-        WITH grouped AS (
-          SELECT
-            "Forenklet Bygningskategori" AS occupancy_category,
-            COUNT(*) AS building_count,
-            SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-          FROM main.properties
-          WHERE {kommune_expr} = {param_expr}
-            AND "Forenklet Bygningskategori" IS NOT NULL
-            AND trim("Forenklet Bygningskategori") <> ''
-          GROUP BY 1
+        result = duckdb_service.execute_prepared(
+            "occupancy_distribution", params=[normalized, int(limit)], limit=limit
         )
-        SELECT
-          occupancy_category,
-          building_count,
-          total_bruksareal,
-          ROUND(
-            100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0),
-            2
-          ) AS share_percent
-        FROM grouped
-        ORDER BY total_bruksareal DESC, occupancy_category
-        LIMIT ?
-        """
-        result = duckdb_service.query(sql=sql, params=[normalized, int(limit)], limit=limit)
         return {
             "kommune_name": normalized,
             "metric": "occupancy_distribution",
@@ -237,26 +1044,9 @@ def create_duckdb_mcp_server(
 
     def duckdb_kommune_largest_occupancy_area(kommune_name: str) -> dict[str, Any]:
         """Return the largest occupancy category by summed `BruksarealTotalt`."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
 
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
-        sql = f"""
-        SELECT
-          "Forenklet Bygningskategori" AS occupancy_category,
-          SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal,
-          COUNT(*) AS building_count
-        FROM main.properties
-        WHERE {kommune_expr} = {param_expr}
-          AND "Forenklet Bygningskategori" IS NOT NULL
-          AND trim("Forenklet Bygningskategori") <> ''
-        GROUP BY 1
-        ORDER BY total_bruksareal DESC, building_count DESC, occupancy_category
-        LIMIT 1
-        """
-        result = duckdb_service.query(sql=sql, params=[normalized], limit=1)
+        result = duckdb_service.execute_prepared("largest_occupancy_area", params=[normalized], limit=1)
         return {
             "kommune_name": normalized,
             "metric": "largest_occupancy_by_area",
@@ -268,16 +1058,9 @@ def create_duckdb_mcp_server(
         rows = result.get("rows", [])
         if not isinstance(columns, list) or not isinstance(rows, list):
             return []
-
-        out: list[dict[str, Any]] = []
-        for row in rows:
-            if not isinstance(row, list):
-                continue
-            item: dict[str, Any] = {}
-            for idx in range(min(len(columns), len(row))):
-                item[str(columns[idx])] = row[idx]
-            out.append(item)
-        return out
+        # Column names are already strings in the service envelope; zip runs
+        # the row-to-dict conversion in C instead of a per-cell index loop.
+        return [dict(zip(columns, row)) for row in rows if isinstance(row, (list, tuple))]
 
     def _query_objects(
         sql: str,
@@ -287,23 +1070,32 @@ def create_duckdb_mcp_server(
         result = duckdb_service.query(sql=sql, params=params, limit=limit)
         return _rows_to_objects(result)
 
-    def _to_float(value: Any) -> float:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
-
-    def _as_int(value: Any) -> int:
-        return int(round(_to_float(value)))
+    def _prepared_objects(
+        name: str,
+        params: list[Any] | None = None,
+        limit: int = DB_DEFAULT_RESULT_ROWS,
+    ) -> list[dict[str, Any]]:
+        result = duckdb_service.execute_prepared(name=name, params=params, limit=limit)
+        return _rows_to_objects(result)
 
-    def _as_round(value: Any, digits: int = 2) -> float:
-        return round(_to_float(value), digits)
+    def _prepared_one(name: str, params: list[Any] | None = None) -> dict[str, Any]:
+        row = duckdb_service.execute_prepared_one(name=name, params=params)
+        return row if row is not None else {}
 
     def _normalize_kommune_value(value: str) -> str:
-        normalized = " ".join(str(value or "").split()).strip().lower()
-        if normalized.endswith(" kommune"):
-            normalized = normalized[: -len(" kommune")]
-        return normalized
+        collapsed = _WS_RE.sub(" ", str(value or "")).strip()
+        return _KOMMUNE_SUFFIX_RE.sub("", collapsed).casefold()
+
+    def _clean_kommune(name: str) -> str:
+        # Fast path: the common MCP case is an already-clean non-empty str.
+        # Interning means repeated kommune names hash by pointer identity in
+        # the memoization caches keyed on the cleaned value.
+        if type(name) is str and name and name == name.strip():
+            return sys.intern(name)
+        cleaned = str(name or "").strip()
+        if not cleaned:
+            raise ValueError("kommune_name is required.")
+        return sys.intern(cleaned)
 
     def _validate_limit(limit: int) -> int:
         value = int(limit)
@@ -311,129 +1103,37 @@ def create_duckdb_mcp_server(
             raise ValueError(f"limit must be in range [1, {DB_DEFAULT_RESULT_ROWS}].")
         return value
 
+    @build_cache
     def _build_exposure_dashboard(kommune_name: str, top_n: int = 10) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
         params = [kommune_name]
         resolved_top_n = _validate_limit(top_n)
 
-        portfolio_total_row = _query_objects(
-            sql="""
-            SELECT
-              COUNT(*) AS total_properties,
-              SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-            FROM main.properties
-            """,
-            params=None,
-            limit=1,
-        )[0]
-        selected_total_row = _query_objects(
-            sql=f"""
-            SELECT
-              COUNT(*) AS total_properties,
-              SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-            """,
-            params=params,
-            limit=1,
-        )[0]
-        by_kommune_rows = _query_objects(
-            sql=f"""
-            WITH grouped AS (
-              SELECT
-                kommune,
-                COUNT(*) AS property_count,
-                SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-              GROUP BY 1
-            ),
-            totals AS (
-              SELECT
-                COUNT(*) AS portfolio_property_count,
-                SUM(COALESCE("BruksarealTotalt", 0)) AS portfolio_total_bruksareal
-              FROM main.properties
-            )
-            SELECT
-              kommune,
-              property_count,
-              total_bruksareal,
-              ROUND(100.0 * property_count / NULLIF(portfolio_property_count, 0), 2) AS property_share_percent,
-              ROUND(100.0 * total_bruksareal / NULLIF(portfolio_total_bruksareal, 0), 2) AS area_share_percent
-            FROM grouped, totals
-            ORDER BY total_bruksareal DESC, property_count DESC, kommune
-            """,
-            params=params,
-            limit=200,
+        portfolio_future = query_executor.submit(_prepared_one, "portfolio_totals")
+        selected_future = query_executor.submit(_prepared_one, "selected_totals", params)
+        by_kommune_future = query_executor.submit(
+            _prepared_objects, "exposure_by_kommune", [kommune_name, kommune_name], 200
         )
-        normalized_selected = _normalize_kommune_value(kommune_name)
-        for row in by_kommune_rows:
-            row["is_selected"] = _normalize_kommune_value(str(row.get("kommune", ""))) == normalized_selected
-
-        concentration_row = _query_objects(
-            sql=f"""
-            WITH ranked AS (
-              SELECT
-                COALESCE("BruksarealTotalt", 0) AS area,
-                ROW_NUMBER() OVER (ORDER BY COALESCE("BruksarealTotalt", 0) DESC) AS rn
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-            ),
-            totals AS (SELECT SUM(area) AS total_area FROM ranked)
-            SELECT
-              SUM(CASE WHEN rn <= 5 THEN area ELSE 0 END) AS top5_area,
-              ROUND(100.0 * SUM(CASE WHEN rn <= 5 THEN area ELSE 0 END) / NULLIF(MAX(total_area), 0), 2) AS top5_share_percent,
-              SUM(CASE WHEN rn <= 10 THEN area ELSE 0 END) AS top10_area,
-              ROUND(100.0 * SUM(CASE WHEN rn <= 10 THEN area ELSE 0 END) / NULLIF(MAX(total_area), 0), 2) AS top10_share_percent
-            FROM ranked, totals
-            """,
-            params=params,
-            limit=1,
-        )[0]
-
-        top_properties_rows = _query_objects(
-            sql=f"""
-            WITH ranked AS (
-              SELECT
-                kommune,
-                COALESCE("Adresse", "Adressenavn", '-') AS address_label,
-                "Forenklet Bygningskategori" AS occupancy_category,
-                COALESCE("Bygningsstatus", 'MISSING') AS bygningsstatus,
-                COALESCE("TEK-standard", 'MISSING') AS tek_standard,
-                COALESCE("BruksarealTotalt", 0) AS total_bruksareal,
-                ROW_NUMBER() OVER (ORDER BY COALESCE("BruksarealTotalt", 0) DESC, COALESCE("Adresse", "Adressenavn", '-')) AS rn,
-                SUM(COALESCE("BruksarealTotalt", 0)) OVER () AS portfolio_area
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-            )
-            SELECT
-              rn AS rank,
-              kommune,
-              address_label,
-              occupancy_category,
-              bygningsstatus,
-              tek_standard,
-              total_bruksareal,
-              ROUND(100.0 * total_bruksareal / NULLIF(portfolio_area, 0), 2) AS area_share_percent
-            FROM ranked
-            WHERE rn <= ?
-            ORDER BY rn
-            """,
-            params=[kommune_name, resolved_top_n],
-            limit=resolved_top_n,
+        concentration_future = query_executor.submit(_prepared_one, "concentration", params)
+        top_properties_future = query_executor.submit(
+            _prepared_objects, "top_properties", [kommune_name, resolved_top_n], resolved_top_n
         )
 
-        selected_total_area = _to_float(selected_total_row.get("total_bruksareal"))
-        portfolio_total_area = _to_float(portfolio_total_row.get("total_bruksareal"))
-        selected_total_properties = _as_int(selected_total_row.get("total_properties"))
-        portfolio_total_properties = _as_int(portfolio_total_row.get("total_properties"))
+        portfolio_total_row = portfolio_future.result()
+        selected_total_row = selected_future.result()
+        by_kommune_rows = by_kommune_future.result()
+        concentration_row = concentration_future.result()
+        top_properties_rows = top_properties_future.result()
+
+        selected_total_area = float(selected_total_row.get("total_bruksareal") or 0)
+        portfolio_total_area = float(portfolio_total_row.get("total_bruksareal") or 0)
+        selected_total_properties = int(selected_total_row.get("total_properties") or 0)
+        portfolio_total_properties = int(portfolio_total_row.get("total_properties") or 0)
 
         return {
             "portfolio_total_properties": portfolio_total_properties,
-            "portfolio_total_bruksareal": _as_round(portfolio_total_area, 1),
+            "portfolio_total_bruksareal": round(portfolio_total_area, 1),
             "selected_kommune_properties": selected_total_properties,
-            "selected_kommune_bruksareal": _as_round(selected_total_area, 1),
+            "selected_kommune_bruksareal": round(selected_total_area, 1),
             "selected_property_share_percent": round(
                 100.0 * selected_total_properties / max(portfolio_total_properties, 1), 2
             ),
@@ -442,180 +1142,60 @@ def create_duckdb_mcp_server(
             ),
             "by_kommune": by_kommune_rows,
             "concentration": {
-                "top5_area": _as_round(concentration_row.get("top5_area"), 1),
-                "top5_share_percent": _as_round(concentration_row.get("top5_share_percent"), 2),
-                "top10_area": _as_round(concentration_row.get("top10_area"), 1),
-                "top10_share_percent": _as_round(concentration_row.get("top10_share_percent"), 2),
+                "top5_area": concentration_row.get("top5_area") or 0,
+                "top5_share_percent": concentration_row.get("top5_share_percent") or 0,
+                "top10_area": concentration_row.get("top10_area") or 0,
+                "top10_share_percent": concentration_row.get("top10_share_percent") or 0,
             },
             "top_properties_by_area": top_properties_rows,
         }
 
+    @build_cache
     def _build_occupancy_risk_mix(kommune_name: str, limit: int = 30) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
         resolved_limit = _validate_limit(limit)
 
-        by_category_rows = _query_objects(
-            sql=f"""
-            WITH grouped AS (
-              SELECT
-                "Forenklet Bygningskategori" AS occupancy_category,
-                COUNT(*) AS building_count,
-                SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-                AND "Forenklet Bygningskategori" IS NOT NULL
-                AND TRIM("Forenklet Bygningskategori") <> ''
-              GROUP BY 1
-            )
-            SELECT
-              occupancy_category,
-              building_count,
-              total_bruksareal,
-              ROUND(100.0 * building_count / NULLIF(SUM(building_count) OVER (), 0), 2) AS count_share_percent,
-              ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
-            FROM grouped
-            ORDER BY total_bruksareal DESC, occupancy_category
-            LIMIT ?
-            """,
-            params=[kommune_name, resolved_limit],
-            limit=resolved_limit,
+        by_category_rows = _prepared_objects(
+            "occupancy_by_category", [kommune_name, resolved_limit], resolved_limit
         )
-        top_by_count = sorted(
-            [dict(row) for row in by_category_rows],
-            key=lambda row: (-_to_float(row.get("building_count")), -_to_float(row.get("total_bruksareal"))),
-        )[:10]
+        top_by_count = _prepared_objects("occupancy_top_by_count", [kommune_name, 10], 10)
         return {
             "by_category": by_category_rows,
             "top_categories_by_area": by_category_rows[:10],
             "top_categories_by_count": top_by_count,
         }
 
+    @build_cache
     def _build_age_standard_proxy(kommune_name: str) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
-
-        tek_distribution_rows = _query_objects(
-            sql=f"""
-            WITH grouped AS (
-              SELECT
-                COALESCE("TEK-standard", 'MISSING') AS tek_standard,
-                COUNT(*) AS property_count,
-                SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-              GROUP BY 1
-            )
-            SELECT
-              tek_standard,
-              property_count,
-              total_bruksareal,
-              ROUND(100.0 * property_count / NULLIF(SUM(property_count) OVER (), 0), 2) AS property_share_percent,
-              ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
-            FROM grouped
-            ORDER BY total_bruksareal DESC, tek_standard
-            """,
-            params=[kommune_name],
-            limit=200,
-        )
-        age_band_rows = _query_objects(
-            sql=f"""
-            WITH grouped AS (
-              SELECT
-                CASE
-                  WHEN "TEK-standard" IN ('TEK17', 'TEK10') THEN '2010+'
-                  WHEN "TEK-standard" IN ('TEK07', 'TEK97') THEN '1997-2009'
-                  WHEN "TEK-standard" LIKE 'BF%' THEN 'Pre-1997'
-                  ELSE 'Unknown'
-                END AS age_band,
-                COUNT(*) AS property_count,
-                SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-              GROUP BY 1
-            )
-            SELECT
-              age_band,
-              property_count,
-              total_bruksareal,
-              ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
-            FROM grouped
-            ORDER BY
-              CASE age_band
-                WHEN 'Pre-1997' THEN 1
-                WHEN '1997-2009' THEN 2
-                WHEN '2010+' THEN 3
-                ELSE 4
-              END
-            """,
-            params=[kommune_name],
-            limit=50,
-        )
+        # Both distributions come from one GROUPING SETS scan; each row
+        # belongs to whichever dimension is non-NULL.
+        rows = _prepared_objects("age_standard_proxy", [kommune_name], 250)
+        tek_distribution_rows: list[dict[str, Any]] = []
+        age_band_rows: list[dict[str, Any]] = []
+        for row in rows:
+            if row.get("tek_standard") is not None:
+                row.pop("age_band", None)
+                tek_distribution_rows.append(row)
+            else:
+                row.pop("tek_standard", None)
+                row.pop("property_share_percent", None)
+                age_band_rows.append(row)
         return {
             "tek_distribution": tek_distribution_rows,
             "age_band_distribution": age_band_rows,
         }
 
+    @build_cache
     def _build_status_underwriting(kommune_name: str, limit: int = 50) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
         resolved_limit = _validate_limit(limit)
 
-        distribution_rows = _query_objects(
-            sql=f"""
-            WITH grouped AS (
-              SELECT
-                COALESCE("Bygningsstatus", 'MISSING') AS bygningsstatus,
-                COUNT(*) AS property_count,
-                SUM(COALESCE("BruksarealTotalt", 0)) AS total_bruksareal
-              FROM main.properties
-              WHERE {kommune_expr} = {param_expr}
-              GROUP BY 1
-            )
-            SELECT
-              bygningsstatus,
-              property_count,
-              total_bruksareal,
-              ROUND(100.0 * property_count / NULLIF(SUM(property_count) OVER (), 0), 2) AS property_share_percent,
-              ROUND(100.0 * total_bruksareal / NULLIF(SUM(total_bruksareal) OVER (), 0), 2) AS area_share_percent
-            FROM grouped
-            ORDER BY total_bruksareal DESC, bygningsstatus
-            """,
-            params=[kommune_name],
-            limit=100,
-        )
-        problematic_rows = _query_objects(
-            sql=f"""
-            SELECT
-              kommune,
-              COALESCE("Adresse", "Adressenavn", '-') AS address_label,
-              "Forenklet Bygningskategori" AS occupancy_category,
-              "Bygningsstatus" AS bygningsstatus,
-              "TEK-standard" AS tek_standard,
-              COALESCE("BruksarealTotalt", 0) AS total_bruksareal
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-              AND (
-                LOWER(COALESCE("Bygningsstatus", '')) LIKE '%riving%'
-                OR LOWER(COALESCE("Bygningsstatus", '')) LIKE '%brenning%'
-                OR LOWER(COALESCE("Bygningsstatus", '')) LIKE '%kondemn%'
-                OR LOWER(COALESCE("Bygningsstatus", '')) LIKE '%ikke godkjent%'
-              )
-            ORDER BY total_bruksareal DESC, address_label
-            LIMIT ?
-            """,
-            params=[kommune_name, resolved_limit],
-            limit=resolved_limit,
+        distribution_rows = _prepared_objects("status_distribution", [kommune_name], 100)
+        problematic_rows = _prepared_objects(
+            "problematic_properties", [kommune_name, resolved_limit], resolved_limit
         )
         problematic_statuses = sorted(
-            {
-                str(row.get("bygningsstatus", "")).strip()
-                for row in distribution_rows
-                if any(
-                    token in str(row.get("bygningsstatus", "")).lower()
-                    for token in ("riving", "brenning", "kondemn", "ikke godkjent")
-                )
-            }
+            str(row.get("bygningsstatus", "")).strip()
+            for row in distribution_rows
+            if row.get("is_problematic")
         )
         return {
             "distribution": distribution_rows,
@@ -623,271 +1203,176 @@ def create_duckdb_mcp_server(
             "problematic_properties": problematic_rows,
         }
 
+    @build_cache
     def _build_large_risk_schedule(kommune_name: str, limit: int = 20) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
         resolved_limit = _validate_limit(limit)
 
-        rows = _query_objects(
-            sql=f"""
-            SELECT
-              kommune,
-              COALESCE("Adresse", "Adressenavn", '-') AS address_label,
-              "Forenklet Bygningskategori" AS occupancy_category,
-              "Bygningsstatus" AS bygningsstatus,
-              "TEK-standard" AS tek_standard,
-              COALESCE("BruksarealTotalt", 0) AS total_bruksareal
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-            ORDER BY total_bruksareal DESC, occupancy_category, address_label
-            LIMIT ?
-            """,
-            params=[kommune_name, resolved_limit],
-            limit=resolved_limit,
+        rows = _prepared_objects(
+            "large_risk_schedule", [kommune_name, resolved_limit], resolved_limit
         )
         for idx, row in enumerate(rows, start=1):
             row["rank"] = idx
         return {"rows": rows}
 
+    @build_cache
     def _build_heritage_flags(kommune_name: str, limit: int = 50) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
         resolved_limit = _validate_limit(limit)
 
-        rows = _query_objects(
-            sql=f"""
-            SELECT
-              kommune,
-              COALESCE("Adresse", "Adressenavn", '-') AS address_label,
-              "Forenklet Bygningskategori" AS occupancy_category,
-              COALESCE("BruksarealTotalt", 0) AS total_bruksareal,
-              COALESCE("HarSefrakminne", 0) AS har_sefrakminne,
-              COALESCE("HarKulturminne", 0) AS har_kulturminne,
-              COALESCE("Skjermingsverdig", 0) AS skjermingsverdig
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-              AND (
-                COALESCE("HarSefrakminne", 0) = 1
-                OR COALESCE("HarKulturminne", 0) = 1
-                OR COALESCE("Skjermingsverdig", 0) = 1
-              )
-            ORDER BY total_bruksareal DESC, address_label
-            LIMIT ?
-            """,
-            params=[kommune_name, resolved_limit],
-            limit=resolved_limit,
-        )
-        summary_row = _query_objects(
-            sql=f"""
-            SELECT
-              SUM(CASE WHEN COALESCE("HarSefrakminne", 0) = 1 THEN 1 ELSE 0 END) AS sefrak_count,
-              SUM(CASE WHEN COALESCE("HarKulturminne", 0) = 1 THEN 1 ELSE 0 END) AS kulturminne_count,
-              SUM(CASE WHEN COALESCE("Skjermingsverdig", 0) = 1 THEN 1 ELSE 0 END) AS skjermingsverdig_count
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-            """,
-            params=[kommune_name],
-            limit=1,
-        )[0]
+        rows = _prepared_objects("heritage_rows", [kommune_name, resolved_limit], resolved_limit)
+        summary_row = _prepared_one("heritage_summary", [kommune_name])
         return {
             "summary": {
-                "sefrak_count": _as_int(summary_row.get("sefrak_count")),
-                "kulturminne_count": _as_int(summary_row.get("kulturminne_count")),
-                "skjermingsverdig_count": _as_int(summary_row.get("skjermingsverdig_count")),
-                "any_flag_count": len(rows),
+                "sefrak_count": int(summary_row.get("sefrak_count") or 0),
+                "kulturminne_count": int(summary_row.get("kulturminne_count") or 0),
+                "skjermingsverdig_count": int(summary_row.get("skjermingsverdig_count") or 0),
+                "any_flag_count": int(summary_row.get("any_flag_count") or 0),
             },
             "rows": rows,
         }
 
+    @build_cache
     def _build_tenant_activity_proxy(kommune_name: str, limit: int = 20) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
         resolved_limit = _validate_limit(limit)
 
-        summary_row = _query_objects(
-            sql=f"""
-            SELECT
-              COUNT(*) AS total_properties,
-              SUM(CASE WHEN COALESCE("Antall Underenheter", 0) > 0 THEN 1 ELSE 0 END) AS with_tenants_count,
-              SUM(CASE WHEN COALESCE("Antall Underenheter", 0) > 0 THEN COALESCE("BruksarealTotalt", 0) ELSE 0 END) AS with_tenants_area,
-              MAX(COALESCE("Antall Underenheter", 0)) AS max_underenheter,
-              SUM(CASE WHEN COALESCE("AntallEiere", 0) > 1 THEN 1 ELSE 0 END) AS multi_owner_count
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-            """,
-            params=[kommune_name],
-            limit=1,
-        )[0]
-        top_rows = _query_objects(
-            sql=f"""
-            SELECT
-              kommune,
-              COALESCE("Adresse", "Adressenavn", '-') AS address_label,
-              "Forenklet Bygningskategori" AS occupancy_category,
-              COALESCE("Antall Underenheter", 0) AS antall_underenheter,
-              COALESCE("BruksarealTotalt", 0) AS total_bruksareal,
-              COALESCE("AntallEiere", 0) AS antall_eiere,
-              COALESCE("Underenheter", '') AS underenheter
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-              AND COALESCE("Antall Underenheter", 0) > 0
-            ORDER BY antall_underenheter DESC, total_bruksareal DESC, address_label
-            LIMIT ?
-            """,
-            params=[kommune_name, resolved_limit],
-            limit=resolved_limit,
+        summary_future = query_executor.submit(_prepared_one, "tenant_summary", [kommune_name])
+        top_rows_future = query_executor.submit(
+            _prepared_objects, "tenant_top_rows", [kommune_name, resolved_limit], resolved_limit
         )
-        total_properties = max(_as_int(summary_row.get("total_properties")), 1)
-        with_tenants_count = _as_int(summary_row.get("with_tenants_count"))
+        summary_row = summary_future.result()
+        top_rows = top_rows_future.result()
         return {
             "summary": {
-                "total_properties": _as_int(summary_row.get("total_properties")),
-                "with_tenants_count": with_tenants_count,
-                "with_tenants_share_percent": round(100.0 * with_tenants_count / total_properties, 2),
-                "with_tenants_area": _as_round(summary_row.get("with_tenants_area"), 1),
-                "max_underenheter": _as_int(summary_row.get("max_underenheter")),
-                "multi_owner_count": _as_int(summary_row.get("multi_owner_count")),
+                "total_properties": int(summary_row.get("total_properties") or 0),
+                "with_tenants_count": int(summary_row.get("with_tenants_count") or 0),
+                "with_tenants_share_percent": float(summary_row.get("with_tenants_share_percent") or 0),
+                "with_tenants_area": float(summary_row.get("with_tenants_area") or 0),
+                "max_underenheter": int(summary_row.get("max_underenheter") or 0),
+                "multi_owner_count": int(summary_row.get("multi_owner_count") or 0),
             },
             "top_rows": top_rows,
         }
 
+    @build_cache
     def _build_data_quality_score(kommune_name: str) -> dict[str, Any]:
-        kommune_expr = _normalized_kommune_expr("kommune")
-        param_expr = _normalized_kommune_expr("?")
-
-        quality_row = _query_objects(
-            sql=f"""
-            SELECT
-              COUNT(*) AS total_properties,
-              SUM(CASE WHEN COALESCE("BruksarealTotalt", 0) > 0 THEN 1 ELSE 0 END) AS area_valid_count,
-              SUM(CASE WHEN "Adresse" IS NOT NULL AND TRIM("Adresse") <> '' THEN 1 ELSE 0 END) AS address_present_count,
-              SUM(CASE WHEN "Lat" IS NOT NULL AND "Lon" IS NOT NULL THEN 1 ELSE 0 END) AS geo_present_count,
-              SUM(CASE WHEN "VannforsyningsKodeId" IS NOT NULL AND "AvlopsKodeId" IS NOT NULL THEN 1 ELSE 0 END) AS utilities_present_count,
-              SUM(CASE WHEN "OppvarmingsKodeIds" IS NOT NULL OR "EnergikildeKodeIds" IS NOT NULL THEN 1 ELSE 0 END) AS heating_energy_present_count,
-              SUM(CASE WHEN "Bygningsstatus" IS NOT NULL AND TRIM("Bygningsstatus") <> '' THEN 1 ELSE 0 END) AS status_present_count,
-              SUM(CASE WHEN "TEK-standard" IS NOT NULL AND TRIM("TEK-standard") <> '' THEN 1 ELSE 0 END) AS tek_present_count
-            FROM main.properties
-            WHERE {kommune_expr} = {param_expr}
-            """,
-            params=[kommune_name],
-            limit=1,
-        )[0]
-
-        total_properties = max(_as_int(quality_row.get("total_properties")), 1)
-        fields: list[dict[str, Any]] = [
-            {"field": "area_valid", "label": "Valid Area (>0)", "present_count": _as_int(quality_row.get("area_valid_count"))},
-            {"field": "address_present", "label": "Address", "present_count": _as_int(quality_row.get("address_present_count"))},
-            {"field": "geo_present", "label": "Lat/Lon", "present_count": _as_int(quality_row.get("geo_present_count"))},
-            {"field": "utilities_present", "label": "Water + Sewage", "present_count": _as_int(quality_row.get("utilities_present_count"))},
-            {
-                "field": "heating_energy_present",
-                "label": "Heating/Energy",
-                "present_count": _as_int(quality_row.get("heating_energy_present_count")),
-            },
-            {"field": "status_present", "label": "Building Status", "present_count": _as_int(quality_row.get("status_present_count"))},
-            {"field": "tek_present", "label": "TEK Standard", "present_count": _as_int(quality_row.get("tek_present_count"))},
-        ]
-        for entry in fields:
-            entry["completeness_percent"] = round(100.0 * entry["present_count"] / total_properties, 2)
-            entry["missing_count"] = total_properties - entry["present_count"]
-
-        score_fields = [
-            item
-            for item in fields
-            if item["field"] in {"area_valid", "address_present", "geo_present", "utilities_present", "heating_energy_present"}
-        ]
-        score_percent = round(
-            sum(float(item["completeness_percent"]) for item in score_fields) / max(len(score_fields), 1),
-            2,
-        )
+        quality_row = _prepared_one("data_quality", [kommune_name])
+
+        total_properties = int(quality_row.get("total_properties") or 0)
+        fields: list[dict[str, Any]] = []
+        for field, label in _DATA_QUALITY_FIELDS:
+            present_count = int(quality_row.get(f"{field}_count") or 0)
+            fields.append(
+                {
+                    "field": field,
+                    "label": label,
+                    "present_count": present_count,
+                    "completeness_percent": float(quality_row.get(f"{field}_percent") or 0),
+                    "missing_count": max(total_properties, 1) - present_count,
+                }
+            )
         return {
-            "score_percent": score_percent,
-            "total_properties": _as_int(quality_row.get("total_properties")),
+            "score_percent": float(quality_row.get("score_percent") or 0),
+            "total_properties": total_properties,
             "fields": fields,
-            "gaps": [item for item in fields if float(item["completeness_percent"]) < 90.0],
+            "gaps": [item for item in fields if item["completeness_percent"] < 90.0],
         }
 
+    def _invalidate_build_caches() -> None:
+        for cached_builder in (
+            _build_exposure_dashboard,
+            _build_occupancy_risk_mix,
+            _build_age_standard_proxy,
+            _build_status_underwriting,
+            _build_large_risk_schedule,
+            _build_heritage_flags,
+            _build_tenant_activity_proxy,
+            _build_data_quality_score,
+        ):
+            cache_clear = getattr(cached_builder, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
     def _build_underwriting_analytics(kommune_name: str) -> dict[str, Any]:
-        return {
-            "exposure_dashboard": _build_exposure_dashboard(kommune_name=kommune_name, top_n=10),
-            "occupancy_risk_mix": _build_occupancy_risk_mix(kommune_name=kommune_name, limit=30),
-            "age_standard_proxy": _build_age_standard_proxy(kommune_name=kommune_name),
-            "status_underwriting": _build_status_underwriting(kommune_name=kommune_name, limit=50),
-            "large_risk_schedule": _build_large_risk_schedule(kommune_name=kommune_name, limit=20),
-            "heritage_flags": _build_heritage_flags(kommune_name=kommune_name, limit=50),
-            "tenant_activity_proxy": _build_tenant_activity_proxy(kommune_name=kommune_name, limit=20),
-            "data_quality": _build_data_quality_score(kommune_name=kommune_name),
+        # Sections are independent; fanning them out costs one
+        # slowest-section latency instead of the sum of all eight.
+        section_futures = {
+            "exposure_dashboard": section_executor.submit(
+                _build_exposure_dashboard, kommune_name=kommune_name, top_n=10
+            ),
+            "occupancy_risk_mix": section_executor.submit(
+                _build_occupancy_risk_mix, kommune_name=kommune_name, limit=30
+            ),
+            "age_standard_proxy": section_executor.submit(
+                _build_age_standard_proxy, kommune_name=kommune_name
+            ),
+            "status_underwriting": section_executor.submit(
+                _build_status_underwriting, kommune_name=kommune_name, limit=50
+            ),
+            "large_risk_schedule": section_executor.submit(
+                _build_large_risk_schedule, kommune_name=kommune_name, limit=20
+            ),
+            "heritage_flags": section_executor.submit(
+                _build_heritage_flags, kommune_name=kommune_name, limit=50
+            ),
+            "tenant_activity_proxy": section_executor.submit(
+                _build_tenant_activity_proxy, kommune_name=kommune_name, limit=20
+            ),
+            "data_quality": section_executor.submit(
+                _build_data_quality_score, kommune_name=kommune_name
+            ),
         }
+        return {name: future.result() for name, future in section_futures.items()}
 
     def duckdb_kommune_exposure_dashboard(kommune_name: str, top_n: int = 10) -> dict[str, Any]:
         """Return core exposure KPIs and concentration metrics."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_exposure_dashboard(kommune_name=normalized, top_n=top_n)
         return {"kommune_name": normalized, "metric": "exposure_dashboard", "result": section}
 
     def duckdb_kommune_occupancy_risk_mix(kommune_name: str, limit: int = 30) -> dict[str, Any]:
         """Return occupancy category mix by both count share and area share."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_occupancy_risk_mix(kommune_name=normalized, limit=limit)
         return {"kommune_name": normalized, "metric": "occupancy_risk_mix", "result": section}
 
     def duckdb_kommune_age_standard_proxy(kommune_name: str) -> dict[str, Any]:
         """Return TEK and grouped age-band distributions."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_age_standard_proxy(kommune_name=normalized)
         return {"kommune_name": normalized, "metric": "age_standard_proxy", "result": section}
 
     def duckdb_kommune_status_underwriting(kommune_name: str, limit: int = 50) -> dict[str, Any]:
         """Return status mix and problematic-status property list."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_status_underwriting(kommune_name=normalized, limit=limit)
         return {"kommune_name": normalized, "metric": "status_underwriting", "result": section}
 
     def duckdb_kommune_large_risk_schedule(kommune_name: str, limit: int = 20) -> dict[str, Any]:
         """Return top-N largest properties for underwriting queueing."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_large_risk_schedule(kommune_name=normalized, limit=limit)
         return {"kommune_name": normalized, "metric": "large_risk_schedule", "result": section}
 
     def duckdb_kommune_heritage_flags(kommune_name: str, limit: int = 50) -> dict[str, Any]:
         """Return heritage/special-handling flag counts and affected properties."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_heritage_flags(kommune_name=normalized, limit=limit)
         return {"kommune_name": normalized, "metric": "heritage_flags", "result": section}
 
     def duckdb_kommune_tenant_activity_proxy(kommune_name: str, limit: int = 20) -> dict[str, Any]:
         """Return tenant and underenheter activity proxy metrics."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_tenant_activity_proxy(kommune_name=normalized, limit=limit)
         return {"kommune_name": normalized, "metric": "tenant_activity_proxy", "result": section}
 
     def duckdb_kommune_data_quality_score(kommune_name: str) -> dict[str, Any]:
         """Return data quality score and field-level completeness."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         section = _build_data_quality_score(kommune_name=normalized)
         return {"kommune_name": normalized, "metric": "data_quality", "result": section}
 
     def duckdb_kommune_underwriting_analytics(kommune_name: str) -> dict[str, Any]:
         """Return complete underwriting analytics package for one kommune."""
-        normalized = str(kommune_name or "").strip()
-        if not normalized:
-            raise ValueError("kommune_name is required.")
+        normalized = _clean_kommune(kommune_name)
         return {
             "kommune_name": normalized,
             "metric": "underwriting_analytics",
@@ -897,20 +1382,20 @@ def create_duckdb_mcp_server(
     @mcp.tool()
     def mcp_server_start(transport: str = "stdio", host: str = "127.0.0.1", port: int = 8200) -> dict[str, Any]:
         """Update runtime metadata to started state (server is already running in-process)."""
-        runtime_state.update({"running": True, "transport": transport, "host": host, "port": int(port)})
-        return {"status": "ok", "runtime": dict(runtime_state), "note": "In-process MCP server is already active."}
+        runtime = _update_runtime(running=True, transport=transport, host=host, port=int(port))
+        return {"status": "ok", "runtime": runtime, "note": "In-process MCP server is already active."}
 
     @mcp.tool()
     def mcp_server_stop() -> dict[str, Any]:
         """Update runtime metadata to stopped state (non-destructive/no process kill)."""
-        runtime_state["running"] = False
-        return {"status": "ok", "runtime": dict(runtime_state), "note": "State updated only; process not terminated."}
+        runtime = _update_runtime(running=False)
+        return {"status": "ok", "runtime": runtime, "note": "State updated only; process not terminated."}
 
     @mcp.tool()
     def mcp_server_status() -> dict[str, Any]:
         """Return MCP runtime metadata."""
         return {
-            "runtime": dict(runtime_state),
+            "runtime": runtime_snapshot,
             "tool_count": len(_tool_catalog()),
             "resource_count": len(_resource_catalog()),
             "published_tool_count": len(published_tools),
@@ -921,7 +1406,7 @@ def create_duckdb_mcp_server(
     def mcp_server_health() -> dict[str, Any]:
         """Return MCP + DuckDB health status."""
         return {
-            "runtime": dict(runtime_state),
+            "runtime": runtime_snapshot,
             "duckdb": duckdb_service.health(),
             "status": "ok",
         }
@@ -936,7 +1421,7 @@ def create_duckdb_mcp_server(
     def mcp_get_diagnostics() -> dict[str, Any]:
         """Return server diagnostics and selected configuration values."""
         return {
-            "runtime": dict(runtime_state),
+            "runtime": runtime_snapshot,
             "duckdb": duckdb_service.health(),
             "catalog": {"tools": len(_tool_catalog()), "resources": len(_resource_catalog())},
             "settings": {
@@ -987,6 +1472,7 @@ def create_duckdb_mcp_server(
             "name": name or uri,
             "description": description or "Published SQL-backed resource.",
         }
+        _invalidate_catalogs()
         return {"status": "ok", "uri": uri}
 
     @mcp.tool()
@@ -1008,6 +1494,7 @@ def create_duckdb_mcp_server(
             "name": name or target_uri,
             "description": description or f"Published table resource for {schema}.{relation}.",
         }
+        _invalidate_catalogs()
         return {"status": "ok", "uri": target_uri}
 
     @mcp.tool()
@@ -1016,6 +1503,7 @@ def create_duckdb_mcp_server(
         if not name.strip():
             raise ValueError("name is required.")
         published_tools[name] = {"description": description, "target_tool": target_tool}
+        _invalidate_catalogs()
         return {"status": "ok", "name": name}
 
     @mcp.tool()
@@ -1025,34 +1513,48 @@ def create_duckdb_mcp_server(
             raise ValueError("name is required.")
         if not template.strip():
             raise ValueError("template is required.")
-        prompt_templates[name] = {"template": template, "description": description}
+        prompt_templates[name] = {
+            "template": template,
+            "description": description,
+            "compiled": _compile_prompt_template(template),
+        }
+        catalog_cache["prompts"] = None
+        catalog_cache["prompt_templates"] = None
         return {"status": "ok", "name": name}
 
     @mcp.tool()
     def mcp_list_prompt_templates() -> list[dict[str, str]]:
         """List registered prompt templates."""
-        return [
+        cached = catalog_cache["prompt_templates"]
+        if cached is not None:
+            return cached
+        templates = [
             {"name": name, "description": value.get("description", ""), "template": value.get("template", "")}
             for name, value in sorted(prompt_templates.items())
         ]
+        catalog_cache["prompt_templates"] = templates
+        return templates
 
     @mcp.tool()
     def mcp_render_prompt_template(name: str, args: dict[str, Any] | None = None) -> dict[str, str]:
         """Render one prompt template with args."""
         if name not in prompt_templates:
             raise FileNotFoundError(f"Unknown prompt template: {name}")
-        template = prompt_templates[name]["template"]
-        rendered = template.format(**(args or {}))
+        rendered = prompt_templates[name]["compiled"](args or {})
         return {"name": name, "rendered": rendered}
 
     @mcp.tool()
     def mcp_list_prompts() -> list[dict[str, str]]:
         """List available prompt names."""
+        cached = catalog_cache["prompts"]
+        if cached is not None:
+            return cached
         prompts = [{"name": "db_schema_overview", "description": "Prompt for schema reconnaissance and safe querying."}]
         prompts.extend(
             {"name": name, "description": value.get("description", "")}
             for name, value in sorted(prompt_templates.items())
         )
+        catalog_cache["prompts"] = prompts
         return prompts
 
     @mcp.tool()
@@ -1080,8 +1582,8 @@ def create_duckdb_mcp_server(
     def mcp_reconnect_server(server: str | None = None) -> dict[str, Any]:
         """Reconnect/refresh server state (no-op for local in-process runtime)."""
         _ = server
-        runtime_state["running"] = True
-        return {"status": "ok", "runtime": dict(runtime_state)}
+        runtime = _update_runtime(running=True)
+        return {"status": "ok", "runtime": runtime}
 
     @mcp.tool()
     def mcp_call_tool(server: str | None = None, tool: str = "", args: Any = None) -> dict[str, Any]:
@@ -1097,21 +1599,28 @@ def create_duckdb_mcp_server(
         if published and published.get("target_tool"):
             name = str(published["target_tool"])
 
-        if name not in tool_dispatch:
+        entry = frozen_dispatch.get(name)
+        if entry is None:
             raise FileNotFoundError(f"Unknown tool: {name}")
+        handler, accepted_params = entry
 
         payload = _normalize_args(args)
+        if accepted_params is not None:
+            unexpected = payload.keys() - accepted_params
+            if unexpected:
+                raise ValueError(
+                    f"Invalid args for tool `{name}`: unexpected {sorted(unexpected)}"
+                )
         try:
-            result = tool_dispatch[name](**payload)
+            result = handler(**payload)
         except TypeError as exc:
             raise ValueError(f"Invalid args for tool `{name}`: {exc}") from exc
         return {"tool": name, "result": result}
 
-    @mcp.tool()
-    def mcp_server_send_request(method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Route a low-level request to server helper methods."""
-        payload = params or {}
-        routes: dict[str, Callable[..., Any]] = {
+    # Route table built once; the per-call dict construction added nothing
+    # since the set of helper methods is fixed at startup.
+    send_request_routes: MappingProxyType[str, Callable[..., Any]] = MappingProxyType(
+        {
             "mcp_list_tools": mcp_list_tools,
             "mcp_list_resources": mcp_list_resources,
             "mcp_get_resource": mcp_get_resource,
@@ -1121,9 +1630,15 @@ def create_duckdb_mcp_server(
             "mcp_server_test": mcp_server_test,
             "mcp_get_diagnostics": mcp_get_diagnostics,
         }
-        if method not in routes:
+    )
+
+    @mcp.tool()
+    def mcp_server_send_request(method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Route a low-level request to server helper methods."""
+        handler = send_request_routes.get(method)
+        if handler is None:
             raise ValueError(f"Unsupported method: {method}")
-        return {"method": method, "result": routes[method](**payload)}
+        return {"method": method, "result": handler(**(params or {}))}
 
     tool_dispatch.update(
         {
@@ -1165,6 +1680,21 @@ def create_duckdb_mcp_server(
         }
     )
 
+    def _accepted_params(handler: Callable[..., Any]) -> frozenset[str] | None:
+        try:
+            return frozenset(inspect.signature(handler).parameters)
+        except (TypeError, ValueError):  # pragma: no cover - wrapped callables
+            return None
+
+    # Frozen dispatch with each tool's accepted kwargs computed once, so
+    # per-call argument validation is a set difference rather than a raised
+    # and re-wrapped TypeError.
+    frozen_dispatch: MappingProxyType[str, tuple[Callable[..., Any], frozenset[str] | None]] = (
+        MappingProxyType(
+            {name: (handler, _accepted_params(handler)) for name, handler in tool_dispatch.items()}
+        )
+    )
+
     @mcp.resource("duckdb://health")
     def duckdb_health_resource() -> str:
         """Expose DuckDB health as an MCP resource."""
@@ -6,30 +6,67 @@ This module provides functionality for:
 2. Loading pre-filtered BuildingOwnership data
 3. Building a processed dataset (Knr-Gnr-Bnr, Adresse, TEK, simplified category)
 """
+import atexit
+import functools
 import io
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, NamedTuple
+from typing import Literal
 
 import pandas as pd
 
+try:  # pragma: no cover - optional fast Excel engine
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE: str | None = "calamine"
+except ModuleNotFoundError:  # pragma: no cover - depends on local env
+    _EXCEL_ENGINE = None
+
+try:  # pragma: no cover - optional columnar cache format
+    import pyarrow  # noqa: F401
+
+    _FEATHER_CACHE_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover - depends on local env
+    _FEATHER_CACHE_AVAILABLE = False
+
 from app.core.columns import Col
 from app.utils.dataframe import df_to_json_safe, merge_underenheter_by_group
-from app.utils.cache import calculate_file_hash, get_kartverket_cached_result, save_kartverket_cache
-from app.utils.google_maps import add_google_maps_link_for_kartverket
-from app.utils.tek_standards import add_tek_standard_columns
+from app.utils.cache import (
+    calculate_file_hash_stream,
+    get_kartverket_cached_result,
+    kartverket_cache_frame_path,
+    save_kartverket_cache,
+)
 from app.modules.matrikkel.codes import (
     EXCLUDED_BUILDING_STATUS_CODE_IDS,
     INCLUDED_BUILDING_STATUS_CODE_IDS,
     INTERNAL_ID_TO_NS3457,
+    SIMPLIFIED_CATEGORY_FALLBACK,
     get_building_type_hierarchy,
-    get_simplified_building_category,
-    normalize_simplified_building_category,
+    simplified_categories_for_codes,
+    simplified_category_values,
+    translate_internal_ids,
 )
 
 logger = logging.getLogger(__name__)
 
+# Placeholder tokens treated as missing when filling category columns.
+_MISSING_VALUE_TOKENS = ("", "-", "nan", "<na>", "none", "null")
+
+# Hierarchy names resolved once per internal building-type ID so the per-row
+# work in add_simplified_category_column is a C-level Series.map.
+_HIERARCHY_BY_INTERNAL_ID = {
+    internal_id: get_building_type_hierarchy(internal_id)
+    for internal_id in INTERNAL_ID_TO_NS3457
+}
+_HOVEDGRUPPE_BY_INTERNAL_ID = {k: v[0] for k, v in _HIERARCHY_BY_INTERNAL_ID.items()}
+_BYGNINGSGRUPPE_BY_INTERNAL_ID = {k: v[1] for k, v in _HIERARCHY_BY_INTERNAL_ID.items()}
+_BYGNINGSTYPE_BY_INTERNAL_ID = {k: v[2] for k, v in _HIERARCHY_BY_INTERNAL_ID.items()}
+
 # Cache schema version to invalidate stale Kartverket caches when processing changes.
 KARTVERKET_CACHE_VERSION = "2026-02-10-category-fallback-annet-v4"
 
@@ -49,21 +86,47 @@ def resolve_kartverket_source_dir(data_source: KartverketDataSource) -> Path:
     return KARTVERKET_DIR if data_source == "raw" else KARTVERKET_IMPUTED_DIR
 
 
-class KartverketDataset(NamedTuple):
-    """Container for processed Kartverket data."""
+@dataclass
+class KartverketDataset:
+    """Container for processed Kartverket data.
+
+    The deduplicated views are built lazily on first access and memoized;
+    most consumers only read ``data_df`` and ``statistics``, so the merge
+    work is deferred until somebody actually asks for a dedup view.
+    """
     data_df: pd.DataFrame
-    data_dedup_df: pd.DataFrame
     unfiltered_df: pd.DataFrame
-    unfiltered_dedup_df: pd.DataFrame
     excluded_status_df: pd.DataFrame
-    excluded_status_dedup_df: pd.DataFrame
     statistics: dict
     file_path: Path
 
+    @functools.cached_property
+    def data_dedup_df(self) -> pd.DataFrame:
+        dedup = _build_deduplicated_dataframe(self.data_df)
+        self.statistics.setdefault("deduplicated_rows", len(dedup))
+        return dedup
+
+    @functools.cached_property
+    def unfiltered_dedup_df(self) -> pd.DataFrame:
+        dedup = _build_deduplicated_dataframe(self.unfiltered_df)
+        self.statistics.setdefault("unfiltered_deduplicated_rows", len(dedup))
+        return dedup
+
+    @functools.cached_property
+    def excluded_status_dedup_df(self) -> pd.DataFrame:
+        dedup = _build_deduplicated_dataframe(self.excluded_status_df)
+        self.statistics.setdefault("excluded_status_deduplicated_rows", len(dedup))
+        return dedup
+
+
+# Shared translation table for the name normalizers; str.translate avoids the
+# intermediate string that str.replace allocates on every call.
+_UNDERSCORE_TO_SPACE = str.maketrans({"_": " "})
+
 
 def _normalize_kommune_name(value: str) -> str:
     """Normalize kommune names for matching against filenames."""
-    return " ".join(str(value).replace("_", " ").split()).strip().lower()
+    return " ".join(str(value).translate(_UNDERSCORE_TO_SPACE).split()).lower()
 
 
 def _extract_kommune_candidates(stem: str) -> list[str]:
@@ -105,6 +168,41 @@ def _extract_kommune_candidates(stem: str) -> list[str]:
     return candidates
 
 
+@functools.lru_cache(maxsize=8)
+def _list_kartverket_files(source_root: Path, mtime_ns: int) -> tuple[Path, ...]:
+    """List kommune Properties files in one scandir pass.
+
+    Cached per (directory, exact mtime) so repeated lookups within a session
+    avoid re-walking a directory that holds hundreds of kommune exports while
+    any directory change invalidates the listing immediately. The mtime
+    argument exists purely to expire the cache; see find_kartverket_file.
+    """
+    files: list[Path] = []
+    with os.scandir(source_root) as entries:
+        for entry in entries:
+            name = entry.name
+            # Skip temporary Excel lock files
+            if name.startswith("~$"):
+                continue
+            if name.endswith("_Properties.xlsx") or name.endswith("_Properties_Imputed.xlsx"):
+                files.append(Path(entry.path))
+    return tuple(sorted(files))
+
+
+@functools.lru_cache(maxsize=8)
+def _kartverket_file_index(source_root: Path, mtime_ns: int) -> dict[str, tuple[Path, ...]]:
+    """Inverted index of normalized kommune candidate -> matching files.
+
+    Candidate extraction is O(files) of string work; building the index once
+    per listing makes each kommune lookup a dict probe instead of a rescan.
+    """
+    index: dict[str, list[Path]] = {}
+    for file_path in _list_kartverket_files(source_root, mtime_ns):
+        for candidate in _extract_kommune_candidates(file_path.stem):
+            index.setdefault(candidate, []).append(file_path)
+    return {candidate: tuple(paths) for candidate, paths in index.items()}
+
+
 def find_kartverket_file(kommune_name: str, source_dir: Path | None = None) -> Path | None:
     """
     Find the Kartverket file for a given kommune.
@@ -128,20 +226,11 @@ def find_kartverket_file(kommune_name: str, source_dir: Path | None = None) -> P
     if not target:
         return None
 
-    matches: list[Path] = []
-
-    matched_paths: list[Path] = []
-    for pattern in ("*_Properties.xlsx", "*_Properties_Imputed.xlsx"):
-        matched_paths.extend(source_root.glob(pattern))
-
-    for file_path in sorted(set(matched_paths)):
-        # Skip temporary Excel lock files
-        if file_path.name.startswith("~$"):
-            continue
-
-        candidates = _extract_kommune_candidates(file_path.stem)
-        if target in candidates:
-            matches.append(file_path)
+    # The directory is stat'ed on every lookup, so keying on the exact mtime
+    # invalidates the cached index on any change; a bucketed key could pin a
+    # stale listing when a change landed inside the cached bucket.
+    mtime_ns = source_root.stat().st_mtime_ns
+    matches = _kartverket_file_index(source_root, mtime_ns).get(target, ())
 
     if not matches:
         return None
@@ -154,16 +243,95 @@ def find_kartverket_file(kommune_name: str, source_dir: Path | None = None) -> P
     return matches[0]
 
 
-def _read_kartverket_bytes(file_path: Path) -> tuple[bytes, str]:
-    """Read Kartverket Excel bytes and compute a content hash."""
-    file_bytes = file_path.read_bytes()
-    file_hash = calculate_file_hash(file_bytes)
-    return file_bytes, file_hash
+# Content hashes memoized per (mtime_ns, size) so hot cache probes skip
+# re-reading and re-hashing multi-MB Excel files.
+_FILE_HASH_CACHE: dict[Path, tuple[int, int, str]] = {}
+
+
+def _kartverket_file_hash(file_path: Path) -> str:
+    """Return the content hash of a file, reusing it while the file is unchanged."""
+    stat = file_path.stat()
+    cached = _FILE_HASH_CACHE.get(file_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    with file_path.open("rb") as fp:
+        file_hash = calculate_file_hash_stream(fp)
+    _FILE_HASH_CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+    return file_hash
+
+
+# Dtype hints for the columns the enrichment pipeline parses as text; keeps
+# read_excel from object-dtype inference and feeds the vectorized string
+# kernels directly. Entries for columns absent from a sheet are ignored.
+# Arrow-backed strings halve memory versus the default python backend and
+# speed up the str kernels, so prefer them whenever pyarrow is importable.
+_TEXT_DTYPE = "string[pyarrow]" if _FEATHER_CACHE_AVAILABLE else "string"
+_EXCEL_DTYPE_HINTS = {
+    Col.ALLE_EIERE: _TEXT_DTYPE,
+    Col.ALLE_EIERFORHOLD_KODE_IDS: _TEXT_DTYPE,
+    Col.ALLE_EIERANDELER: _TEXT_DTYPE,
+    Col.ADRESSENAVN: _TEXT_DTYPE,
+    Col.POSTSTED: _TEXT_DTYPE,
+    Col.ADRESSER: _TEXT_DTYPE,
+    Col.DUPLIKAT_FLAGG: _TEXT_DTYPE,
+    Col.DUPLIKAT_GRUPPE: _TEXT_DTYPE,
+    Col.UNDERENHETER: _TEXT_DTYPE,
+}
 
 
 def _load_kartverket_dataframe(file_bytes: bytes) -> pd.DataFrame:
-    """Load BuildingOwnership sheet from raw Excel bytes."""
-    return pd.read_excel(io.BytesIO(file_bytes), sheet_name="BuildingOwnership")
+    """Load BuildingOwnership sheet from raw Excel bytes.
+
+    Uses the native calamine engine when python-calamine is installed;
+    parsing large kommune files with it is an order of magnitude faster
+    than the default openpyxl path.
+    """
+    engine_kwargs = {"engine": _EXCEL_ENGINE} if _EXCEL_ENGINE is not None else {}
+    try:
+        return pd.read_excel(
+            io.BytesIO(file_bytes),
+            sheet_name="BuildingOwnership",
+            dtype=_EXCEL_DTYPE_HINTS,
+            **engine_kwargs,
+        )
+    except (ValueError, TypeError):
+        # Fall back to full inference when a sheet's values clash with the hints.
+        return pd.read_excel(io.BytesIO(file_bytes), sheet_name="BuildingOwnership", **engine_kwargs)
+
+
+# Columns with few distinct values per kommune file; dictionary encoding
+# shrinks them dramatically and speeds up downstream groupby/isin work.
+# BygningsstatusKodeId stays numeric because the status split coerces it
+# with pd.to_numeric.
+_CATEGORICAL_COLUMNS = (
+    Col.POSTSTED,
+    Col.POSTNUMMER,
+    Col.HOVEDGRUPPE,
+    Col.BYGNINGSGRUPPE,
+    Col.BYGNINGSTYPE,
+    Col.FORENKLET_BYGNINGS_KATEGORI,
+)
+
+
+def _categorize_repeated_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast highly repeated columns to category dtype in place.
+
+    The simplified category column is seeded with the known closed set so
+    its integer codes stay stable across frames; source sheets can carry
+    extra category strings, which are appended rather than nulled out.
+    """
+    for col in _CATEGORICAL_COLUMNS:
+        if col not in df.columns:
+            continue
+        if col == Col.FORENKLET_BYGNINGS_KATEGORI:
+            known = simplified_category_values()
+            extras = sorted(
+                str(value) for value in set(df[col].dropna().unique()) - set(known)
+            )
+            df[col] = df[col].astype(pd.CategoricalDtype(categories=list(known) + extras))
+        else:
+            df[col] = df[col].astype("category")
+    return df
 
 
 def _apply_minimal_processing(df: pd.DataFrame) -> pd.DataFrame:
@@ -172,17 +340,27 @@ def _apply_minimal_processing(df: pd.DataFrame) -> pd.DataFrame:
 
     Adds computed columns needed for display but preserves all rows.
     """
+    # Imported lazily: the enrichment helpers only run on cache misses, so
+    # the cache-hit path skips their import cost.
+    from app.utils.google_maps import add_google_maps_link_for_kartverket
+    from app.utils.tek_standards import add_tek_standard_columns
+
     df = _fill_alt_addresses_from_cadastre(df)
     df = add_knr_gnr_bnr_column(df)
     df = add_address_column(df)
     df = add_google_maps_link_for_kartverket(df)
     df = add_tek_standard_columns(df)
     df = add_simplified_category_column(df)
+    df = _categorize_repeated_columns(df)
     return df
 
 
 def _process_kartverket_dataframe(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
     """Apply the Kartverket enrichment pipeline to a dataframe."""
+    # Imported lazily for the same reason as in _apply_minimal_processing.
+    from app.utils.google_maps import add_google_maps_link_for_kartverket
+    from app.utils.tek_standards import add_tek_standard_columns
+
     df = filter_kommune_hjemmelshaver_rows(df)
     df = _fill_alt_addresses_from_cadastre(df)
     df = add_knr_gnr_bnr_column(df)
@@ -193,6 +371,7 @@ def _process_kartverket_dataframe(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]
     df = add_google_maps_link_for_kartverket(df)
     df = add_tek_standard_columns(df)
     df = add_simplified_category_column(df)
+    df = _categorize_repeated_columns(df)
 
     statistics = {
         "total_rows": total_rows
@@ -219,69 +398,160 @@ def _cache_has_required_columns(cache_payload: dict) -> bool:
     return Col.FORENKLET_BYGNINGS_KATEGORI in columns
 
 
+# The base dataframe views persisted per cached Kartverket build; dedup
+# views are derived lazily from these and never cached.
+_CACHE_VIEWS = (
+    "data",
+    "unfiltered",
+    "excluded_status",
+)
+
+
+def _save_cache_frames(
+    frames: dict[str, pd.DataFrame],
+    file_hash: str,
+    kommune_name: str,
+    source: str,
+) -> dict[str, str] | None:
+    """Persist cached views as Feather sidecars; None when unavailable.
+
+    Columnar sidecars load in milliseconds, while rebuilding each view from
+    JSON row dicts goes through the slowest DataFrame constructor path.
+    """
+    if not _FEATHER_CACHE_AVAILABLE:
+        return None
+    written: dict[str, str] = {}
+    paths: list[Path] = []
+    try:
+        for view, frame in frames.items():
+            path = kartverket_cache_frame_path(file_hash, kommune_name, view, source=source)
+            paths.append(path)
+            frame.reset_index(drop=True).to_feather(path)
+            written[view] = path.name
+        return written
+    except Exception:
+        logger.warning("Feather cache write failed; falling back to JSON rows.", exc_info=True)
+        for path in paths:
+            path.unlink(missing_ok=True)
+        return None
+
+
+def _load_cache_frames(
+    cached: dict,
+    file_hash: str,
+    kommune_name: str,
+    source: str,
+) -> dict[str, pd.DataFrame] | None:
+    """Load cached views from Feather sidecars; None when unavailable."""
+    if not _FEATHER_CACHE_AVAILABLE or not isinstance(cached.get("frames"), dict):
+        return None
+    frames: dict[str, pd.DataFrame] = {}
+    try:
+        for view in _CACHE_VIEWS:
+            frames[view] = pd.read_feather(
+                kartverket_cache_frame_path(file_hash, kommune_name, view, source=source)
+            )
+        return frames
+    except Exception:
+        logger.warning("Feather cache read failed; rebuilding from source.", exc_info=True)
+        return None
+
+
+# Single background thread for cache persistence so callers are not blocked
+# on serialization and disk I/O; writes are atomic (tmp file + replace), so a
+# reader never sees a partial payload. Flushed on interpreter exit.
+_CACHE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kartverket-cache")
+atexit.register(_CACHE_WRITER.shutdown, wait=True)
+
+
+def _persist_cache(
+    frames: dict[str, pd.DataFrame],
+    statistics: dict,
+    file_hash: str,
+    kommune_name: str,
+    cache_source: str,
+) -> None:
+    """Write Feather sidecars and the cache payload; runs on _CACHE_WRITER."""
+    df = frames["data"]
+    frame_files = _save_cache_frames(frames, file_hash, kommune_name, cache_source)
+    if frame_files is not None:
+        cache_payload = {
+            "format": "feather",
+            "frames": frame_files,
+            # Row payload intentionally empty; the views live in the sidecars.
+            "data": [],
+            "columns": df.columns.tolist(),
+            "statistics": statistics,
+            "cache_version": KARTVERKET_CACHE_VERSION,
+        }
+    else:
+        cache_payload = {
+            "data": df_to_json_safe(df),
+            "columns": df.columns.tolist(),
+            "unfiltered": {
+                "data": df_to_json_safe(frames["unfiltered"]),
+                "columns": frames["unfiltered"].columns.tolist(),
+            },
+            "excluded_status": {
+                "data": df_to_json_safe(frames["excluded_status"]),
+                "columns": frames["excluded_status"].columns.tolist(),
+            },
+            "statistics": statistics,
+            "cache_version": KARTVERKET_CACHE_VERSION,
+        }
+    save_kartverket_cache(cache_payload, file_hash, kommune_name, source=cache_source)
+
+
+def flush_cache_writes() -> None:
+    """Block until every queued background cache write has finished.
+
+    The writer is a single FIFO thread, so waiting on a sentinel task means
+    all previously submitted persists have completed. Process-pool workers
+    must call this before returning: they exit via `os._exit`, which skips
+    the atexit shutdown and would drop in-flight cache writes.
+    """
+    _CACHE_WRITER.submit(lambda: None).result()
+
+
 def _build_deduplicated_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Build deduplicated Kartverket view by duplicate group and duplicate flag."""
     return merge_underenheter_by_group(df)
 
 
+# Frozen integer set so the status isin check hashes ints against ints
+# instead of comparing float64 NaN-coerced values per element.
+_INCLUDED_STATUS_CODE_IDS = frozenset(INCLUDED_BUILDING_STATUS_CODE_IDS)
+
+
 def split_excluded_status_rows(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Split dataframe into included rows (allowed status codes) and excluded-status rows."""
     if Col.BYGNINGSSTATUS_KODE_ID not in df.columns:
         return df, df.iloc[0:0].copy()
 
-    status_series = pd.to_numeric(df[Col.BYGNINGSSTATUS_KODE_ID], errors="coerce")
-    included_mask = status_series.isin(INCLUDED_BUILDING_STATUS_CODE_IDS)
-    included_df = df[included_mask].copy()
-    excluded_df = df[~included_mask].copy()
+    status_series = pd.to_numeric(df[Col.BYGNINGSSTATUS_KODE_ID], errors="coerce").astype("Int64")
+    included_mask = status_series.isin(_INCLUDED_STATUS_CODE_IDS).fillna(False).to_numpy(dtype=bool)
+    # Boolean take already yields fresh frames; no extra defensive copy needed.
+    included_df = df.iloc[included_mask]
+    excluded_df = df.iloc[~included_mask]
     return included_df, excluded_df
 
 
 def _normalize_owner_name(value: str) -> str:
     """Normalize owner names for case-insensitive matching."""
-    return " ".join(str(value).replace("_", " ").split()).strip().lower()
+    return " ".join(str(value).translate(_UNDERSCORE_TO_SPACE).split()).lower()
 
 
-def _split_ownership_values(value: object) -> list[str]:
-    """Split semicolon/comma-separated ownership values."""
-    if value is None or pd.isna(value):
-        return []
-    value_str = str(value).strip()
-    if value_str == "" or value_str == "-" or value_str.lower() in {"nan", "<na>"}:
-        return []
-    return [part.strip() for part in re.split(r"[;,]", value_str) if part.strip()]
-
-
-def _extract_code_ids(value: str) -> list[int]:
-    """Extract integer code IDs from a raw code string."""
-    if not value:
-        return []
-    codes: list[int] = []
-    for token in re.findall(r"\d+", str(value)):
-        try:
-            codes.append(int(token))
-        except ValueError:
-            continue
-    return codes
-
-
-def _parse_ownership_percent(value: object) -> float | None:
-    """Parse an ownership percentage value (e.g. '100.0%') into a float.
+def _explode_ownership_tokens(series: pd.Series) -> pd.Series:
+    """Explode a semicolon/comma-separated ownership column into tokens.
 
-    Returns None when the value is missing or cannot be parsed.
+    Returns a long Series indexed by the original row labels with one
+    stripped, non-empty token per entry; placeholder values produce no
+    tokens for their row.
     """
-    if value is None or pd.isna(value):
-        return None
-    value_str = str(value).strip()
-    if value_str == "" or value_str == "-" or value_str.lower() in {"nan", "<na>"}:
-        return None
-
-    match = re.search(r"-?\d+(?:\.\d+)?", value_str)
-    if not match:
-        return None
-    try:
-        return float(match.group(0))
-    except ValueError:
-        return None
+    cleaned = series.astype("string").str.strip()
+    placeholder = cleaned.isna() | cleaned.str.lower().isin(["", "-", "nan", "<na>"])
+    tokens = cleaned.mask(placeholder, "").str.split(r"[;,]", regex=True).explode().str.strip()
+    return tokens[tokens.notna() & (tokens != "")]
 
 
 def _is_value_present(value: object) -> bool:
@@ -330,100 +600,135 @@ def filter_kommune_hjemmelshaver_rows(df: pd.DataFrame) -> pd.DataFrame:
     else:
         kommune_norm = kommune_base
 
-    def should_keep(row: pd.Series) -> bool:
-        owners = _split_ownership_values(row.get(Col.ALLE_EIERE))
-        codes_raw = _split_ownership_values(row.get(Col.ALLE_EIERFORHOLD_KODE_IDS))
-        shares_raw = _split_ownership_values(row.get(Col.ALLE_EIERANDELER))
-
-        if not owners or not codes_raw or not shares_raw:
-            return False
-
-        # The owners/codes/shares lists are supposed to be aligned by index.
-        # If the lengths don't match, treat the row as malformed and drop it.
-        if len(owners) != len(codes_raw) or len(owners) != len(shares_raw):
-            return False
-
-        kommune_owner_indices = [
-            idx
-            for idx, owner in enumerate(owners)
-            if _normalize_owner_name(owner) == kommune_norm
-        ]
-        if not kommune_owner_indices:
-            return False
-
-        kommune_codes: list[int] = []
-        kommune_shares: list[float] = []
-        for owner_idx in kommune_owner_indices:
-            if owner_idx < len(codes_raw):
-                kommune_codes.extend(_extract_code_ids(codes_raw[owner_idx]))
-            if owner_idx < len(shares_raw):
-                share = _parse_ownership_percent(shares_raw[owner_idx])
-                if share is not None:
-                    kommune_shares.append(share)
-
-        if 0 not in kommune_codes:
-            return False
-
-        # Kommune must own at least 100% in total (duplicates allowed, but < 100% is removed).
-        kommune_total_share = sum(kommune_shares)
-        if kommune_total_share < 100.0 - 1e-6:
-            return False
-
-        # Parse total ownership across all owners; if shares can't be parsed, remove row (strict).
-        all_shares: list[float] = []
-        for raw in shares_raw:
-            parsed = _parse_ownership_percent(raw)
-            if parsed is None:
-                return False
-            all_shares.append(parsed)
-
-        total_share = sum(all_shares)
-        has_non_kommune_owner = any(_normalize_owner_name(owner) != kommune_norm for owner in owners)
-
-        if has_non_kommune_owner and total_share > 100.0 + 1e-6:
-            return False
-
-        return True
-
-    filtered = df[df.apply(should_keep, axis=1)].copy()
+    # Cheap prefilter: a row can only survive if the kommune name appears in
+    # its owners column at all, so explode/parse only those candidates. The
+    # pattern tolerates underscores and repeated whitespace between tokens,
+    # matching what the exact comparison below normalizes away.
+    pre_pattern = r"[\s_]+".join(re.escape(token) for token in kommune_norm.split())
+    pre_mask = df[Col.ALLE_EIERE].astype("string").str.contains(
+        pre_pattern, case=False, regex=True, na=False
+    )
+    candidates = df[pre_mask]
+    if candidates.empty:
+        logger.info(f"Filtered out {len(df)} rows where kommune ownership criteria not met.")
+        return df.iloc[0:0].copy()
+
+    owners = _explode_ownership_tokens(candidates[Col.ALLE_EIERE])
+    codes = _explode_ownership_tokens(candidates[Col.ALLE_EIERFORHOLD_KODE_IDS])
+    shares = _explode_ownership_tokens(candidates[Col.ALLE_EIERANDELER])
+
+    owner_counts = owners.groupby(level=0).size().reindex(candidates.index, fill_value=0)
+    code_counts = codes.groupby(level=0).size().reindex(candidates.index, fill_value=0)
+    share_counts = shares.groupby(level=0).size().reindex(candidates.index, fill_value=0)
+
+    # The owners/codes/shares lists are supposed to be aligned by index.
+    # Rows with empty or mismatched lists are malformed and dropped outright.
+    aligned_mask = (owner_counts > 0) & (owner_counts == code_counts) & (owner_counts == share_counts)
+    aligned_index = candidates.index[aligned_mask]
+
+    owners = owners.loc[owners.index.isin(aligned_index)]
+    codes = codes.loc[codes.index.isin(aligned_index)]
+    shares = shares.loc[shares.index.isin(aligned_index)]
+
+    if owners.empty:
+        keep_mask = pd.Series(False, index=df.index)
+    else:
+        is_kommune = (
+            owners.str.replace("_", " ", regex=False)
+            .str.replace(r"\s+", " ", regex=True)
+            .str.strip()
+            .str.lower()
+            == kommune_norm
+        )
+        # A zero ownership code is a maximal digit run equal to zero
+        # anywhere in the token.
+        has_zero_code = codes.str.contains(r"(?<!\d)0+(?!\d)", regex=True)
+        share_values = pd.to_numeric(
+            shares.str.extract(r"(-?\d+(?:\.\d+)?)", expand=False), errors="coerce"
+        )
+
+        # The three exploded Series share per-row lengths and ordering within
+        # aligned rows, so positional combination keeps owners, codes, and
+        # shares matched up without index alignment.
+        long = pd.DataFrame(
+            {
+                "is_kommune": is_kommune.to_numpy(dtype=bool),
+                "has_zero_code": has_zero_code.to_numpy(dtype=bool),
+                "share": share_values.to_numpy(dtype=float),
+            },
+            index=owners.index,
+        )
+        grouped = (
+            long.assign(
+                kommune_zero=long["is_kommune"] & long["has_zero_code"],
+                kommune_share=long["share"].where(long["is_kommune"]),
+                share_missing=long["share"].isna(),
+                non_kommune=~long["is_kommune"],
+            )
+            .groupby(level=0)
+            .agg(
+                kommune_present=("is_kommune", "any"),
+                kommune_zero=("kommune_zero", "any"),
+                kommune_share=("kommune_share", "sum"),
+                share_missing=("share_missing", "any"),
+                total_share=("share", "sum"),
+                non_kommune=("non_kommune", "any"),
+            )
+        )
+        keep = (
+            grouped["kommune_present"]
+            & grouped["kommune_zero"]
+            # Kommune must own at least 100% in total (duplicates allowed,
+            # but < 100% is removed).
+            & (grouped["kommune_share"] >= 100.0 - 1e-6)
+            # If any share can't be parsed, remove the row (strict).
+            & ~grouped["share_missing"]
+            & ~(grouped["non_kommune"] & (grouped["total_share"] > 100.0 + 1e-6))
+        )
+        keep_mask = keep.reindex(df.index, fill_value=False)
+
+    # The one copy for the filtered pipeline: the enrichment helpers that run
+    # after this filter mutate their input in place.
+    filtered = df[keep_mask].copy()
     removed = len(df) - len(filtered)
     if removed > 0:
         logger.info(f"Filtered out {removed} rows where kommune ownership criteria not met.")
     return filtered
 
 
-def _format_postnummer(value: object) -> str:
-    """Format Postnummer value, converting floats to integers."""
-    if not _is_value_present(value):
-        return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value))
-    return str(value).strip()
+def _present_mask(series: pd.Series) -> pd.Series:
+    """Vectorized `_is_value_present` over a column."""
+    cleaned = series.astype("string").str.strip()
+    return cleaned.notna() & ~cleaned.isin(["", "-", "nan", "<na>"])
 
 
-def _build_alt_address(row: pd.Series) -> str:
-    """Build a single formatted address for Alt. Adresser."""
-    if not _is_value_present(row.get(Col.ADRESSENAVN)):
-        return ""
+def _format_postnummer_series(series: pd.Series) -> pd.Series:
+    """Format a Postnummer column, converting integral floats to integers."""
+    formatted = format_nummer_series(series).str.strip()
+    return formatted.mask(~_present_mask(series), "")
 
-    address_name = str(row.get(Col.ADRESSENAVN)).strip()
-    number_value = row.get(Col.NUMMER)
-    if _is_value_present(number_value):
-        address = f"{address_name} {format_nummer(number_value)}".strip()
-    else:
-        address = address_name
 
-    postnummer_value = row.get(Col.POSTNUMMER)
-    postnummer = _format_postnummer(postnummer_value)
-    if postnummer:
-        address = f"{address}, {postnummer}"
+def _build_alt_address_series(df: pd.DataFrame) -> pd.Series:
+    """Build formatted Alt. Adresser values for every row at once."""
+    name = df[Col.ADRESSENAVN].astype("string").str.strip()
+    name_present = _present_mask(df[Col.ADRESSENAVN])
+    address = name.fillna("").where(name_present, "")
+
+    if Col.NUMMER in df.columns:
+        num_present = _present_mask(df[Col.NUMMER])
+        num_str = format_nummer_series(df[Col.NUMMER])
+        address = address.mask(name_present & num_present, (name + " " + num_str).str.strip())
 
-    poststed_value = row.get(Col.POSTSTED)
-    if _is_value_present(poststed_value):
-        poststed = str(poststed_value).strip()
-        address = f"{address} {poststed}"
+    if Col.POSTNUMMER in df.columns:
+        postnummer = _format_postnummer_series(df[Col.POSTNUMMER])
+        address = address.mask(name_present & (postnummer != ""), address + ", " + postnummer)
 
-    return address
+    if Col.POSTSTED in df.columns:
+        poststed = df[Col.POSTSTED].astype("string").str.strip()
+        poststed_present = _present_mask(df[Col.POSTSTED])
+        address = address.mask(name_present & poststed_present, address + " " + poststed)
+
+    return address.fillna("")
 
 
 def _fill_alt_addresses_from_cadastre(df: pd.DataFrame) -> pd.DataFrame:
@@ -431,8 +736,8 @@ def _fill_alt_addresses_from_cadastre(df: pd.DataFrame) -> pd.DataFrame:
     Fill Alt. Adresser for rows missing addresses using other rows with the same Knr-Gnr-Bnr.
 
     Adds a boolean column to flag rows where alternate addresses were populated.
+    Mutates ``df`` in place; callers own the copy (see build_kartverket_dataset).
     """
-    df = df.copy()
     flag_col = Col.ALT_ADRESSER_FRA_KNR_GNR_BNR
     df[flag_col] = False
 
@@ -442,14 +747,14 @@ def _fill_alt_addresses_from_cadastre(df: pd.DataFrame) -> pd.DataFrame:
     if Col.KNR_GNR_BNR in df.columns:
         key_series = df[Col.KNR_GNR_BNR]
     elif {Col.KOMMUNE_NR, Col.GARDS_NR, Col.BRUKS_NR}.issubset(df.columns):
-        key_series = df.apply(create_knr_gnr_bnr, axis=1)
+        key_series = _knr_gnr_bnr_series(df)
     else:
         return df
 
     key_series = key_series.fillna("").astype(str).str.strip()
-    key_valid_mask = key_series.apply(_is_value_present)
+    key_valid_mask = ~key_series.isin(["", "-", "nan", "<na>"])
 
-    address_series = df.apply(_build_alt_address, axis=1).fillna("").astype(str)
+    address_series = _build_alt_address_series(df).astype(str)
     has_address_mask = address_series.str.strip() != ""
 
     if not key_valid_mask.any() or not has_address_mask.any():
@@ -469,21 +774,23 @@ def _fill_alt_addresses_from_cadastre(df: pd.DataFrame) -> pd.DataFrame:
     if Col.ADRESSER not in df.columns:
         df[Col.ADRESSER] = ""
 
-    for idx in df.index[missing_mask]:
-        key = key_series.at[idx]
-        addresses = address_lookup.get(key, [])
-        if not addresses:
-            continue
+    # One lookup per missing row via map, then two vectorized assignments
+    # instead of scalar .at writes inside a Python loop.
+    fills = key_series[missing_mask].map(address_lookup)
+    fills = fills[fills.notna() & fills.astype(bool)]
+    if fills.empty:
+        return df
 
-        existing_value = df.at[idx, Col.ADRESSER]
-        existing = (
-            [addr.strip() for addr in str(existing_value).split(";") if addr.strip()]
-            if _is_value_present(existing_value)
-            else []
-        )
-        combined = list(dict.fromkeys(existing + addresses))
-        df.at[idx, Col.ADRESSER] = ";".join(combined)
-        df.at[idx, flag_col] = True
+    existing_lists = df.loc[fills.index, Col.ADRESSER].map(
+        lambda value: [addr.strip() for addr in str(value).split(";") if addr.strip()]
+        if _is_value_present(value)
+        else []
+    )
+    df.loc[fills.index, Col.ADRESSER] = [
+        ";".join(dict.fromkeys(existing + addresses))
+        for existing, addresses in zip(existing_lists, fills)
+    ]
+    df.loc[fills.index, flag_col] = True
 
     return df
 
@@ -511,7 +818,8 @@ def build_kartverket_dataset(kommune_name: str, source_dir: Path | None = None)
     if not file_path:
         return None
 
-    file_bytes, file_hash = _read_kartverket_bytes(file_path)
+    # Bytes are only read on a cache miss; hot probes cost one stat call.
+    file_hash = _kartverket_file_hash(file_path)
     cache_source = "imputed" if file_path.stem.lower().endswith("_properties_imputed") else "raw"
 
     cached = get_kartverket_cached_result(file_hash, kommune_name, source=cache_source)
@@ -520,51 +828,46 @@ def build_kartverket_dataset(kommune_name: str, source_dir: Path | None = None)
         and cached.get("cache_version") == KARTVERKET_CACHE_VERSION
         and _cache_has_required_columns(cached)
     ):
-        df = _dataframe_from_cache(cached)
-        df_unfiltered = _dataframe_from_cache(cached.get("unfiltered", cached))
-        cached_dedup = cached.get("deduplicated")
-        if isinstance(cached_dedup, dict) and "data" in cached_dedup:
-            df_dedup = _dataframe_from_cache(cached_dedup)
-        else:
-            df_dedup = _build_deduplicated_dataframe(df)
-
-        cached_unfiltered_dedup = cached.get("unfiltered_deduplicated")
-        if isinstance(cached_unfiltered_dedup, dict) and "data" in cached_unfiltered_dedup:
-            df_unfiltered_dedup = _dataframe_from_cache(cached_unfiltered_dedup)
-        else:
-            df_unfiltered_dedup = _build_deduplicated_dataframe(df_unfiltered)
-
-        cached_excluded_status = cached.get("excluded_status")
-        if isinstance(cached_excluded_status, dict) and "data" in cached_excluded_status:
-            df_excluded_status = _dataframe_from_cache(cached_excluded_status)
-        else:
-            df_excluded_status = df.iloc[0:0].copy()
-
-        cached_excluded_status_dedup = cached.get("excluded_status_deduplicated")
-        if isinstance(cached_excluded_status_dedup, dict) and "data" in cached_excluded_status_dedup:
-            df_excluded_status_dedup = _dataframe_from_cache(cached_excluded_status_dedup)
-        else:
-            df_excluded_status_dedup = _build_deduplicated_dataframe(df_excluded_status)
-
-        statistics = cached.get("statistics", {"total_rows": len(df)})
-        if "file_hash" not in statistics:
-            statistics["file_hash"] = file_hash[:8]
-        statistics.setdefault("deduplicated_rows", len(df_dedup))
-        statistics.setdefault("unfiltered_rows", len(df_unfiltered))
-        statistics.setdefault("unfiltered_deduplicated_rows", len(df_unfiltered_dedup))
-        statistics.setdefault("filtered_out_rows", len(df_unfiltered) - len(df))
-        statistics.setdefault("filtered_out_status_rows", len(df_excluded_status))
-        statistics.setdefault("excluded_status_rows", len(df_excluded_status))
-        statistics.setdefault("excluded_status_deduplicated_rows", len(df_excluded_status_dedup))
-        return KartverketDataset(
-            data_df=df,
-            data_dedup_df=df_dedup,
-            unfiltered_df=df_unfiltered,
-            unfiltered_dedup_df=df_unfiltered_dedup,
-            excluded_status_df=df_excluded_status,
-            excluded_status_dedup_df=df_excluded_status_dedup,
-            statistics=statistics,
-            file_path=file_path
+        frames = _load_cache_frames(cached, file_hash, kommune_name, cache_source)
+        if frames is None and cached.get("format") != "feather":
+            df = _dataframe_from_cache(cached)
+            df_unfiltered = _dataframe_from_cache(cached.get("unfiltered", cached))
+
+            cached_excluded_status = cached.get("excluded_status")
+            if isinstance(cached_excluded_status, dict) and "data" in cached_excluded_status:
+                df_excluded_status = _dataframe_from_cache(cached_excluded_status)
+            else:
+                df_excluded_status = df.iloc[0:0].copy()
+
+            frames = {
+                "data": df,
+                "unfiltered": df_unfiltered,
+                "excluded_status": df_excluded_status,
+            }
+
+        if frames is not None:
+            df = frames["data"]
+            df_unfiltered = frames["unfiltered"]
+            df_excluded_status = frames["excluded_status"]
+
+            statistics = cached.get("statistics", {"total_rows": len(df)})
+            if "file_hash" not in statistics:
+                statistics["file_hash"] = file_hash[:8]
+            statistics.setdefault("unfiltered_rows", len(df_unfiltered))
+            statistics.setdefault("filtered_out_rows", len(df_unfiltered) - len(df))
+            statistics.setdefault("filtered_out_status_rows", len(df_excluded_status))
+            statistics.setdefault("excluded_status_rows", len(df_excluded_status))
+            return KartverketDataset(
+                data_df=df,
+                unfiltered_df=df_unfiltered,
+                excluded_status_df=df_excluded_status,
+                statistics=statistics,
+                file_path=file_path
+            )
+        logger.warning(
+            "Feather cache sidecars unavailable for %s (%s). Rebuilding from source.",
+            kommune_name,
+            file_path.name,
         )
     elif cached and cached.get("cache_version") == KARTVERKET_CACHE_VERSION:
         logger.warning(
@@ -574,7 +877,7 @@ def build_kartverket_dataset(kommune_name: str, source_dir: Path | None = None)
         )
 
     logger.info(f"Loading Kartverket file: {file_path.name}")
-    data_df = _load_kartverket_dataframe(file_bytes)
+    data_df = _load_kartverket_dataframe(file_path.read_bytes())
     data_df.attrs["kommune_name"] = kommune_name
 
     # Process unfiltered data (minimal processing, no ownership filter)
@@ -585,55 +888,30 @@ def build_kartverket_dataset(kommune_name: str, source_dir: Path | None = None)
     # Process filtered data (with ownership filter)
     df, statistics = _process_kartverket_dataframe(data_df)
     df, df_excluded_status = split_excluded_status_rows(df)
-    df_dedup = _build_deduplicated_dataframe(df)
-    df_unfiltered_dedup = _build_deduplicated_dataframe(df_unfiltered)
-    df_excluded_status_dedup = _build_deduplicated_dataframe(df_excluded_status)
 
     # Update statistics with unfiltered counts
     statistics["file_hash"] = file_hash[:8]
-    statistics["deduplicated_rows"] = len(df_dedup)
     statistics["unfiltered_rows"] = len(df_unfiltered)
-    statistics["unfiltered_deduplicated_rows"] = len(df_unfiltered_dedup)
     statistics["filtered_out_rows"] = len(df_unfiltered) - len(df)
     statistics["filtered_out_status_rows"] = len(df_excluded_status)
     statistics["excluded_status_rows"] = len(df_excluded_status)
-    statistics["excluded_status_deduplicated_rows"] = len(df_excluded_status_dedup)
-
-    cache_payload = {
-        "data": df_to_json_safe(df),
-        "columns": df.columns.tolist(),
-        "deduplicated": {
-            "data": df_to_json_safe(df_dedup),
-            "columns": df_dedup.columns.tolist(),
-        },
-        "unfiltered": {
-            "data": df_to_json_safe(df_unfiltered),
-            "columns": df_unfiltered.columns.tolist(),
-        },
-        "unfiltered_deduplicated": {
-            "data": df_to_json_safe(df_unfiltered_dedup),
-            "columns": df_unfiltered_dedup.columns.tolist(),
-        },
-        "excluded_status": {
-            "data": df_to_json_safe(df_excluded_status),
-            "columns": df_excluded_status.columns.tolist(),
-        },
-        "excluded_status_deduplicated": {
-            "data": df_to_json_safe(df_excluded_status_dedup),
-            "columns": df_excluded_status_dedup.columns.tolist(),
-        },
-        "statistics": statistics,
-        "cache_version": KARTVERKET_CACHE_VERSION,
+
+    frames = {
+        "data": df,
+        "unfiltered": df_unfiltered,
+        "excluded_status": df_excluded_status,
     }
-    save_kartverket_cache(cache_payload, file_hash, kommune_name, source=cache_source)
+    # Fire-and-forget: the caller already has everything it needs, so the
+    # serialize+write cost overlaps with whatever it does next. A snapshot of
+    # the statistics is passed because lazy dedup access mutates the dict.
+    _CACHE_WRITER.submit(
+        _persist_cache, frames, dict(statistics), file_hash, kommune_name, cache_source
+    )
 
     return KartverketDataset(
         data_df=df,
-        data_dedup_df=df_dedup,
         unfiltered_df=df_unfiltered,
-        unfiltered_dedup_df=df_unfiltered_dedup,
         excluded_status_df=df_excluded_status,
-        excluded_status_dedup_df=df_excluded_status_dedup,
         statistics=statistics,
         file_path=file_path
     )
@@ -646,10 +924,28 @@ def create_knr_gnr_bnr(row: pd.Series) -> str:
     return ""
 
 
+def _knr_gnr_bnr_series(df: pd.DataFrame) -> pd.Series:
+    """Build Knr-Gnr-Bnr values for every row at once."""
+    out = pd.Series("", index=df.index, dtype="string")
+    if not {Col.KOMMUNE_NR, Col.GARDS_NR, Col.BRUKS_NR}.issubset(df.columns):
+        return out
+
+    knr = pd.to_numeric(df[Col.KOMMUNE_NR], errors="coerce")
+    gnr = pd.to_numeric(df[Col.GARDS_NR], errors="coerce")
+    bnr = pd.to_numeric(df[Col.BRUKS_NR], errors="coerce")
+    valid = knr.notna() & gnr.notna() & bnr.notna()
+    if valid.any():
+        out.loc[valid] = (
+            knr[valid].astype("int64").astype("string")
+            .str.cat(gnr[valid].astype("int64").astype("string"), sep="-")
+            .str.cat(bnr[valid].astype("int64").astype("string"), sep="-")
+        )
+    return out
+
+
 def add_knr_gnr_bnr_column(df: pd.DataFrame) -> pd.DataFrame:
-    """Add Knr-Gnr-Bnr column to dataframe."""
-    df = df.copy()
-    df[Col.KNR_GNR_BNR] = df.apply(create_knr_gnr_bnr, axis=1)
+    """Add Knr-Gnr-Bnr column to dataframe in place."""
+    df[Col.KNR_GNR_BNR] = _knr_gnr_bnr_series(df)
     return df
 
 
@@ -689,17 +985,25 @@ def format_nummer(value) -> str:
     return str(value)
 
 
+def format_nummer_series(series: pd.Series) -> pd.Series:
+    """Vectorized `format_nummer` over a house-number column."""
+    out = series.astype("string")
+    if pd.api.types.is_float_dtype(series):
+        integral = series.notna() & (series % 1 == 0)
+        if integral.any():
+            out.loc[integral] = series[integral].astype("Int64").astype("string")
+    return out.fillna("")
+
+
 def add_address_column(df: pd.DataFrame) -> pd.DataFrame:
-    """Add combined Adresse column from Adressenavn and Nummer."""
+    """Add combined Adresse column from Adressenavn and Nummer in place."""
     if Col.ADRESSENAVN not in df.columns or Col.NUMMER not in df.columns:
         return df
 
-    df = df.copy()
-    df[Col.ADRESSE] = df.apply(
-        lambda row: f"{row[Col.ADRESSENAVN]} {format_nummer(row[Col.NUMMER])}" if pd.notna(row[Col.ADRESSENAVN]) and pd.notna(row[Col.NUMMER])
-        else (row[Col.ADRESSENAVN] if pd.notna(row[Col.ADRESSENAVN]) else ""),
-        axis=1
-    )
+    name = df[Col.ADRESSENAVN].astype("string")
+    num_str = format_nummer_series(df[Col.NUMMER])
+    both = name.notna() & df[Col.NUMMER].notna()
+    df[Col.ADRESSE] = name.fillna("").mask(both, name + " " + num_str)
     return df
 
 def get_enriched_kartverket_data(
@@ -729,10 +1033,23 @@ def get_enriched_kartverket_data(
     return dataset.data_df, dataset.statistics
 
 
+def _coerce_code_series(series: pd.Series) -> pd.Series:
+    """Coerce a building-code column to nullable integers."""
+    numeric = pd.to_numeric(series, errors="coerce")
+    return numeric.where(numeric % 1 == 0).astype("Int64")
+
+
+def _missing_value_mask(series: pd.Series) -> pd.Series:
+    """Vectorized missing/placeholder detection for category columns."""
+    cleaned = series.astype("string").str.strip().str.lower()
+    return cleaned.isna() | cleaned.isin(_MISSING_VALUE_TOKENS)
+
+
 def add_simplified_category_column(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add building category names (Hovedgruppe/Bygningsgruppe/Bygningstype) and
-    simplified category based on available building type codes.
+    simplified category based on available building type codes. Mutates the
+    dataframe in place.
 
     Args:
         df: DataFrame with BygningstypeKodeSSB and/or BygningstypeKodeId columns
@@ -746,84 +1063,53 @@ def add_simplified_category_column(df: pd.DataFrame) -> pd.DataFrame:
     ):
         return df
 
-    df = df.copy()
-
-    def _safe_int(value: object) -> int | None:
-        if value is None:
-            return None
-        if isinstance(value, float) and pd.isna(value):
-            return None
-        if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                return None
-            value = stripped
-        try:
-            return int(float(value))
-        except (TypeError, ValueError):
-            return None
-
-    def _resolve_ssb_code(row: pd.Series) -> int | None:
-        ssb_code = _safe_int(row.get(Col.BYGNINGSTYPE_KODE_SSB))
-        if ssb_code is not None:
-            return ssb_code
-        internal_id = _safe_int(row.get(Col.BYGNINGSTYPE_KODE_ID))
-        if internal_id is None:
-            return None
-        return INTERNAL_ID_TO_NS3457.get(internal_id)
-
-    ssb_resolved = df.apply(_resolve_ssb_code, axis=1)
+    if Col.BYGNINGSTYPE_KODE_ID in df.columns:
+        internal_ids = _coerce_code_series(df[Col.BYGNINGSTYPE_KODE_ID])
+    else:
+        internal_ids = pd.Series(pd.NA, index=df.index, dtype="Int64")
+    # One NumPy gather instead of a per-row dict lookup; -1 marks unknown IDs.
+    ssb_codes = translate_internal_ids(internal_ids.fillna(-1).to_numpy(dtype="int64"))
+    ssb_from_id = pd.Series(ssb_codes, index=df.index, dtype="int64").astype("Int64")
+    ssb_from_id = ssb_from_id.mask(ssb_from_id == -1)
 
     if Col.BYGNINGSTYPE_KODE_SSB not in df.columns:
+        ssb_resolved = ssb_from_id
         df[Col.BYGNINGSTYPE_KODE_SSB] = ssb_resolved
     else:
-        existing_ssb = df[Col.BYGNINGSTYPE_KODE_SSB].apply(_safe_int)
+        existing_ssb = _coerce_code_series(df[Col.BYGNINGSTYPE_KODE_SSB])
+        ssb_resolved = existing_ssb.fillna(ssb_from_id)
         missing_ssb = existing_ssb.isna()
         df.loc[missing_ssb, Col.BYGNINGSTYPE_KODE_SSB] = ssb_resolved[missing_ssb]
 
-    def _resolve_hierarchy(row: pd.Series) -> tuple[str, str, str]:
-        internal_id = _safe_int(row.get(Col.BYGNINGSTYPE_KODE_ID))
-        result = get_building_type_hierarchy(internal_id) if internal_id is not None else ("", "", "")
-        if not isinstance(result, (tuple, list)) or len(result) != 3:
-            return ("", "", "")
-        return (result[0] or "", result[1] or "", result[2] or "")
-
-    hierarchy_values = df.apply(_resolve_hierarchy, axis=1)
-    hierarchy = pd.DataFrame(
-        hierarchy_values.tolist(),
-        index=df.index,
-        columns=[Col.HOVEDGRUPPE, Col.BYGNINGSGRUPPE, Col.BYGNINGSTYPE],
+    hierarchy_lookups = (
+        (Col.HOVEDGRUPPE, _HOVEDGRUPPE_BY_INTERNAL_ID),
+        (Col.BYGNINGSGRUPPE, _BYGNINGSGRUPPE_BY_INTERNAL_ID),
+        (Col.BYGNINGSTYPE, _BYGNINGSTYPE_BY_INTERNAL_ID),
     )
-
-    def _is_missing(value: object) -> bool:
-        if value is None:
-            return True
-        if isinstance(value, float) and pd.isna(value):
-            return True
-        if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"", "-", "nan", "<na>", "none", "null"}:
-                return True
-        return False
-
-    for col in (Col.HOVEDGRUPPE, Col.BYGNINGSGRUPPE, Col.BYGNINGSTYPE):
-        if col not in df.columns:
-            df[col] = ""
-        elif df[col].dtype != object:
-            df[col] = df[col].astype("object")
-        missing_mask = df[col].apply(_is_missing)
-        df.loc[missing_mask, col] = hierarchy.loc[missing_mask, col]
-
-    simplified = ssb_resolved.apply(lambda value: get_simplified_building_category(_safe_int(value)))
-    if Col.FORENKLET_BYGNINGS_KATEGORI not in df.columns:
-        df[Col.FORENKLET_BYGNINGS_KATEGORI] = simplified
+    for col, lookup in hierarchy_lookups:
+        mapped = internal_ids.map(lookup).fillna("")
+        if col in df.columns:
+            existing = df[col].astype("string")
+        else:
+            existing = pd.Series(pd.NA, index=df.index, dtype="string")
+        # Masked assignment in StringDtype; no object round-trip or scatter.
+        df[col] = existing.mask(_missing_value_mask(existing), mapped).fillna("").astype(object)
+
+    # One gather against the dense code->category table.
+    simplified = simplified_categories_for_codes(ssb_resolved)
+
+    # Fill missing values and normalize in one masked expression: existing
+    # values are stripped, placeholders take the derived category, and
+    # anything still missing collapses to the fallback.
+    if Col.FORENKLET_BYGNINGS_KATEGORI in df.columns:
+        existing = df[Col.FORENKLET_BYGNINGS_KATEGORI].astype("string").str.strip()
     else:
-        if df[Col.FORENKLET_BYGNINGS_KATEGORI].dtype != object:
-            df[Col.FORENKLET_BYGNINGS_KATEGORI] = df[Col.FORENKLET_BYGNINGS_KATEGORI].astype("object")
-        missing_mask = df[Col.FORENKLET_BYGNINGS_KATEGORI].apply(_is_missing)
-        df.loc[missing_mask, Col.FORENKLET_BYGNINGS_KATEGORI] = simplified[missing_mask]
-    df[Col.FORENKLET_BYGNINGS_KATEGORI] = df[Col.FORENKLET_BYGNINGS_KATEGORI].apply(
-        normalize_simplified_building_category
+        existing = pd.Series(pd.NA, index=df.index, dtype="string")
+    placeholder = existing.isna() | existing.str.lower().isin(_MISSING_VALUE_TOKENS)
+    df[Col.FORENKLET_BYGNINGS_KATEGORI] = (
+        existing.mask(placeholder, simplified)
+        .fillna(SIMPLIFIED_CATEGORY_FALLBACK)
+        .astype(object)
     )
 
     return df
@@ -32,8 +32,22 @@ Example:
     Kultur- og forskningsbygning > Bygning for religiøse aktiviteter > Kirke, kapell
 """
 
+import functools
+import json
+import math
+import sys
+from importlib.resources import files
+from types import MappingProxyType
 from typing import Any, Optional, Tuple
 
+import numpy as np
+import pandas as pd
+
+try:  # pragma: no cover - optional fast JSON parser
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on local env
+    orjson = None  # type: ignore[assignment]
+
 
 # =============================================================================
 # Internal ID to NS 3457 Mapping
@@ -177,6 +191,31 @@ INTERNAL_ID_TO_NS3457 = {
     127: 999,
 }
 
+# Dense LUT over the contiguous internal-ID domain (0-127) for bulk
+# translation; -1 encodes "no NS 3457 code". A NumPy gather over this array
+# replaces one Python dict lookup per row in batch pipelines.
+_NS3457_LUT = np.array(
+    [INTERNAL_ID_TO_NS3457.get(internal_id) or -1 for internal_id in range(128)],
+    dtype=np.int16,
+)
+
+
+def translate_internal_ids(internal_ids: np.ndarray) -> np.ndarray:
+    """
+    Translate an array of Kartverket internal IDs to NS 3457 codes.
+
+    Args:
+        internal_ids: Integer array of internal building type IDs.
+
+    Returns:
+        int16 array of NS 3457 codes; -1 marks unknown or out-of-range IDs.
+    """
+    ids = np.asarray(internal_ids).astype(np.intp, copy=False)
+    codes = np.full(ids.shape, -1, dtype=np.int16)
+    valid = (ids >= 0) & (ids < _NS3457_LUT.shape[0])
+    codes[valid] = _NS3457_LUT[ids[valid]]
+    return codes
+
 
 # =============================================================================
 # Building Type Codes (NS 3457 / SSB Classification)
@@ -190,7 +229,7 @@ INTERNAL_ID_TO_NS3457 = {
 #   Level 2 (codes 11-84): Bygningsgruppe - Building group
 #   Level 3 (codes 111-999): Bygningstype - Specific building type
 
-BUILDING_TYPE_CODES = {
+_BUILDING_TYPE_NAMES = {
     # -------------------------------------------------------------------------
     # Level 1 - Hovedgruppe (Main category)
     # -------------------------------------------------------------------------
@@ -460,6 +499,12 @@ BUILDING_TYPE_CODES = {
     999: "Ukjent bygningstype",
 }
 
+# Interned names let downstream equality checks short-circuit on identity;
+# the hierarchy LUT below inherits the interned objects.
+BUILDING_TYPE_CODES = MappingProxyType(
+    {code: sys.intern(name) for code, name in _BUILDING_TYPE_NAMES.items()}
+)
+
 
 # =============================================================================
 # Building Status Codes
@@ -467,7 +512,7 @@ BUILDING_TYPE_CODES = {
 # Note: For now these are the codes that we want in our analysis.
 # (keep: 2, 3, 4, 6, 7, 8, 13-18).
 
-BUILDING_STATUS_CODES = {
+BUILDING_STATUS_CODES = MappingProxyType({
     0: "Rammetillatelse",
     1: "Igangsettingstillatelse",
     2: "Midlertidig brukstillatelse",
@@ -487,14 +532,18 @@ BUILDING_STATUS_CODES = {
     16: "Bygg etablert som tilbygg på annen bygning",
     17: "Splitt bygning",
     18: "Data fra bygningsendring overført",
-}
+})
 
 # Status code groups used across Kartverket filtering and Gemini analysis.
-EXCLUDED_BUILDING_STATUS_CODE_IDS = (0, 1, 5, 9, 10, 11, 12)
-INCLUDED_BUILDING_STATUS_CODE_IDS = (2, 3, 4, 6, 7, 8, 13, 14, 15, 16, 17, 18)
+# Frozensets so membership checks are hashed rather than tuple scans.
+EXCLUDED_BUILDING_STATUS_CODE_IDS = frozenset({0, 1, 5, 9, 10, 11, 12})
+INCLUDED_BUILDING_STATUS_CODE_IDS = frozenset({2, 3, 4, 6, 7, 8, 13, 14, 15, 16, 17, 18})
+# Single walk over the status table with hashed probes; also keeps the
+# resulting dict in ascending code order.
 EXCLUDED_BUILDING_STATUS_CODES = {
-    code_id: BUILDING_STATUS_CODES[code_id]
-    for code_id in EXCLUDED_BUILDING_STATUS_CODE_IDS
+    code_id: status_name
+    for code_id, status_name in BUILDING_STATUS_CODES.items()
+    if code_id in EXCLUDED_BUILDING_STATUS_CODE_IDS
 }
 DEMOLITION_APPROVED_STATUS_CODE = 8
 DEMOLITION_APPROVED_STATUS_NAME = BUILDING_STATUS_CODES[DEMOLITION_APPROVED_STATUS_CODE]
@@ -507,19 +556,65 @@ DEMOLITION_APPROVED_STATUS_NAME = BUILDING_STATUS_CODES[DEMOLITION_APPROVED_STAT
 # Ownership type codes (EierforholdKode)
 # Based on Norwegian cadastral terminology
 
-OWNERSHIP_TYPE_CODES = {
+OWNERSHIP_TYPE_CODES = MappingProxyType({
     0: "Hjemmelshaver",
     1: "Kommune/offentlig eier",
     11: "Fester",
     18: "Rettighetsforhold",
     19: "Annet tinglyst eierforhold",
-}
+})
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+_EMPTY_HIERARCHY: Tuple[str, str, str] = ('', '', '')
+
+
+def _derive_building_type_hierarchy(ns3457_code: Optional[int]) -> Tuple[str, str, str]:
+    """Derive (level1, level2, level3) names from an NS 3457 code.
+
+    Parent codes fall out of integer division: code 671 -> level2 = 67,
+    level1 = 6. Runs once per code at import time to fill the hierarchy LUT.
+    """
+    if ns3457_code is None:
+        return _EMPTY_HIERARCHY
+
+    if 100 <= ns3457_code <= 999:
+        # Level 3 code (e.g., 111 -> level2=11, level1=1)
+        level3_code = ns3457_code
+        level2_code = ns3457_code // 10
+        level1_code = ns3457_code // 100
+    elif 10 <= ns3457_code <= 99:
+        # Level 2 code (e.g., 11 -> level1=1)
+        level3_code = None
+        level2_code = ns3457_code
+        level1_code = ns3457_code // 10
+    elif 0 <= ns3457_code <= 9:
+        # Level 1 code
+        level3_code = None
+        level2_code = None
+        level1_code = ns3457_code
+    else:
+        # Unknown structure
+        return (BUILDING_TYPE_CODES.get(ns3457_code, ''), '', '')
+
+    level1_name = BUILDING_TYPE_CODES.get(level1_code, '')
+    level2_name = BUILDING_TYPE_CODES.get(level2_code, '') if level2_code else ''
+    level3_name = BUILDING_TYPE_CODES.get(level3_code, '') if level3_code else ''
+
+    return (level1_name, level2_name, level3_name)
+
+
+# Hierarchy names resolved once per internal ID (0-127) at import time;
+# the public helpers below become plain index lookups.
+_HIERARCHY_LUT: Tuple[Tuple[str, str, str], ...] = tuple(
+    _derive_building_type_hierarchy(INTERNAL_ID_TO_NS3457.get(internal_id))
+    for internal_id in range(128)
+)
+
+
 def get_building_type_hierarchy(internal_id: Optional[int]) -> Tuple[str, str, str]:
     """
     Get the building type hierarchy (Level 1, 2, 3) from Kartverket's internal ID.
@@ -546,41 +641,9 @@ def get_building_type_hierarchy(internal_id: Optional[int]) -> Tuple[str, str, s
         >>> print(f"{level1} > {level2} > {level3}")
         Kultur- og forskningsbygning > Bygning for religiøse aktiviteter > Kirke, kapell
     """
-    if internal_id is None:
-        return ('', '', '')
-
-    # Convert internal ID to NS 3457 code
-    ns3457_code = INTERNAL_ID_TO_NS3457.get(internal_id)
-    if ns3457_code is None:
-        return ('', '', '')
-
-    # Derive parent codes from the NS 3457 code structure
-    code_str = str(ns3457_code)
-
-    if len(code_str) == 3:
-        # Level 3 code (e.g., 111 -> level2=11, level1=1)
-        level3_code = ns3457_code
-        level2_code = int(code_str[:2])
-        level1_code = int(code_str[0])
-    elif len(code_str) == 2:
-        # Level 2 code (e.g., 11 -> level1=1)
-        level3_code = None
-        level2_code = ns3457_code
-        level1_code = int(code_str[0])
-    elif len(code_str) == 1:
-        # Level 1 code
-        level3_code = None
-        level2_code = None
-        level1_code = ns3457_code
-    else:
-        # Unknown structure (e.g., 999)
-        return (BUILDING_TYPE_CODES.get(ns3457_code, ''), '', '')
-
-    level1_name = BUILDING_TYPE_CODES.get(level1_code, '')
-    level2_name = BUILDING_TYPE_CODES.get(level2_code, '') if level2_code else ''
-    level3_name = BUILDING_TYPE_CODES.get(level3_code, '') if level3_code else ''
-
-    return (level1_name, level2_name, level3_name)
+    if internal_id is None or not 0 <= internal_id < len(_HIERARCHY_LUT):
+        return _EMPTY_HIERARCHY
+    return _HIERARCHY_LUT[internal_id]
 
 
 def get_building_type_name(internal_id: Optional[int]) -> str:
@@ -603,9 +666,60 @@ def get_building_type_name(internal_id: Optional[int]) -> str:
         >>> get_building_type_name(1)
         'Enebolig'
     """
-    level1, level2, level3 = get_building_type_hierarchy(internal_id)
-    # Return the most specific level available
-    return level3 or level2 or level1
+    if internal_id is None or not 0 <= internal_id < len(_MOST_SPECIFIC_NAME_LUT):
+        return ''
+    return _MOST_SPECIFIC_NAME_LUT[internal_id]
+
+
+# Most specific name per internal ID; backs the vectorized series helper.
+_MOST_SPECIFIC_NAME_LUT = np.array(
+    [level3 or level2 or level1 for level1, level2, level3 in _HIERARCHY_LUT],
+    dtype=object,
+)
+
+
+def get_building_type_name_series(internal_ids: pd.Series) -> pd.Series:
+    """
+    Vectorized `get_building_type_name` over a column of internal IDs.
+
+    Collapses the per-row Python call into a single NumPy gather against the
+    precomputed name table.
+
+    Args:
+        internal_ids: Series of internal building type IDs (numeric or text).
+
+    Returns:
+        Series of building type names aligned with the input index; missing
+        or out-of-range IDs map to empty strings.
+    """
+    ids = pd.to_numeric(internal_ids, errors="coerce").fillna(-1).to_numpy(dtype="int64")
+    invalid = (ids < 0) | (ids >= len(_MOST_SPECIFIC_NAME_LUT))
+    names = np.where(invalid, "", _MOST_SPECIFIC_NAME_LUT[np.where(invalid, 0, ids)])
+    return pd.Series(names, index=internal_ids.index, dtype=object)
+
+
+# Dense NS 3457 code -> name array (codes are < 1000); one contiguous
+# object array indexable without hashing, for bulk lookups by code.
+_NS3457_NAME_LUT = np.array(
+    [BUILDING_TYPE_CODES.get(code, "") for code in range(1000)], dtype=object
+)
+
+
+def building_type_names_for_codes(ns3457_codes: pd.Series) -> pd.Series:
+    """
+    Vectorized NS 3457 code -> building type name lookup.
+
+    Args:
+        ns3457_codes: Series of NS 3457/SSB codes (numeric or text).
+
+    Returns:
+        Series of type names aligned with the input index; missing or
+        unknown codes map to empty strings.
+    """
+    codes = pd.to_numeric(ns3457_codes, errors="coerce").fillna(-1).to_numpy(dtype="int64")
+    invalid = (codes < 0) | (codes >= len(_NS3457_NAME_LUT))
+    names = np.where(invalid, "", _NS3457_NAME_LUT[np.where(invalid, 0, codes)])
+    return pd.Series(names, index=ns3457_codes.index, dtype=object)
 
 
 def get_building_status_name(status_code: Optional[int]) -> str:
@@ -642,44 +756,60 @@ def get_ownership_type_name(ownership_code: Optional[int]) -> str:
 # Simplified Building Category Mapping
 # =============================================================================
 
-import json
-from pathlib import Path
-
-_SIMPLIFIED_CATEGORY_MAPPING: dict[str, str] | None = None
 SIMPLIFIED_CATEGORY_FALLBACK = "Annet"
-_SIMPLIFIED_CATEGORY_MISSING_TOKENS = {"", "-", "nan", "<na>", "none", "null"}
+_SIMPLIFIED_CATEGORY_MISSING_TOKENS = frozenset({"", "-", "nan", "<na>", "none", "null"})
+# Real category names are longer than any missing token, so a length guard
+# skips the per-call lowercase allocation on the common path.
+_MISSING_TOKEN_MAX_LEN = max(len(token) for token in _SIMPLIFIED_CATEGORY_MISSING_TOKENS)
 
 
+@functools.cache
 def _load_simplified_category_mapping() -> dict[str, str]:
     """
     Load the code-to-category mapping from JSON file.
 
+    Memoized via functools.cache, which also makes first-load races between
+    concurrent requests harmless.
+
     Returns:
         Dictionary mapping NS 3457 codes (as strings) to Norwegian category names.
     """
-    global _SIMPLIFIED_CATEGORY_MAPPING
-    if _SIMPLIFIED_CATEGORY_MAPPING is None:
-        mapping_file = Path(__file__).parent / "building_category_mapping_simplified.json"
-        with open(mapping_file, encoding="utf-8") as f:
-            data = json.load(f)
-        _SIMPLIFIED_CATEGORY_MAPPING = data.get("code_to_category", {})
-    return _SIMPLIFIED_CATEGORY_MAPPING
+    raw = files(__package__).joinpath("building_category_mapping_simplified.json").read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data.get("code_to_category", {})
 
 
 def normalize_simplified_building_category(value: Any) -> str:
     """Normalize simplified category values and collapse missing placeholders to fallback."""
-    if value is None:
+    # Checks ordered for the common inputs: None/NA, then real strings
+    # (no str() round-trip), NaN floats last.
+    if value is None or value is pd.NA:
         return SIMPLIFIED_CATEGORY_FALLBACK
-
-    if isinstance(value, float) and value != value:
+    if isinstance(value, str):
+        normalized = value.strip()
+    elif isinstance(value, float) and math.isnan(value):
         return SIMPLIFIED_CATEGORY_FALLBACK
-
-    normalized = str(value).strip()
-    if normalized.lower() in _SIMPLIFIED_CATEGORY_MISSING_TOKENS:
+    else:
+        normalized = str(value).strip()
+    if (
+        len(normalized) <= _MISSING_TOKEN_MAX_LEN
+        and normalized.casefold() in _SIMPLIFIED_CATEGORY_MISSING_TOKENS
+    ):
         return SIMPLIFIED_CATEGORY_FALLBACK
     return normalized
 
 
+@functools.cache
+def _simplified_category_lut() -> np.ndarray:
+    """Dense NS 3457 code -> category array (codes are < 1000), built lazily."""
+    lut = np.full(1000, SIMPLIFIED_CATEGORY_FALLBACK, dtype=object)
+    for code_str, category in _load_simplified_category_mapping().items():
+        code = int(code_str)
+        if 0 <= code < len(lut):
+            lut[code] = category
+    return lut
+
+
 def get_simplified_building_category(ssb_code: Optional[int]) -> str:
     """
     Map NS 3457 building type code to simplified Norwegian category.
@@ -699,5 +829,72 @@ def get_simplified_building_category(ssb_code: Optional[int]) -> str:
     """
     if ssb_code is None:
         return SIMPLIFIED_CATEGORY_FALLBACK
-    mapping = _load_simplified_category_mapping()
-    return mapping.get(str(ssb_code), SIMPLIFIED_CATEGORY_FALLBACK)
+    lut = _simplified_category_lut()
+    code = int(ssb_code)
+    if 0 <= code < len(lut):
+        return lut[code]
+    return SIMPLIFIED_CATEGORY_FALLBACK
+
+
+def simplified_categories_for_codes(ssb_codes: pd.Series) -> pd.Series:
+    """
+    Vectorized `get_simplified_building_category` over a column of codes.
+
+    Args:
+        ssb_codes: Series of NS 3457/SSB codes (numeric or text).
+
+    Returns:
+        Series of category names aligned with the input index; missing or
+        out-of-range codes map to the fallback category.
+    """
+    lut = _simplified_category_lut()
+    codes = pd.to_numeric(ssb_codes, errors="coerce").fillna(-1).to_numpy(dtype="int64")
+    invalid = (codes < 0) | (codes >= len(lut))
+    categories = np.where(
+        invalid, SIMPLIFIED_CATEGORY_FALLBACK, lut[np.where(invalid, 0, codes)]
+    )
+    return pd.Series(categories, index=ssb_codes.index, dtype=object)
+
+
+@functools.cache
+def simplified_category_values() -> tuple[str, ...]:
+    """Sorted closed set of simplified category names, fallback included."""
+    return tuple(
+        sorted(set(_load_simplified_category_mapping().values()) | {SIMPLIFIED_CATEGORY_FALLBACK})
+    )
+
+
+@functools.cache
+def _internal_to_simplified_lut() -> np.ndarray:
+    """Fused internal ID -> simplified category table (one hop, not two)."""
+    category_lut = _simplified_category_lut()
+    return np.array(
+        [
+            category_lut[code] if code >= 0 else SIMPLIFIED_CATEGORY_FALLBACK
+            for code in _NS3457_LUT
+        ],
+        dtype=object,
+    )
+
+
+def simplified_categories_for_internal_ids(internal_ids: pd.Series) -> pd.Series:
+    """
+    Map a column of Kartverket internal IDs straight to simplified categories.
+
+    Fuses the internal-ID -> NS 3457 -> category translation into a single
+    gather for callers that never need the intermediate codes.
+
+    Args:
+        internal_ids: Series of internal building type IDs (numeric or text).
+
+    Returns:
+        Series of category names aligned with the input index; missing or
+        out-of-range IDs map to the fallback category.
+    """
+    fused = _internal_to_simplified_lut()
+    ids = pd.to_numeric(internal_ids, errors="coerce").fillna(-1).to_numpy(dtype="int64")
+    invalid = (ids < 0) | (ids >= len(fused))
+    categories = np.where(
+        invalid, SIMPLIFIED_CATEGORY_FALLBACK, fused[np.where(invalid, 0, ids)]
+    )
+    return pd.Series(categories, index=internal_ids.index, dtype=object)
@@ -9,10 +9,26 @@ This module provides caching functionality for:
 import hashlib
 import json
 import logging
+import os
+import re
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 from uuid import uuid4
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - orjson is in requirements
+    orjson = None
+
+try:
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover - zstandard is in requirements
+    zstandard = None
+
+# zstd level 3 compresses repetitive JSON rows ~5-10x at GB/s decode speed
+_ZSTD_LEVEL = 3
+
 logger = logging.getLogger(__name__)
 
 # Get the project root directory
@@ -26,6 +42,9 @@ USER_CACHE_DIR = CACHE_ROOT / "user"
 KARTVERKET_CACHE_DIR = CACHE_ROOT / "kartverket"
 KARTVERKET_IMPUTED_CACHE_DIR = CACHE_ROOT / "kartverket_imputed"
 MATCH_CACHE_DIR = CACHE_ROOT / "match"
+# Content-addressed store backing the named cache files via hardlinks, so
+# identical payloads cached under several names occupy the blob once.
+OBJECTS_DIR = CACHE_ROOT / "objects"
 
 # Ensure directories exist
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -35,6 +54,38 @@ KARTVERKET_IMPUTED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 MATCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# In-memory index of raw files keyed by (source_type, hash_prefix); legacy
+# files without a source segment in the name are indexed under source None.
+# Replaces the per-upload directory globs with O(1) lookups.
+_RAW_FILE_RE = re.compile(r".+_(excel|json|bigquery)_([0-9a-f]{8})\.")
+_LEGACY_RAW_FILE_RE = re.compile(r".+_([0-9a-f]{8})\.")
+_RAW_INDEX: dict[tuple[str | None, str], Path] = {}
+_RAW_INDEX_LOCK = threading.Lock()
+
+
+def _index_raw_file(path: Path) -> None:
+    """Register one raw file in the in-memory index (caller holds the lock)."""
+    match = _RAW_FILE_RE.match(path.name)
+    if match:
+        _RAW_INDEX[(match.group(1), match.group(2))] = path
+        return
+    legacy = _LEGACY_RAW_FILE_RE.match(path.name)
+    if legacy:
+        _RAW_INDEX.setdefault((None, legacy.group(1)), path)
+
+
+def _build_raw_index() -> None:
+    """Scan RAW_DATA_DIR once and populate the raw-file index."""
+    with _RAW_INDEX_LOCK:
+        _RAW_INDEX.clear()
+        for path in RAW_DATA_DIR.iterdir():
+            if path.is_file():
+                _index_raw_file(path)
+
+
+_build_raw_index()
+
+
 def calculate_file_hash(file_content: bytes) -> str:
     """
     Calculate SHA256 hash of file content for cache identification.
@@ -48,17 +99,55 @@ def calculate_file_hash(file_content: bytes) -> str:
     return hashlib.sha256(file_content).hexdigest()
 
 
-def write_json_atomic(path: Path, payload: Any) -> None:
-    """Write JSON atomically to avoid partial-file cache corruption."""
+def calculate_file_hash_stream(fp: BinaryIO) -> str:
+    """
+    Calculate SHA256 hash of an open binary file without loading it fully.
+
+    Args:
+        fp: Binary file object positioned at the start of the content
+
+    Returns:
+        Hex string of SHA256 hash
+    """
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(fp, "sha256").hexdigest()
+    digest = hashlib.sha256()
+    while chunk := fp.read(1 << 20):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_json_payload(payload: Any) -> bytes:
+    """Encode a payload to compact JSON bytes.
+
+    Caches are machine-read only, so skip pretty-printing; orjson's C
+    encoder is several times faster than the stdlib on large payloads.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write bytes atomically to avoid partial-file cache corruption."""
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
     try:
-        with tmp_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        tmp_path.replace(path)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
     finally:
-        if tmp_path.exists():
-            tmp_path.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write JSON atomically to avoid partial-file cache corruption."""
+    _write_bytes_atomic(path, _encode_json_payload(payload))
 
 
 def write_text_atomic(path: Path, content: str) -> None:
@@ -74,7 +163,11 @@ def write_text_atomic(path: Path, content: str) -> None:
             tmp_path.unlink(missing_ok=True)
 
 
-def normalize_rows_for_hashing(rows: list) -> list:
+# Fields that vary between uploads and must not influence the data hash.
+_VOLATILE_ROW_KEYS = frozenset({"uniqueRowID", "UniqueRowID", "unique_row_id"})
+
+
+def normalize_rows_for_hashing(rows: list) -> Iterator[dict]:
     """
     Normalize rows for consistent hashing by removing volatile fields.
 
@@ -82,14 +175,10 @@ def normalize_rows_for_hashing(rows: list) -> list:
         rows: List of row dictionaries
 
     Returns:
-        List of normalized row dictionaries (without uniqueRowID and other volatile fields)
+        Iterator of normalized row dictionaries (without uniqueRowID and other
+        volatile fields), yielded lazily so the full copy is never held in memory.
     """
-    normalized = []
-    for row in rows:
-        # Remove uniqueRowID and any other fields that might vary between uploads
-        normalized_row = {k: v for k, v in row.items() if k not in ['uniqueRowID', 'UniqueRowID', 'unique_row_id']}
-        normalized.append(normalized_row)
-    return normalized
+    return ({k: v for k, v in row.items() if k not in _VOLATILE_ROW_KEYS} for row in rows)
 
 
 def calculate_data_hash(rows: list) -> str:
@@ -103,9 +192,16 @@ def calculate_data_hash(rows: list) -> str:
         Hex string of SHA256 hash
     """
     normalized_rows = normalize_rows_for_hashing(rows)
-    sorted_rows = sorted(normalized_rows, key=lambda x: json.dumps(x, sort_keys=True))
-    data_str = json.dumps(sorted_rows, sort_keys=True)
-    return hashlib.sha256(data_str.encode()).hexdigest()
+    # Serialize each row exactly once and sort the encoded bytes directly;
+    # sorting with a json.dumps key would re-serialize rows O(N log N) times.
+    if orjson is not None:
+        encoded_rows = sorted(orjson.dumps(row, option=orjson.OPT_SORT_KEYS) for row in normalized_rows)
+    else:
+        encoded_rows = sorted(json.dumps(row, sort_keys=True).encode() for row in normalized_rows)
+    digest = hashlib.sha256()
+    for row_bytes in encoded_rows:
+        digest.update(row_bytes)
+    return digest.hexdigest()
 
 
 def _build_cache_filename(file_hash: str, kommune_name: str) -> str:
@@ -127,12 +223,23 @@ def _load_cached_result(
     if not cache_dir.exists():
         return None
     cache_path = cache_dir / _build_cache_filename(file_hash, kommune_name)
-    if not cache_path.exists():
-        return None
+    zst_path = cache_path.with_name(f"{cache_path.name}.zst")
 
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
+        # Compressed caches take precedence; plain .json remains readable for
+        # files written before compression (or without zstandard installed).
+        if zstandard is not None and zst_path.exists():
+            cache_path = zst_path
+            raw = zstandard.ZstdDecompressor().decompress(zst_path.read_bytes())
+        elif cache_path.exists():
+            raw = cache_path.read_bytes()
+        else:
+            return None
+
+        if orjson is not None:
+            cached_data = orjson.loads(raw)
+        else:
+            cached_data = json.loads(raw)
 
         # Validate basic structure
         if not isinstance(cached_data, dict):
@@ -156,12 +263,37 @@ def _load_cached_result(
 
 
 def _save_cached_result(cache_dir: Path, result_data: dict, file_hash: str, kommune_name: str) -> Path:
-    """Save processed result to a specific cache directory."""
+    """Save processed result to a specific cache directory.
+
+    The payload is stored content-addressed under OBJECTS_DIR and the named
+    cache file is a hardlink into it, so re-uploads that normalize to the
+    same content share one blob on disk.
+    """
     cache_dir.mkdir(parents=True, exist_ok=True)
     cache_filename = _build_cache_filename(file_hash, kommune_name)
+
+    data = _encode_json_payload(result_data)
+    # Content identity is the uncompressed JSON; the stored bytes may be zstd
+    digest = hashlib.sha256(data).hexdigest()
+    extension = ".json"
+    if zstandard is not None:
+        data = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+        extension = ".json.zst"
+        cache_filename = f"{cache_filename}.zst"
+
     cache_path = cache_dir / cache_filename
+    obj_path = OBJECTS_DIR / digest[:2] / f"{digest}{extension}"
+    if not obj_path.exists():
+        _write_bytes_atomic(obj_path, data)
 
-    write_json_atomic(cache_path, result_data)
+    tmp_link = cache_path.with_name(f".{cache_path.name}.{uuid4().hex}.tmp")
+    try:
+        os.link(obj_path, tmp_link)
+        os.replace(tmp_link, cache_path)
+    except OSError:
+        # Filesystem without hardlinks (or objects dir on another mount)
+        tmp_link.unlink(missing_ok=True)
+        _write_bytes_atomic(cache_path, data)
 
     logger.info(f"Saved cache: {cache_filename}")
     return cache_path
@@ -184,27 +316,24 @@ def find_existing_raw_file(file_hash: str, source_type: str | None = None) -> Pa
     """
     hash_prefix = file_hash[:8]
 
-    # If source_type is specified, search for that specific pattern
     if source_type:
-        # Look for files with pattern: *_{source_type}_{hash}.*
-        for file_path in RAW_DATA_DIR.glob(f"*_{source_type}_{hash_prefix}.*"):
-            return file_path
-
-        # Check old naming pattern for backwards compatibility (excel only)
+        # Old naming without a source segment is excel-only (indexed under None)
+        candidates = [(source_type, hash_prefix)]
         if source_type == "excel":
-            for file_path in RAW_DATA_DIR.glob(f"*_{hash_prefix}.*"):
-                # Skip bigquery and json files
-                if "_bigquery_" not in file_path.name and "_json_" not in file_path.name:
-                    return file_path
+            candidates.append((None, hash_prefix))
     else:
-        # Search across all source types
-        for source in ["bigquery", "excel", "json"]:
-            for file_path in RAW_DATA_DIR.glob(f"*_{source}_{hash_prefix}.*"):
+        candidates = [(source, hash_prefix) for source in ("bigquery", "excel", "json")]
+        candidates.append((None, hash_prefix))
+
+    with _RAW_INDEX_LOCK:
+        for key in candidates:
+            file_path = _RAW_INDEX.get(key)
+            if file_path is None:
+                continue
+            if file_path.exists():
                 return file_path
-
-        # Check old naming pattern for backwards compatibility
-        for file_path in RAW_DATA_DIR.glob(f"*_{hash_prefix}.*"):
-            return file_path
+            # Dropped out from under us (manual cleanup); forget the stale entry
+            del _RAW_INDEX[key]
 
     return None
 
@@ -241,6 +370,8 @@ def save_raw_file(file_content: bytes, kommune_name: str, original_filename: str
     file_path = RAW_DATA_DIR / filename
     with open(file_path, "wb") as f:
         f.write(file_content)
+    with _RAW_INDEX_LOCK:
+        _index_raw_file(file_path)
 
     logger.info(f"Saved new Excel file: {filename}")
     return file_path, True
@@ -295,6 +426,14 @@ def _resolve_kartverket_cache_dir(source: str) -> Path:
     return KARTVERKET_CACHE_DIR
 
 
+def kartverket_cache_frame_path(file_hash: str, kommune_name: str, view: str, source: str = "raw") -> Path:
+    """Return the Feather sidecar path for one cached Kartverket view."""
+    cache_dir = _resolve_kartverket_cache_dir(source)
+    hash_prefix = file_hash[:8]
+    stem = f"{kommune_name}_{hash_prefix}" if kommune_name else f"unknown_{hash_prefix}"
+    return cache_dir / f"{stem}_{view}.feather"
+
+
 def get_kartverket_cached_result(file_hash: str, kommune_name: str, source: str = "raw") -> dict | None:
     """Check if a Kartverket processed result exists in cache."""
     cache_dir = _resolve_kartverket_cache_dir(source)
@@ -1,15 +1,22 @@
 """Shared DataFrame helpers used across services and routers."""
 from __future__ import annotations
 
-import math
 import re
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from app.core.columns import Col
 
+# Matches "Name [Industry, Code]" Underenheter entries; compiled once since
+# the parser runs inside per-row loops.
+_UNDERENHET_ENTRY_RE = re.compile(r"^(.+?)\s*\[(.+),\s*(\d+(?:\.\d+)?)\]$")
+
+# Lowercased string renderings of missing values, shared by the per-row parsers.
+_NAN_MARKERS = frozenset({"nan", "<na>"})
+
 
 def extract_kommune_name(filename: str) -> str:
     """Extract kommune name from filename.
@@ -69,21 +76,28 @@ def df_to_json_safe(df: pd.DataFrame) -> list[dict[str, Any]]:
     Returns:
         List of dictionaries with proper JSON-safe values
     """
-    df = df.fillna(value=pd.NA)
-    result_dict = df.to_dict(orient="records")
-
-    for row in result_dict:
-        for key, value in row.items():
-            if isinstance(value, (list, dict)):
-                continue
-            if isinstance(value, float) and not math.isfinite(value):
-                row[key] = None
-            elif pd.isna(value):
-                row[key] = None
-            elif isinstance(value, float) and value.is_integer():
-                row[key] = int(value)
-
-    return result_dict
+    df = df.copy()
+
+    # Columnar passes over float columns instead of a per-cell Python loop:
+    # mask non-finite values and downcast integer-valued columns to Int64.
+    for col_name in df.select_dtypes(include=[np.floating]).columns:
+        values = df[col_name].to_numpy()
+        finite = np.isfinite(values)
+        finite_values = values[finite]
+        if (
+            finite_values.size
+            and np.all(finite_values == np.floor(finite_values))
+            and np.all(np.abs(finite_values) < np.iinfo(np.int64).max)
+        ):
+            integers = np.where(finite, values, 0).astype(np.int64)
+            df[col_name] = pd.Series(integers, index=df.index, dtype="Int64").mask(~finite)
+        elif not finite.all():
+            df[col_name] = df[col_name].mask(~finite)
+
+    # One pass to replace every remaining NA with None; to_dict boxes numpy
+    # scalars back to native Python types.
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict(orient="records")
 
 
 def deduplicate_by_flag(df: pd.DataFrame) -> pd.DataFrame:
@@ -121,15 +135,17 @@ def _parse_underenheter_entries(value: str, address: str | None) -> list[dict[st
     value_str = str(value).strip()
     if value_str == "" or value_str == "-":
         return []
-    if value_str.lower() in {"nan", "<na>"}:
+    if value_str.lower() in _NAN_MARKERS:
         return []
 
     entries: list[dict[str, Any]] = []
-    parts = [part.strip() for part in str(value).split(";") if part.strip()]
-    pattern = re.compile(r"^(.+?)\s*\[(.+),\s*(\d+(?:\.\d+)?)\]$")
+    if ";" in value_str:
+        parts = [part.strip() for part in value_str.split(";") if part.strip()]
+    else:
+        parts = [value_str]
 
     for part in parts:
-        match = pattern.match(part)
+        match = _UNDERENHET_ENTRY_RE.match(part)
         if match:
             name, industry, code = match.groups()
             entries.append({
@@ -149,32 +165,48 @@ def _parse_underenheter_entries(value: str, address: str | None) -> list[dict[st
     return entries
 
 
+def _format_underenheter_entries(entries: list[dict[str, Any]]) -> str:
+    """Render parsed Underenheter entries back into the 'Name [Industry, Code]' form."""
+    return "; ".join(
+        f"{entry['name']} [{entry['industry']}, {entry['code']}]"
+        if entry.get("industry") and entry.get("code")
+        else entry.get("name", "")
+        for entry in entries
+    )
+
+
 def merge_underenheter_by_group(df: pd.DataFrame) -> pd.DataFrame:
     """Merge Underenheter across duplicate groups and filter Duplicate rows."""
     if Col.DUPLIKAT_FLAGG not in df.columns or Col.DUPLIKAT_GRUPPE not in df.columns:
         return df
 
-    grouped: dict[str, list[dict[str, Any]]] = {}
-    for _, row in df.iterrows():
-        group_value = row.get(Col.DUPLIKAT_GRUPPE)
-        group_value_str = "" if group_value is None else str(group_value).strip()
-        if group_value is None or pd.isna(group_value) or group_value_str == "" or group_value_str.lower() == "nan":
-            continue
-        key = group_value_str
-        grouped.setdefault(key, []).append(row.to_dict())
+    group_str = df[Col.DUPLIKAT_GRUPPE].astype("string").str.strip()
+    valid_group = group_str.notna() & (group_str != "") & (group_str.str.lower() != "nan")
+
+    # Parse each grouped row's Underenheter exactly once; the old version
+    # walked the whole frame twice with iterrows, boxing every cell.
+    if Col.UNDERENHETER in df.columns:
+        underenheter_values = df.loc[valid_group, Col.UNDERENHETER]
+    else:
+        underenheter_values = pd.Series("", index=df.index[valid_group])
+    if Col.ADRESSE in df.columns:
+        adresse_values = df.loc[valid_group, Col.ADRESSE]
+    else:
+        adresse_values = pd.Series(None, index=df.index[valid_group], dtype=object)
+
+    entries_by_group: dict[str, list[dict[str, Any]]] = {}
+    for group_key, value, addr_value in zip(group_str[valid_group], underenheter_values, adresse_values):
+        if addr_value is None or pd.isna(addr_value):
+            row_address = None
+        else:
+            addr_str = str(addr_value).strip()
+            row_address = None if addr_str.lower() in _NAN_MARKERS or addr_str == "" else addr_str
+        entries_by_group.setdefault(group_key, []).extend(
+            _parse_underenheter_entries(value, row_address)
+        )
 
     merged_by_group: dict[str, list[dict[str, Any]]] = {}
-    for group_key, rows in grouped.items():
-        all_entries: list[dict[str, Any]] = []
-        for row in rows:
-            addr_value = row.get(Col.ADRESSE)
-            if addr_value is None or pd.isna(addr_value):
-                row_address = None
-            else:
-                addr_str = str(addr_value).strip()
-                row_address = None if addr_str.lower() in {"nan", "<na>"} or addr_str == "" else addr_str
-            all_entries.extend(_parse_underenheter_entries(row.get(Col.UNDERENHETER, ""), row_address))
-
+    for group_key, all_entries in entries_by_group.items():
         seen_names = set()
         unique_entries: list[dict[str, Any]] = []
         for entry in all_entries:
@@ -183,40 +215,25 @@ def merge_underenheter_by_group(df: pd.DataFrame) -> pd.DataFrame:
                 continue
             seen_names.add(name)
             unique_entries.append(entry)
-
         merged_by_group[group_key] = unique_entries
 
-    result_rows: list[dict[str, Any]] = []
-    for _, row in df.iterrows():
-        duplicate_flag = row.get(Col.DUPLIKAT_FLAGG)
-        if duplicate_flag is not None and not pd.isna(duplicate_flag):
-            flag_str = str(duplicate_flag).strip()
-            if flag_str and flag_str.lower() != "nan" and "duplicate" in flag_str.lower():
-                continue
-
-        group_value = row.get(Col.DUPLIKAT_GRUPPE)
-        group_value_str = "" if group_value is None else str(group_value).strip()
-        if group_value is None or pd.isna(group_value) or group_value_str == "" or group_value_str.lower() == "nan":
-            result_rows.append(row.to_dict())
-            continue
-
-        group_key = group_value_str
-        merged_entries = merged_by_group.get(group_key, [])
-        if not merged_entries:
-            result_rows.append(row.to_dict())
-            continue
-
-        underenheter_value = "; ".join([
-            f"{entry['name']} [{entry['industry']}, {entry['code']}]"
-            if entry.get("industry") and entry.get("code")
-            else entry.get("name", "")
-            for entry in merged_entries
-        ])
-
-        updated = row.to_dict()
-        updated[Col.UNDERENHETER] = underenheter_value
-        updated[Col.ANTALL_UNDERENHETER] = len(merged_entries)
-        updated["_parsedUnderenheter"] = merged_entries
-        result_rows.append(updated)
-
-    return pd.DataFrame(result_rows)
+    # Render the merged string and count once per group, not once per member row
+    merged_str_by_group = {
+        key: _format_underenheter_entries(entries)
+        for key, entries in merged_by_group.items()
+        if entries
+    }
+    merged_count_by_group = {key: len(merged_by_group[key]) for key in merged_str_by_group}
+
+    dup_mask = df[Col.DUPLIKAT_FLAGG].astype("string").str.contains("duplicate", case=False, na=False)
+    result = df.loc[~dup_mask].copy()
+
+    kept_groups = group_str[~dup_mask]
+    merged_strs = kept_groups.map(merged_str_by_group)
+    has_merge = merged_strs.notna()
+    if has_merge.any():
+        result.loc[has_merge, Col.UNDERENHETER] = merged_strs[has_merge]
+        result.loc[has_merge, Col.ANTALL_UNDERENHETER] = kept_groups[has_merge].map(merged_count_by_group)
+        result["_parsedUnderenheter"] = kept_groups.map(merged_by_group).where(has_merge)
+
+    return result
@@ -1,122 +1,96 @@
 import urllib.parse
-from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
 from app.core.columns import Col
 
-
-def _normalize_str(value: Any) -> str:
-    """Normalize a value to a trimmed string or empty string."""
-    if value is None or pd.isna(value):
-        return ""
-    return str(value).strip()
-
-
-def _format_postcode(value: Any) -> str:
-    """Format a postcode value into a clean string."""
-    if value is None or pd.isna(value):
-        return ""
-    try:
-        return str(int(float(value)))
-    except (TypeError, ValueError):
-        return _normalize_str(value)
-
-
-def _format_house_number(value: Any) -> str:
-    """Format a house number value into a clean string."""
-    if value is None or pd.isna(value):
-        return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value))
-    return _normalize_str(value)
-
-
-def _build_google_maps_link(parts: list[str]) -> str:
-    """Build a Google Maps search URL from address parts."""
-    if not parts:
-        return ""
-    query = " ".join(parts)
-    return f"https://www.google.com/maps/search/?api=1&query={urllib.parse.quote(query)}"
-
-
-def build_user_maps_link(row: pd.Series) -> str:
-    """Build a Google Maps link from user-uploaded address fields.
-
-    Args:
-        row: Data row containing Street, Postcode, and City.
-
-    Returns:
-        Google Maps search URL string.
-    """
-    parts: list[str] = []
-
-    street = _normalize_str(row.get(Col.STREET))
-    if street:
-        parts.append(street)
-
-    postcode = _format_postcode(row.get(Col.POSTCODE))
-    if postcode:
-        parts.append(postcode)
-
-    city = _normalize_str(row.get(Col.CITY))
-    if city:
-        parts.append(city)
-
-    return _build_google_maps_link(parts)
-
-
-def build_kartverket_maps_link(row: pd.Series) -> str:
-    """Build a Google Maps link from Kartverket address fields.
-
-    Args:
-        row: Data row containing Adresse or Adressenavn/Nummer, Postnummer, Poststed.
-
-    Returns:
-        Google Maps search URL string.
-    """
-    parts: list[str] = []
-
-    adresse = _normalize_str(row.get(Col.ADRESSE))
-    if adresse:
-        parts.append(adresse)
-    else:
-        adressenavn = _normalize_str(row.get(Col.ADRESSENAVN))
-        nummer = _format_house_number(row.get(Col.NUMMER))
-        if adressenavn or nummer:
-            parts.append(f"{adressenavn} {nummer}".strip())
-
-    postnummer = _format_postcode(row.get(Col.POSTNUMMER))
-    if postnummer:
-        parts.append(postnummer)
-
-    poststed = _normalize_str(row.get(Col.POSTSTED))
-    if poststed:
-        parts.append(poststed)
-
-    return _build_google_maps_link(parts)
-
-
-def _add_google_maps_link(df: pd.DataFrame, builder: Callable[[pd.Series], str]) -> pd.DataFrame:
-    """Return a copy of the dataframe with GoogleMapsLink column populated.
-
-    Args:
-        df: Source dataframe.
-        builder: Function that builds a maps URL per row.
-
-    Returns:
-        Dataframe copy with Col.GOOGLE_MAPS_LINK set.
-    """
-    df = df.copy()
-    df[Col.GOOGLE_MAPS_LINK] = df.apply(builder, axis=1)
-    return df
+_MAPS_URL_PREFIX = "https://www.google.com/maps/search/?api=1&query="
+
+
+def _text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Return a column as a trimmed string Series, empty where missing or NA."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype="string")
+    return df[col].astype("string").str.strip().fillna("")
+
+
+def _postcode_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Return postcodes as clean strings, rendering numeric values without decimals."""
+    text = _text_column(df, col)
+    if col not in df.columns:
+        return text
+    numeric = pd.to_numeric(df[col], errors="coerce")
+    is_numeric = numeric.notna().to_numpy()
+    if not is_numeric.any():
+        return text
+    out = text.to_numpy(dtype=object)
+    out[is_numeric] = np.trunc(numeric.to_numpy(dtype="float64")[is_numeric]).astype(np.int64).astype(str)
+    return pd.Series(out, index=df.index, dtype="string")
+
+
+def _house_number_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Return house numbers as clean strings, dropping the '.0' on integral floats."""
+    text = _text_column(df, col)
+    if col not in df.columns:
+        return text
+    # Detect numerics per element rather than by column dtype: lettered house
+    # numbers like "5B" force an object dtype, and the floats mixed into it
+    # must still render without the trailing '.0'.
+    values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64")
+    finite = np.isfinite(values)
+    integral = finite & (values == np.floor(values))
+    if not integral.any():
+        return text
+    out = text.to_numpy(dtype=object)
+    out[integral] = values[integral].astype(np.int64).astype(str)
+    return pd.Series(out, index=df.index, dtype="string")
+
+
+def _join_nonempty(parts: list[pd.Series]) -> pd.Series:
+    """Join string Series with single spaces, skipping empty parts per row."""
+    query = parts[0]
+    for part in parts[1:]:
+        sep = pd.Series(" ", index=query.index, dtype="string").where(
+            (query != "") & (part != ""), ""
+        )
+        query = query + sep + part
+    return query
+
+
+def _link_column(query: pd.Series) -> pd.Series:
+    """Turn query strings into Google Maps search URLs, empty where no query."""
+    links = query.map(lambda q: f"{_MAPS_URL_PREFIX}{urllib.parse.quote(q)}" if q else "")
+    return links.astype(object)
 
 
 def add_google_maps_link_for_user(df: pd.DataFrame) -> pd.DataFrame:
     """Add Google Maps links using user-uploaded address columns."""
-    return _add_google_maps_link(df, build_user_maps_link)
+    df = df.copy()
+    query = _join_nonempty([
+        _text_column(df, Col.STREET),
+        _postcode_column(df, Col.POSTCODE),
+        _text_column(df, Col.CITY),
+    ])
+    df[Col.GOOGLE_MAPS_LINK] = _link_column(query)
+    return df
 
 
 def add_google_maps_link_for_kartverket(df: pd.DataFrame) -> pd.DataFrame:
     """Add Google Maps links using Kartverket address columns."""
-    return _add_google_maps_link(df, build_kartverket_maps_link)
+    df = df.copy()
+    adresse = _text_column(df, Col.ADRESSE)
+    street = adresse.where(
+        adresse != "",
+        _join_nonempty([
+            _text_column(df, Col.ADRESSENAVN),
+            _house_number_column(df, Col.NUMMER),
+        ]),
+    )
+    query = _join_nonempty([
+        street,
+        _postcode_column(df, Col.POSTNUMMER),
+        _text_column(df, Col.POSTSTED),
+    ])
+    df[Col.GOOGLE_MAPS_LINK] = _link_column(query)
+    return df
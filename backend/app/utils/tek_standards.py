@@ -13,9 +13,14 @@ Reference:
     https://dibk.no/regelverk/liste-over-tidligere-regelverk/
 """
 
+import functools
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date
+from types import MappingProxyType
+from typing import Mapping
 
+import numpy as np
 import pandas as pd
 
 from app.core.columns import Col
@@ -51,8 +56,22 @@ TEK_STANDARDS: list[TEKStandard] = [
 # Fallback for buildings before first standard
 PRE_1949 = TEKStandard("Pre-1949", date(1, 1, 1), "Før 1949", "Før 1949")
 
-# Empty result for missing/invalid dates
-EMPTY_TEK_INFO: dict[str, str] = {"standard": "", "in_force": "", "period": ""}
+# Empty result for missing/invalid dates; frozen so cached results can be
+# shared between callers safely.
+EMPTY_TEK_INFO: Mapping[str, str] = MappingProxyType({"standard": "", "in_force": "", "period": ""})
+
+# Ascending in-force ordinals for binary search; index i in _STANDARDS_ASC
+# corresponds to cutoff i, so bisect_right - 1 yields the applicable standard.
+_STANDARDS_ASC: list[TEKStandard] = list(reversed(TEK_STANDARDS))
+_CUTOFF_ORDINALS: list[int] = [tek.in_force_date.toordinal() for tek in _STANDARDS_ASC]
+
+# Gather tables for the vectorized column path: searchsorted bucket 0 means
+# the date predates BF49, bucket i+1 maps to _STANDARDS_ASC[i].
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_CUTOFF_ORDINAL_ARR = np.array(_CUTOFF_ORDINALS, dtype=np.int64)
+_TEK_NAME_ARR = np.array([PRE_1949.name] + [tek.name for tek in _STANDARDS_ASC], dtype=object)
+_TEK_IN_FORCE_ARR = np.array([PRE_1949.in_force_str] + [tek.in_force_str for tek in _STANDARDS_ASC], dtype=object)
+_TEK_PERIOD_ARR = np.array([PRE_1949.period_str] + [tek.period_str for tek in _STANDARDS_ASC], dtype=object)
 
 
 # =============================================================================
@@ -60,7 +79,26 @@ EMPTY_TEK_INFO: dict[str, str] = {"standard": "", "in_force": "", "period": ""}
 # =============================================================================
 
 
-def get_tek_info(status_date: str | date | None) -> dict[str, str]:
+@functools.lru_cache(maxsize=8192)
+def _tek_info_cached(date_key: str) -> Mapping[str, str]:
+    """Resolve a normalized date string to its frozen TEK info mapping."""
+    try:
+        # Handle ISO format YYYY-MM-DD
+        parsed_date = date.fromisoformat(date_key[:10])
+    except (ValueError, TypeError):
+        return EMPTY_TEK_INFO
+
+    # Binary search for the last standard with in_force_date <= parsed_date
+    idx = bisect_right(_CUTOFF_ORDINALS, parsed_date.toordinal()) - 1
+    tek = _STANDARDS_ASC[idx] if idx >= 0 else PRE_1949
+    return MappingProxyType({
+        "standard": tek.name,
+        "in_force": tek.in_force_str,
+        "period": tek.period_str,
+    })
+
+
+def get_tek_info(status_date: str | date | None) -> Mapping[str, str]:
     """
     Get the TEK standard info for a building based on its earliest status date.
 
@@ -72,8 +110,10 @@ def get_tek_info(status_date: str | date | None) -> dict[str, str]:
                      Can be ISO date string (YYYY-MM-DD), date object, or None.
 
     Returns:
-        Dict with keys: "standard", "in_force", "period".
+        Read-only mapping with keys: "standard", "in_force", "period".
         Returns empty strings for all keys if date is None or invalid.
+        Results are memoized per date, since uploads repeat the same
+        registration dates across many buildings.
 
     Example:
         >>> get_tek_info("2015-03-12")
@@ -84,37 +124,18 @@ def get_tek_info(status_date: str | date | None) -> dict[str, str]:
         {'standard': '', 'in_force': '', 'period': ''}
     """
     if status_date is None:
-        return EMPTY_TEK_INFO.copy()
+        return EMPTY_TEK_INFO
 
-    # Parse date if string
     if isinstance(status_date, str):
-        if not status_date.strip():
-            return EMPTY_TEK_INFO.copy()
-        try:
-            # Handle ISO format YYYY-MM-DD
-            parsed_date = date.fromisoformat(status_date[:10])
-        except (ValueError, TypeError):
-            return EMPTY_TEK_INFO.copy()
+        date_key = status_date.strip()
+        if not date_key:
+            return EMPTY_TEK_INFO
     elif isinstance(status_date, date):
-        parsed_date = status_date
+        date_key = status_date.isoformat()
     else:
-        return EMPTY_TEK_INFO.copy()
-
-    # Find the applicable standard (first standard with in_force_date <= parsed_date)
-    for tek in TEK_STANDARDS:
-        if parsed_date >= tek.in_force_date:
-            return {
-                "standard": tek.name,
-                "in_force": tek.in_force_str,
-                "period": tek.period_str,
-            }
+        return EMPTY_TEK_INFO
 
-    # Building predates first standard (BF49)
-    return {
-        "standard": PRE_1949.name,
-        "in_force": PRE_1949.in_force_str,
-        "period": PRE_1949.period_str,
-    }
+    return _tek_info_cached(date_key)
 
 
 def get_tek_standard(status_date: str | date | None) -> str:
@@ -159,10 +180,33 @@ def add_tek_standard_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     df = df.copy()
 
-    # Apply get_tek_info to each row and expand to columns
-    tek_info = df[Col.TIDLIGSTE_STATUS_DATO].apply(get_tek_info)
-    df[Col.TEK_STANDARD] = tek_info.apply(lambda x: x["standard"])
-    df[Col.TEK_IKRAFTTREDELSE] = tek_info.apply(lambda x: x["in_force"])
-    df[Col.TEK_PERIODE] = tek_info.apply(lambda x: x["period"])
+    # Classify every date in C: parse once, bucket against the cutoff ordinals
+    # with searchsorted, then gather the three output columns from the tables.
+    raw = df[Col.TIDLIGSTE_STATUS_DATO]
+    dates = pd.to_datetime(raw, errors="coerce")
+    days = dates.to_numpy(dtype="datetime64[D]")
+    valid = ~np.isnat(days)
+    ordinals = days.astype(np.int64) + _EPOCH_ORDINAL
+    idx = np.searchsorted(_CUTOFF_ORDINAL_ARR, ordinals, side="right")
+    idx[~valid] = 0
+    standard = np.where(valid, _TEK_NAME_ARR[idx], "")
+    in_force = np.where(valid, _TEK_IN_FORCE_ARR[idx], "")
+    period = np.where(valid, _TEK_PERIOD_ARR[idx], "")
+
+    # Valid dates outside pandas' nanosecond range (pre-1677) coerce to NaT
+    # above; classify the leftover non-null values through the scalar path so
+    # the column API agrees with get_tek_info (e.g. 1650 -> Pre-1949).
+    unparsed = ~valid & raw.notna().to_numpy()
+    for pos in np.flatnonzero(unparsed):
+        info = get_tek_info(raw.iat[pos])
+        if info is EMPTY_TEK_INFO:
+            continue
+        standard[pos] = info["standard"]
+        in_force[pos] = info["in_force"]
+        period[pos] = info["period"]
+
+    df[Col.TEK_STANDARD] = standard
+    df[Col.TEK_IKRAFTTREDELSE] = in_force
+    df[Col.TEK_PERIODE] = period
 
     return df
@@ -9,19 +9,29 @@ and rebuilds `main.properties` from scratch.
 from __future__ import annotations
 
 import argparse
+import itertools
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import duckdb
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ModuleNotFoundError:  # pragma: no cover - pyarrow is in requirements
+    pa = None
+
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.core.columns import Col
-from app.modules.kartverket.service import build_kartverket_dataset  # type: ignore
+from app.db.duckdb_service import KOMMUNE_NORM_COLUMN, NORMALIZED_KOMMUNE_TEMPLATE
+from app.modules.kartverket.service import build_kartverket_dataset, flush_cache_writes  # type: ignore
 
 
 def _project_roots() -> Path:
@@ -48,11 +58,17 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# Matches `1234_Kommune_Name_Properties*` stems; compiled once since the
+# extractor runs per file.
+_KOMMUNE_RE = re.compile(r"^\d{4}_(.+?)_Properties(?:_Imputed)?$", re.IGNORECASE)
+
+
 def _extract_kommune_name(file_path: Path) -> str:
     """Extract kommune name from `1234_Kommune_Name_Properties*.xlsx`."""
-    match = re.match(r"^\d{4}_(.+?)_Properties(?:_Imputed)?$", file_path.stem, flags=re.IGNORECASE)
+    stem = file_path.stem
+    match = _KOMMUNE_RE.match(stem)
     if not match:
-        return file_path.stem.replace("_", " ").strip()
+        return stem.replace("_", " ").strip()
     kommune_raw = match.group(1).split("___", 1)[0]
     return kommune_raw.replace("_", " ").strip()
 
@@ -67,70 +83,158 @@ def _format_kommune_label(kommune_name: str) -> str:
     return f"{name} Kommune"
 
 
-def _load_frames(
-    source_dir: Path,
-) -> tuple[pd.DataFrame, list[tuple[str, int, int, int]]]:
-    """Read filtered/deduplicated Kartverket frames from copied Proactive pipeline."""
-    excel_files = sorted(source_dir.glob("*_Properties*.xlsx"))
-    frames: list[pd.DataFrame] = []
-    processed_sources: list[tuple[str, int, int, int]] = []
-    loaded_files: set[Path] = set()
-
-    for file_path in excel_files:
-        if file_path.name.startswith("~$"):
+def _iter_excel_files(source_dir: Path):
+    """Yield candidate Kartverket workbooks from one scandir pass."""
+    for entry in os.scandir(source_dir):
+        name = entry.name
+        if name.startswith("~$") or not name.endswith(".xlsx"):
             continue
-
-        kommune_name_raw = _extract_kommune_name(file_path)
-        dataset = build_kartverket_dataset(kommune_name=kommune_name_raw, source_dir=source_dir)
-        if dataset is None:
+        if "_Properties" not in name:
             continue
-
-        resolved_file = dataset.file_path.resolve()
-        if resolved_file in loaded_files:
-            continue
-        loaded_files.add(resolved_file)
-
-        df = dataset.data_dedup_df.copy()
-        kommune_name = _format_kommune_label(kommune_name_raw)
-        source = f"kartverket:{dataset.file_path.name}"
-
-        alt_flag_col = Col.ALT_ADRESSER_FRA_KNR_GNR_BNR
-        alt_filled_count = int(df[alt_flag_col].fillna(False).astype(bool).sum()) if alt_flag_col in df.columns else 0
-        removed_count = int(len(dataset.data_df) - len(dataset.data_dedup_df))
-
-        df.insert(0, "source", source)
-        df.insert(0, "kommune", kommune_name)
-        frames.append(df)
-        processed_sources.append((source, len(df), removed_count, alt_filled_count))
-
-    if not frames:
-        return pd.DataFrame(columns=["kommune", "source"]), processed_sources
-    return pd.concat(frames, ignore_index=True), processed_sources
-
-
-def _rebuild_properties_table(conn: duckdb.DuckDBPyConnection, df: pd.DataFrame) -> None:
-    """Replace `main.properties` with fresh data and zero-based IDs."""
-    conn.execute("DROP TABLE IF EXISTS main.properties")
-    conn.execute("DROP SEQUENCE IF EXISTS properties_id_seq")
-    conn.execute("CREATE SEQUENCE properties_id_seq MINVALUE 0 START 0")
-
-    conn.register("staging_properties", df)
-    try:
+        yield Path(entry.path)
+
+
+def _constant_column(value: str, length: int) -> pd.Categorical:
+    """Build a single-value column as a categorical: one dictionary entry plus
+    small integer codes instead of a full-length string column."""
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+
+def _process_one(file_path: Path, source_dir: Path) -> tuple[pd.DataFrame, str, str, int, int] | None:
+    """Build one file's deduplicated, metadata-tagged frame (worker process)."""
+    kommune_name_raw = _extract_kommune_name(file_path)
+    dataset = build_kartverket_dataset(kommune_name=kommune_name_raw, source_dir=source_dir)
+    if dataset is None:
+        return None
+
+    # The dedup view is built fresh for this dataset and the dataset is
+    # dropped when the worker returns, so tag it in place instead of copying.
+    df = dataset.data_dedup_df
+    kommune_name = _format_kommune_label(kommune_name_raw)
+    source = f"kartverket:{dataset.file_path.name}"
+
+    alt_flag_col = Col.ALT_ADRESSER_FRA_KNR_GNR_BNR
+    alt_filled_count = (
+        int(df[alt_flag_col].to_numpy(dtype=bool, na_value=False).sum())
+        if alt_flag_col in df.columns
+        else 0
+    )
+    removed_count = int(len(dataset.data_df) - len(dataset.data_dedup_df))
+    file_name = dataset.file_path.name
+    # Drop the dataset (and its pre-dedup data_df) before pickling the result
+    # so the worker holds only the deduplicated frame while it serializes.
+    del dataset
+    # Pool workers die via os._exit, skipping the service's atexit flush;
+    # wait for the background cache persist here so it is never cut short.
+    flush_cache_writes()
+
+    # Append at the end of the frame -- inserting at position 0 shifts every
+    # existing block twice; the rebuild SELECT fixes the final column order.
+    df["kommune"] = _constant_column(kommune_name, len(df))
+    df["source"] = _constant_column(source, len(df))
+    # Filenames are unique within source_dir, so the name is enough for the
+    # parent's duplicate check -- no resolve() stat chain per file.
+    return df, file_name, source, removed_count, alt_filled_count
+
+
+def _staging_relation(df: pd.DataFrame) -> pd.DataFrame | pa.Table:
+    """Prefer a zero-copy Arrow view of a frame for DuckDB registration."""
+    if pa is not None:
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Columns Arrow cannot type (mixed objects) keep the pandas path
+            pass
+    return df
+
+
+def _rebuild_properties_table(
+    conn: duckdb.DuckDBPyConnection, source_dir: Path
+) -> tuple[list[tuple[str, int, int, int]], int]:
+    """Rebuild `main.properties` by streaming per-file frames into DuckDB.
+
+    Frames are built in parallel worker processes and inserted one at a time,
+    so peak memory stays around one file's frame rather than the whole load.
+    Returns the per-source report tuples and the total inserted row count.
+    """
+    excel_files = sorted(_iter_excel_files(source_dir))
+    processed_sources: list[tuple[str, int, int, int]] = []
+    loaded_names: set[str] = set()
+    table_columns: set[str] = set()
+    offset = 0
+    if not excel_files:
+        return processed_sources, offset
+
+    kommune_norm_expr = NORMALIZED_KOMMUNE_TEMPLATE.format(column="kommune")
+    # {offset} is an int under the loader's control, never user input.
+    select_sql = f"""
+        SELECT
+          row_number() OVER () - 1 + {{offset}} AS id,
+          kommune,
+          {kommune_norm_expr} AS {KOMMUNE_NORM_COLUMN},
+          source,
+          s.* EXCLUDE (kommune, source)
+        FROM staging_properties s
+    """
+
+    # Each file parses independently and is CPU-bound on the Excel read,
+    # so fan the builds out across processes; dedup stays in the parent.
+    max_workers = min(len(excel_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for result in pool.map(_process_one, excel_files, itertools.repeat(source_dir)):
+            if result is None:
+                continue
+            df, file_name, source, removed_count, alt_filled_count = result
+            if file_name in loaded_names:
+                continue
+            loaded_names.add(file_name)
+
+            conn.register("staging_properties", _staging_relation(df))
+            try:
+                if offset == 0:
+                    # First batch replaces the old table and fixes the schema.
+                    conn.execute("DROP TABLE IF EXISTS main.properties")
+                    # Drop stale dashboard rollups; the MCP server rebuilds
+                    # them on startup.
+                    conn.execute("DROP TABLE IF EXISTS main.properties_rollup")
+                    # Clean up the id sequence from older builds.
+                    conn.execute("DROP SEQUENCE IF EXISTS properties_id_seq")
+                    conn.execute(f"CREATE TABLE main.properties AS {select_sql.format(offset=0)}")
+                    table_columns = {
+                        row[0] for row in conn.execute("DESCRIBE main.properties").fetchall()
+                    }
+                else:
+                    # Schema drift goes both ways across kommune exports: BY
+                    # NAME NULL-fills columns a later file lacks, and columns
+                    # the table has not seen yet are added here first (earlier
+                    # rows read NULL for them), matching the old concat union.
+                    for column_name, column_type, *_ in conn.execute(
+                        "DESCRIBE staging_properties"
+                    ).fetchall():
+                        if column_name in table_columns:
+                            continue
+                        conn.execute(
+                            f'ALTER TABLE main.properties ADD COLUMN "{column_name}" {column_type}'
+                        )
+                        table_columns.add(column_name)
+                    conn.execute(
+                        f"INSERT INTO main.properties BY NAME {select_sql.format(offset=offset)}"
+                    )
+            finally:
+                conn.unregister("staging_properties")
+
+            offset += len(df)
+            processed_sources.append((source, len(df), removed_count, alt_filled_count))
+
+    if offset:
+        # Keep hard uniqueness on id even when CTAS is used.
+        conn.execute("CREATE UNIQUE INDEX idx_properties_id_unique ON main.properties (id)")
+        # Materialized normalized kommune keeps dashboard filters on an
+        # indexed column.
         conn.execute(
-            """
-            CREATE TABLE main.properties AS
-            SELECT
-              nextval('properties_id_seq')::BIGINT AS id,
-              kommune,
-              s.* EXCLUDE (kommune)
-            FROM staging_properties s
-            """
+            f"CREATE INDEX idx_properties_{KOMMUNE_NORM_COLUMN} ON main.properties ({KOMMUNE_NORM_COLUMN})"
         )
-    finally:
-        conn.unregister("staging_properties")
-
-    # Keep hard uniqueness on id even when CTAS is used.
-    conn.execute("CREATE UNIQUE INDEX idx_properties_id_unique ON main.properties (id)")
+    return processed_sources, offset
 
 
 def main() -> int:
@@ -143,25 +247,27 @@ def main() -> int:
         print(f"Source directory does not exist: {source_dir}")
         return 1
 
-    df, processed_sources = _load_frames(source_dir=source_dir)
-    if not processed_sources:
-        print(f"No Kartverket files found in {source_dir}")
-        return 0
-
     duckdb_path.parent.mkdir(parents=True, exist_ok=True)
     conn = duckdb.connect(str(duckdb_path))
     try:
-        _rebuild_properties_table(conn=conn, df=df)
+        conn.execute(f"PRAGMA threads={os.cpu_count() or 1}")
+        # Row ids are explicit in the inserts, so DuckDB is free to write
+        # row groups in parallel without keeping scan order.
+        conn.execute("PRAGMA preserve_insertion_order=false")
+        processed_sources, inserted_total = _rebuild_properties_table(conn=conn, source_dir=source_dir)
+        if not processed_sources:
+            print(f"No Kartverket files found in {source_dir}")
+            return 0
         total_rows = conn.execute("SELECT COUNT(*) FROM main.properties").fetchone()[0]
     finally:
         conn.close()
 
-    inserted_total = len(df)
-    for source, count, removed_count, alt_filled_count in processed_sources:
-        print(
-            f"Loaded {count} rows from {source} "
-            f"(removed duplicates: {removed_count}, alt-address backfilled: {alt_filled_count})"
-        )
+    report = "\n".join(
+        f"Loaded {count} rows from {source} "
+        f"(removed duplicates: {removed_count}, alt-address backfilled: {alt_filled_count})"
+        for source, count, removed_count, alt_filled_count in processed_sources
+    )
+    sys.stdout.write(f"{report}\n")
     print(f"\nInserted rows this run: {inserted_total}")
     print(f"Total rows currently in properties: {total_rows}")
     print(f"DuckDB path: {duckdb_path}")